@@ -18,6 +18,7 @@ from typing import Any
 from wiz.bridge.client import BridgeClient
 from wiz.bridge.monitor import BridgeEventMonitor
 from wiz.bridge.types import SessionResult
+from wiz.coordination._json_cache import cache as github_cache
 
 logger = logging.getLogger(__name__)
 
@@ -143,10 +144,17 @@ class SessionRunner:
         For Claude: uses bridge (REST + WebSocket hooks) for session management.
         For Codex: runs `codex exec` directly as a subprocess (codex has no
         hook system, so the bridge can't detect completion).
+
+        The agent edits issues and PRs through its own gh process, which
+        this process can't see, so cached GitHub reads are dropped once the
+        session ends.
         """
-        if agent == "codex":
-            return self._run_codex_exec(name, cwd, prompt, model, timeout)
-        return self._run_bridge_session(name, cwd, prompt, agent, model, timeout, flags)
+        try:
+            if agent == "codex":
+                return self._run_codex_exec(name, cwd, prompt, model, timeout)
+            return self._run_bridge_session(name, cwd, prompt, agent, model, timeout, flags)
+        finally:
+            github_cache.clear()
 
     def _run_codex_exec(
         self,
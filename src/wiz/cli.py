@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import time
 from pathlib import Path
@@ -14,6 +15,9 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG = Path(__file__).parent.parent.parent / "config" / "wiz.yaml"
 
+# How many directories _resolve_wiz_dir checks, the config's own included
+_WIZ_DIR_MAX_DEPTH = 10
+
 
 def _apply_config_log_level(ctx: click.Context, config) -> None:
     """Apply config log_level when no explicit CLI --log-level was given."""
@@ -35,15 +39,16 @@ def _resolve_wiz_dir(config_path: Path) -> Path:
     Walks upward from the config's directory looking for scripts/wake.sh.
     Falls back to the config file's parent directory.
     """
-    current = config_path.resolve().parent
-    for _ in range(10):
-        if (current / "scripts" / "wake.sh").exists():
-            return current
-        parent = current.parent
-        if parent == current:
-            break
-        current = parent
-    return config_path.resolve().parent
+    return _find_wiz_dir(config_path.resolve().parent)
+
+
+@functools.lru_cache(maxsize=128)
+def _find_wiz_dir(config_dir: Path) -> Path:
+    """The upward walk behind _resolve_wiz_dir, cached per resolved directory."""
+    for candidate in (config_dir, *config_dir.parents[:_WIZ_DIR_MAX_DEPTH - 1]):
+        if (candidate / "scripts" / "wake.sh").is_file():
+            return candidate
+    return config_dir
 
 
 @click.group()
@@ -0,0 +1,62 @@
+"""Shared worker pool for independent gh/GitHub API calls.
+
+One process-wide ThreadPoolExecutor serves every GitHubIssues/GitHubPRs
+instance, so fan-out sites don't each spin up their own threads.
+subprocess.run and socket reads release the GIL, so threads are enough.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+
+MAX_WORKERS = 8
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ThreadPoolExecutor:
+    """Return the shared executor, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="wiz-gh")
+        return _pool
+
+
+def run_concurrently(calls: list[Callable[[], T]]) -> list[T]:
+    """Run independent calls in parallel and return results in order.
+
+    Waits for every call, then re-raises the first failure (in call
+    order). A single call runs inline without touching the pool.
+    """
+    if len(calls) <= 1:
+        return [call() for call in calls]
+    futures = [get_pool().submit(call) for call in calls]
+    errors = [f.exception() for f in futures]
+    for error in errors:
+        if error is not None:
+            raise error
+    return [f.result() for f in futures]
+
+
+def run_gh_many(
+    cmds: list[list[str]], timeout: int = 30,
+) -> list[subprocess.CompletedProcess[str]]:
+    """Run several gh commands concurrently without raising on exit status.
+
+    Callers inspect each returncode. FileNotFoundError (gh missing) and
+    TimeoutExpired still propagate.
+    """
+    def _run(cmd: list[str]) -> Callable[[], subprocess.CompletedProcess[str]]:
+        return lambda: subprocess.run(
+            cmd, capture_output=True, text=True, check=False, timeout=timeout,
+        )
+
+    return run_concurrently([_run(cmd) for cmd in cmds])
@@ -0,0 +1,227 @@
+"""Pooled HTTP transport for the GitHub REST API.
+
+Used by GitHubIssues/GitHubPRs in place of one `gh` subprocess per call
+when a token is available: GH_TOKEN or GITHUB_TOKEN (the variables `gh`
+itself honours), else the token of the logged-in gh CLI, read once per
+process with `gh auth token`. Without a token, callers fall back to
+invoking the gh CLI per call.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import subprocess
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from wiz.coordination._json_cache import ParsedJsonCache
+
+loads: Callable[[str | bytes], Any]
+try:
+    import orjson
+
+    loads = orjson.loads
+except ImportError:  # optional speedup: pip install wiz[fast]
+    loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+API_URL = "https://api.github.com"
+TIMEOUT = 30
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+# (path, params) -> (etag, parsed body) for conditional GETs. No TTL:
+# freshness is decided by GitHub answering 304 Not Modified.
+_etags = ParsedJsonCache(maxsize=512, ttl=float("inf"))
+
+_cli_token: str | None = None
+_cli_token_resolved = False
+_cli_token_lock = threading.Lock()
+
+
+class GhApiError(Exception):
+    """A GitHub REST call failed (transport error or non-2xx status)."""
+
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _token_from_gh_cli() -> str | None:
+    """Ask the gh CLI for its token, once per process."""
+    global _cli_token, _cli_token_resolved
+    with _cli_token_lock:
+        if not _cli_token_resolved:
+            try:
+                result = subprocess.run(
+                    ["gh", "auth", "token"],
+                    capture_output=True, text=True, check=True, timeout=10,
+                )
+                _cli_token = result.stdout.strip() or None
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+                _cli_token = None
+            if _cli_token is None:
+                logger.debug("No gh CLI token; GitHub calls will spawn gh per call")
+            _cli_token_resolved = True
+        return _cli_token
+
+
+def get_token() -> str | None:
+    """Return the GitHub token from the environment or the gh CLI, or None."""
+    return (
+        os.environ.get("GH_TOKEN")
+        or os.environ.get("GITHUB_TOKEN")
+        or _token_from_gh_cli()
+    )
+
+
+def get_session() -> requests.Session | None:
+    """Return the shared keep-alive session, or None if no token is set."""
+    global _session
+    token = get_token()
+    if token is None:
+        return None
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+            session.mount("https://", adapter)
+            session.headers.update({
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            })
+            _session = session
+        _session.headers["Authorization"] = f"Bearer {token}"
+        return _session
+
+
+def reset_session() -> None:
+    """Close and drop the shared session and ETag store (tests, token rotation)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+    _etags.clear()
+
+
+def available() -> bool:
+    """Whether the HTTP transport can be used instead of the gh CLI."""
+    return get_token() is not None
+
+
+def request(
+    method: str,
+    path: str,
+    params: dict[str, Any] | None = None,
+    json_body: Any = None,
+) -> Any:
+    """Issue a REST call against api.github.com and return the parsed body.
+
+    GETs are conditional: a remembered ETag is sent as If-None-Match and
+    a 304 answer (which costs no rate-limit quota) returns the body
+    parsed last time. Returns None for empty (204) responses. Raises
+    GhApiError on any transport failure or non-2xx status.
+    """
+    session = get_session()
+    if session is None:
+        raise GhApiError("No GitHub token in environment")
+    etag_key = None
+    headers = None
+    cached = None
+    if method == "GET":
+        etag_key = (path, tuple(sorted((params or {}).items())))
+        cached = _etags.get(etag_key)
+        if cached is not None:
+            headers = {"If-None-Match": cached[0]}
+    try:
+        resp = session.request(
+            method, f"{API_URL}{path}",
+            params=params, json=json_body, headers=headers, timeout=TIMEOUT,
+        )
+    except requests.RequestException as e:
+        raise GhApiError(f"{method} {path}: {e}") from e
+    if resp.status_code == 304 and cached is not None:
+        return cached[1]
+    if resp.status_code >= 400:
+        raise GhApiError(
+            f"{method} {path}: HTTP {resp.status_code}", status_code=resp.status_code,
+        )
+    if resp.status_code == 204 or not resp.content:
+        return None
+    try:
+        body = loads(resp.content)
+    except ValueError as e:
+        raise GhApiError(f"{method} {path}: invalid JSON") from e
+    etag = resp.headers.get("ETag")
+    if etag_key is not None and etag:
+        _etags.put(etag_key, (etag, body))
+    return body
+
+
+def paginate(
+    path: str, params: dict[str, Any] | None = None, limit: int = 50,
+) -> list[Any]:
+    """GET a list endpoint page by page until `limit` items are collected."""
+    items: list[Any] = []
+    page = 1
+    per_page = max(1, min(limit, 100))
+    while len(items) < limit:
+        batch = request(
+            "GET", path, params={**(params or {}), "per_page": per_page, "page": page},
+        )
+        if not batch:
+            break
+        items.extend(batch)
+        if len(batch) < per_page:
+            break
+        page += 1
+    return items[:limit]
+
+
+def issue_from_rest(data: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a REST issue object to the shape of `gh issue --json`."""
+    user = data.get("user")
+    return {
+        "number": data.get("number"),
+        "title": data.get("title", ""),
+        "labels": [{"name": lbl.get("name", "")} for lbl in data.get("labels") or []],
+        "state": (data.get("state") or "").upper(),
+        "url": data.get("html_url", ""),
+        "body": data.get("body") or "",
+        "author": {"login": user.get("login", "")} if user else None,
+    }
+
+
+def comment_from_rest(data: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a REST issue comment to the shape of `gh issue view --json comments`."""
+    user = data.get("user")
+    return {
+        "author": {"login": user.get("login", "")} if user else None,
+        "body": data.get("body") or "",
+        "createdAt": data.get("created_at", ""),
+        "url": data.get("html_url", ""),
+    }
+
+
+def pr_from_rest(data: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a REST pull request object to the shape of `gh pr --json`."""
+    state = (data.get("state") or "").upper()
+    if data.get("merged_at"):
+        state = "MERGED"
+    return {
+        "number": data.get("number"),
+        "title": data.get("title", ""),
+        "state": state,
+        "url": data.get("html_url", ""),
+        "body": data.get("body") or "",
+        "headRefName": (data.get("head") or {}).get("ref", ""),
+    }
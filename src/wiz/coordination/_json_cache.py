@@ -0,0 +1,89 @@
+"""Short-lived cache of parsed GitHub responses.
+
+Issues and PRs are re-read many times per cycle (claim checks, reviewer
+passes, label polling). Caching the already-parsed objects skips both the
+round trip and the JSON decode. Entries are keyed by tuples whose first
+two items are (repo, kind) so writers can invalidate whole families.
+Cached objects are shared, so readers hand callers deep copies of them.
+SessionRunner clears the cache after every agent session, since agents
+write to GitHub from their own processes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar, cast
+
+T = TypeVar("T")
+
+DEFAULT_TTL = 60.0
+DEFAULT_MAXSIZE = 1024
+
+
+class ParsedJsonCache:
+    """Thread-safe LRU cache with per-entry expiry."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return a live entry or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_fetch(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Return the cached value for key, calling loader on a miss.
+
+        Exceptions from loader propagate and None results are not cached,
+        so failures are always retried.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cast(T, cached)
+        value = loader()
+        if value is not None:
+            self.put(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_prefix(self, *prefix: Hashable) -> None:
+        """Drop every tuple key that starts with prefix."""
+        n = len(prefix)
+        with self._lock:
+            stale = [
+                k for k in self._entries
+                if isinstance(k, tuple) and k[:n] == prefix
+            ]
+            for k in stale:
+                del self._entries[k]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by all GitHubIssues/GitHubPRs instances in the process
+cache = ParsedJsonCache()
@@ -1,25 +1,59 @@
-"""GitHub Issues coordination via gh CLI."""
+"""GitHub Issues coordination via gh CLI or the REST API."""
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import logging
 import subprocess
+import time
+from collections.abc import Callable
 from typing import Any
+from urllib.parse import quote
+
+from wiz.coordination import _gh_http
+from wiz.coordination._exec import run_concurrently, run_gh_many
+from wiz.coordination._gh_http import GhApiError
+from wiz.coordination._json_cache import cache as _cache
 
 logger = logging.getLogger(__name__)
 
+# Fields requested from `gh issue list/view --json` by default
+ISSUE_FIELDS = ("number", "title", "labels", "state", "url", "body", "author")
+
+# Open issues scanned by check_duplicate
+_DUPLICATE_SCAN_LIMIT = 50
+
+_ISSUE_FIELDS = (
+    "number title state url body author { login } labels(first: 100) { nodes { name } }"
+)
+
+
+def _issue_from_graphql(node: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a GraphQL issue node to the shape of `gh issue --json`."""
+    labels = (node.get("labels") or {}).get("nodes") or []
+    return {**node, "labels": [{"name": lbl.get("name", "")} for lbl in labels]}
+
 
 class GitHubIssues:
-    """Manage GitHub issues via the gh CLI."""
+    """Manage GitHub issues via the gh CLI.
+
+    When a GitHub token is present in the environment, calls go straight
+    to the REST API over a pooled keep-alive session instead of spawning
+    a `gh` process per call.
+    """
 
     def __init__(
         self, repo: str, allowed_authors: list[str] | None = None,
     ) -> None:
         self.repo = repo
         self._ensured_labels: set[str] = set()
-        self._allowed_authors: set[str] | None = (
-            {a.lower() for a in allowed_authors} if allowed_authors else None
+        self._open_titles: set[str] | None = None
+        self._open_titles_at = 0.0
+        # Lowercased once here so filtering is a plain hash lookup per issue
+        self._allowed_authors: frozenset[str] | None = (
+            frozenset(a.lower() for a in allowed_authors) if allowed_authors else None
         )
 
     def _run_gh(
@@ -35,21 +69,45 @@ class GitHubIssues:
         )
 
     def ensure_labels(self, labels: list[str]) -> None:
-        """Create labels on the repo if they don't exist."""
-        for label in labels:
-            if label in self._ensured_labels:
-                continue
+        """Create labels on the repo if they don't exist.
+
+        Missing labels are created concurrently on the shared pool.
+        """
+        pending = [lbl for lbl in dict.fromkeys(labels) if lbl not in self._ensured_labels]
+        if not pending:
+            return
+        if _gh_http.available():
+            def _create(label: str) -> bool:
+                try:
+                    self._api_create_label(label)
+                    return True
+                except GhApiError:
+                    return False
+
+            created = run_concurrently([functools.partial(_create, lbl) for lbl in pending])
+        else:
             try:
-                subprocess.run(
-                    ["gh", "label", "create", label,
-                     "-R", self.repo, "--force"],
-                    capture_output=True, text=True,
-                    check=True, timeout=15,
+                results = run_gh_many(
+                    [["gh", "label", "create", lbl, "-R", self.repo, "--force"]
+                     for lbl in pending],
+                    timeout=15,
                 )
+                created = [r.returncode == 0 for r in results]
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                created = [False] * len(pending)
+        for label, ok in zip(pending, created, strict=True):
+            if ok:
                 self._ensured_labels.add(label)
-            except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+            else:
                 logger.warning("Could not ensure label %r exists", label)
 
+    def _api_create_label(self, label: str) -> None:
+        try:
+            _gh_http.request("POST", f"/repos/{self.repo}/labels", json_body={"name": label})
+        except GhApiError as e:
+            if e.status_code != 422:  # 422 = already exists
+                raise
+
     def create_issue(
         self, title: str, body: str,
         labels: list[str] | None = None,
@@ -61,36 +119,92 @@ class GitHubIssues:
         if labels:
             args.extend(["--label", ",".join(labels)])
         try:
-            result = self._run_gh(args)
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError) as e:
+            if _gh_http.available():
+                payload: dict[str, Any] = {"title": title, "body": body}
+                if labels:
+                    payload["labels"] = labels
+                data = _gh_http.request("POST", f"/repos/{self.repo}/issues", json_body=payload)
+                url = str(data.get("html_url") or "")
+            else:
+                result = self._run_gh(args)
+                url = result.stdout.strip()
+        except (
+            subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            FileNotFoundError, GhApiError,
+        ) as e:
             logger.error("Failed to create issue: %s", e)
             return None
+        finally:
+            self._invalidate()
+        if self._open_titles is not None:
+            self._open_titles.add(title.lower())
+        return url
 
     def list_issues(
         self,
         labels: list[str] | None = None,
         state: str = "open",
         limit: int = 50,
+        fields: tuple[str, ...] = ISSUE_FIELDS,
     ) -> list[dict[str, Any]]:
         """List issues with optional label and state filter.
 
         When allowed_authors is configured, issues from non-allowed authors
         are filtered out procedurally BEFORE returning, so their content
         never reaches agent prompts.
+
+        `fields` narrows the JSON fields gh requests (e.g. drop `body` when
+        only titles are needed); `author` is always included. Parsed
+        results are cached briefly and shared across instances.
         """
+        fields = tuple(dict.fromkeys((*fields, "author")))
         args = ["issue", "list", "--state", state, "--limit", str(limit), "--json",
-                "number,title,labels,state,url,body,author"]
+                ",".join(fields)]
         if labels:
             for label in labels:
                 args.extend(["--label", label])
-        try:
+
+        def _fetch() -> list[dict[str, Any]]:
+            if _gh_http.available():
+                # REST can't project server-side; trim to the same shape
+                return [
+                    {k: issue[k] for k in fields if k in issue}
+                    for issue in self._api_list_issues(labels, state, limit)
+                ]
             result = self._run_gh(args)
-            issues = json.loads(result.stdout) if result.stdout.strip() else []
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+            return _gh_http.loads(result.stdout) if result.stdout.strip() else []
+
+        key = (self.repo, "issues", tuple(labels or ()), state, limit, fields)
+        try:
+            issues = _cache.get_or_fetch(key, _fetch)
+        except (
+            subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            json.JSONDecodeError, FileNotFoundError, GhApiError,
+        ):
             return []
 
-        return self._filter_by_author(issues)
+        # Deep copy (labels are nested lists) so callers can't mutate the cached listing
+        allowed = copy.deepcopy(self._filter_by_author(issues))
+        if (
+            allowed and not labels and state == "open"
+            and limit >= _DUPLICATE_SCAN_LIMIT and "title" in fields
+        ):
+            # An unfiltered open listing covers what check_duplicate would fetch
+            self._open_titles = {issue.get("title", "").lower() for issue in allowed}
+            self._open_titles_at = time.monotonic()
+        return allowed
+
+    def _api_list_issues(
+        self, labels: list[str] | None, state: str, limit: int,
+    ) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {"state": state}
+        if labels:
+            params["labels"] = ",".join(labels)
+        # The issues endpoint also returns PRs; drop them
+        raw = _gh_http.paginate(f"/repos/{self.repo}/issues", params=params, limit=limit)
+        return [
+            _gh_http.issue_from_rest(item) for item in raw if "pull_request" not in item
+        ][:limit]
 
     def _filter_by_author(self, issues: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Procedurally filter issues to only those from allowed authors.
@@ -101,20 +215,19 @@ class GitHubIssues:
 
         When allowed_authors is None (empty config), all issues pass through.
         """
-        if not self._allowed_authors:
+        allowed_authors = self._allowed_authors
+        if not allowed_authors:
             return issues
 
         allowed: list[dict[str, Any]] = []
         for issue in issues:
-            author = issue.get("author") or {}
-            login = (author.get("login") or "").lower()
-            number = issue.get("number", "?")
-            if login in self._allowed_authors:
+            login = ((issue.get("author") or {}).get("login") or "").lower()
+            if login in allowed_authors:
                 allowed.append(issue)
             else:
                 logger.warning(
                     "Issue #%s rejected: author '%s' not in allowed list",
-                    number, login,
+                    issue.get("number", "?"), login,
                 )
         return allowed
 
@@ -123,29 +236,98 @@ class GitHubIssues:
 
         Rejects issues from non-allowed authors when allowlist is configured.
         """
-        try:
+        def _fetch() -> dict[str, Any] | None:
+            if _gh_http.available():
+                data = _gh_http.request("GET", f"/repos/{self.repo}/issues/{issue_number}")
+                return _gh_http.issue_from_rest(data) if data else None
             result = self._run_gh(
                 ["issue", "view", str(issue_number), "--json",
-                 "number,title,labels,state,url,body,author"]
+                 ",".join(ISSUE_FIELDS)]
             )
-            issue = json.loads(result.stdout) if result.stdout.strip() else None
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+            return _gh_http.loads(result.stdout) if result.stdout.strip() else None
+
+        try:
+            issue = _cache.get_or_fetch((self.repo, "issue", issue_number), _fetch)
+        except (
+            subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            json.JSONDecodeError, FileNotFoundError, GhApiError,
+        ):
             return None
 
         if issue is None:
             return None
 
         filtered = self._filter_by_author([issue])
-        return filtered[0] if filtered else None
+        return copy.deepcopy(filtered[0]) if filtered else None
+
+    def get_issues(self, issue_numbers: list[int]) -> dict[int, dict[str, Any]]:
+        """Get several issues in one GraphQL round trip.
+
+        Returns {number: issue} for the issues that exist and pass the
+        author allowlist; missing or rejected numbers are simply absent.
+        """
+        numbers = list(dict.fromkeys(issue_numbers))
+        if not numbers:
+            return {}
+        owner, _, name = self.repo.partition("/")
+        aliases = " ".join(
+            f"i{idx}: issue(number: {num}) {{ {_ISSUE_FIELDS} }}"
+            for idx, num in enumerate(numbers)
+        )
+        query = (
+            "query($owner: String!, $name: String!) "
+            f"{{ repository(owner: $owner, name: $name) {{ {aliases} }} }}"
+        )
+        try:
+            if _gh_http.available():
+                data = _gh_http.request(
+                    "POST", "/graphql",
+                    json_body={"query": query, "variables": {"owner": owner, "name": name}},
+                )
+            else:
+                result = subprocess.run(
+                    ["gh", "api", "graphql",
+                     "-f", f"query={query}", "-F", f"owner={owner}", "-F", f"name={name}"],
+                    capture_output=True, text=True, check=False, timeout=30,
+                )
+                # Missing issues make gh exit non-zero but still print partial data
+                data = _gh_http.loads(result.stdout) if result.stdout.strip() else None
+        except (
+            subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError, GhApiError,
+        ):
+            return {}
+
+        repository = ((data or {}).get("data") or {}).get("repository") or {}
+        issues = [
+            _issue_from_graphql(node) for node in repository.values() if node
+        ]
+        return {issue["number"]: issue for issue in self._filter_by_author(issues)}
 
     def add_comment(self, issue_number: int, body: str) -> bool:
         """Add a comment to an issue."""
         args = ["issue", "comment", str(issue_number), "--body", body]
         try:
-            self._run_gh(args)
+            if _gh_http.available():
+                _gh_http.request(
+                    "POST", f"/repos/{self.repo}/issues/{issue_number}/comments",
+                    json_body={"body": body},
+                )
+            else:
+                self._run_gh(args)
             return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+        except (
+            subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            FileNotFoundError, GhApiError,
+        ):
             return False
+        finally:
+            _cache.invalidate((self.repo, "issue", issue_number))
+
+    def _invalidate(self, issue_number: int | None = None) -> None:
+        """Drop cached reads a write may have made stale."""
+        if issue_number is not None:
+            _cache.invalidate((self.repo, "issue", issue_number))
+        _cache.invalidate_prefix(self.repo, "issues")
 
     def update_labels(
         self,
@@ -155,35 +337,77 @@ class GitHubIssues:
     ) -> bool:
         """Add or remove labels from an issue."""
         try:
+            if _gh_http.available():
+                self._api_update_labels(issue_number, add, remove)
+                return True
+            # Labels must exist before they can be added; the edits themselves
+            # are independent and run in parallel.
             if add:
                 self.ensure_labels(add)
-                self._run_gh(
-                    ["issue", "edit", str(issue_number),
-                     "--add-label", ",".join(add)]
-                )
+            edit = ["issue", "edit", str(issue_number)]
+            edits: list[Callable[[], subprocess.CompletedProcess[str]]] = []
+            if add:
+                edits.append(functools.partial(self._run_gh, [*edit, "--add-label", ",".join(add)]))
             if remove:
-                self._run_gh(
-                    ["issue", "edit", str(issue_number), "--remove-label", ",".join(remove)]
+                edits.append(
+                    functools.partial(self._run_gh, [*edit, "--remove-label", ",".join(remove)]),
                 )
+            run_concurrently(edits)
             return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+        except (
+            subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            FileNotFoundError, GhApiError,
+        ):
             return False
+        finally:
+            self._invalidate(issue_number)
+
+    def _api_update_labels(
+        self, issue_number: int, add: list[str] | None, remove: list[str] | None,
+    ) -> None:
+        path = f"/repos/{self.repo}/issues/{issue_number}/labels"
+
+        def _remove(label: str) -> None:
+            try:
+                _gh_http.request("DELETE", f"{path}/{quote(label, safe='')}")
+            except GhApiError as e:
+                if e.status_code != 404:  # label was not on the issue
+                    raise
+
+        calls: list[Callable[[], Any]] = []
+        if add:
+            # The REST endpoint creates missing labels itself
+            calls.append(lambda: _gh_http.request("POST", path, json_body={"labels": add}))
+        calls.extend(functools.partial(_remove, label) for label in remove or [])
+        run_concurrently(calls)
 
     def close_issue(self, issue_number: int) -> bool:
         """Close an issue."""
-        try:
-            self._run_gh(["issue", "close", str(issue_number)])
-            return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        return self._set_state(issue_number, "close")
 
     def reopen_issue(self, issue_number: int) -> bool:
         """Reopen an issue."""
+        return self._set_state(issue_number, "reopen")
+
+    def _set_state(self, issue_number: int, action: str) -> bool:
         try:
-            self._run_gh(["issue", "reopen", str(issue_number)])
+            if _gh_http.available():
+                _gh_http.request(
+                    "PATCH", f"/repos/{self.repo}/issues/{issue_number}",
+                    json_body={"state": "closed" if action == "close" else "open"},
+                )
+            else:
+                self._run_gh(["issue", action, str(issue_number)])
             return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+        except (
+            subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            FileNotFoundError, GhApiError,
+        ):
             return False
+        finally:
+            self._invalidate(issue_number)
+            # Closing or reopening changes which titles are open
+            self._open_titles = None
 
     def get_comments(self, issue_number: int, last_n: int = 5) -> list[dict[str, Any]]:
         """Get the last N comments on an issue."""
@@ -192,18 +416,37 @@ class GitHubIssues:
             "--json", "comments",
         ]
         try:
-            result = self._run_gh(args)
-            data = json.loads(result.stdout) if result.stdout.strip() else {}
-            comments = data.get("comments", [])
+            if _gh_http.available():
+                raw = _gh_http.paginate(
+                    f"/repos/{self.repo}/issues/{issue_number}/comments", limit=1000,
+                )
+                comments = [_gh_http.comment_from_rest(c) for c in raw]
+            else:
+                result = self._run_gh(args)
+                data = _gh_http.loads(result.stdout) if result.stdout.strip() else {}
+                comments = data.get("comments", [])
             return comments[-last_n:] if comments else []
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+        except (
+            subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            json.JSONDecodeError, FileNotFoundError, GhApiError,
+        ):
             return []
 
     def check_duplicate(self, title: str) -> bool:
-        """Check if an issue with similar title exists."""
-        issues = self.list_issues()
-        title_lower = title.lower()
-        for issue in issues:
-            if issue.get("title", "").lower() == title_lower:
-                return True
-        return False
+        """Check if an issue with similar title exists.
+
+        The open-issue titles are listed once (or taken from an earlier
+        unfiltered list_issues call) and kept up to date by create_issue,
+        so repeated checks are a local set lookup. The snapshot expires
+        with the response cache TTL and is dropped when an issue is closed
+        or reopened. A failed or empty listing is not remembered and is
+        retried next time.
+        """
+        if (
+            self._open_titles is not None
+            and time.monotonic() - self._open_titles_at >= _cache.ttl
+        ):
+            self._open_titles = None
+        if self._open_titles is None:
+            self.list_issues(limit=_DUPLICATE_SCAN_LIMIT, fields=("number", "title"))
+        return title.lower() in (self._open_titles or ())
@@ -1,21 +1,44 @@
-"""GitHub Pull Requests coordination via gh CLI."""
+"""GitHub Pull Requests coordination via gh CLI or the REST API."""
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import subprocess
+import threading
+import time
 from typing import Any
+from urllib.parse import quote
+
+from wiz.coordination import _gh_http
+from wiz.coordination._gh_http import GhApiError
+from wiz.coordination._json_cache import cache as _cache
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BRANCH_TTL = 3600.0
+
+# Shared across instances: repo -> (branch, fetched_at)
+_default_branches: dict[str, tuple[str, float]] = {}
+_default_branches_lock = threading.Lock()
+
+
+def clear_default_branch_cache() -> None:
+    """Forget all cached default branches."""
+    with _default_branches_lock:
+        _default_branches.clear()
+
 
 class GitHubPRs:
-    """Manage GitHub PRs via the gh CLI."""
+    """Manage GitHub PRs via the gh CLI.
+
+    Uses the pooled REST transport instead when a GitHub token is present
+    in the environment (see GitHubIssues).
+    """
 
     def __init__(self, repo: str) -> None:
         self.repo = repo
-        self._default_branch: str | None = None
 
     def _run_gh(self, args: list[str], check: bool = True) -> subprocess.CompletedProcess[str]:
         cmd = ["gh"] + args + ["-R", self.repo]
@@ -28,20 +51,34 @@ class GitHubPRs:
         )
 
     def get_default_branch(self) -> str:
-        """Return the repository's default branch, cached after first call."""
-        if self._default_branch is not None:
-            return self._default_branch
+        """Return the repository's default branch.
+
+        Cached per repo at module level for DEFAULT_BRANCH_TTL seconds, so
+        new GitHubPRs instances for the same repo don't re-query GitHub.
+        """
+        with _default_branches_lock:
+            cached = _default_branches.get(self.repo)
+        if cached is not None and time.monotonic() - cached[1] < DEFAULT_BRANCH_TTL:
+            return cached[0]
         try:
-            result = self._run_gh([
-                "repo", "view",
-                "--json", "defaultBranchRef",
-                "-q", ".defaultBranchRef.name",
-            ])
-            branch = result.stdout.strip()
+            if _gh_http.available():
+                data = _gh_http.request("GET", f"/repos/{self.repo}")
+                branch = str((data or {}).get("default_branch") or "")
+            else:
+                result = self._run_gh([
+                    "repo", "view",
+                    "--json", "defaultBranchRef",
+                    "-q", ".defaultBranchRef.name",
+                ])
+                branch = result.stdout.strip()
             if branch:
-                self._default_branch = branch
+                with _default_branches_lock:
+                    _default_branches[self.repo] = (branch, time.monotonic())
                 return branch
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+        except (
+            subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            FileNotFoundError, GhApiError,
+        ):
             logger.debug("Could not detect default branch for %s, falling back to 'main'", self.repo)
         return "main"
 
@@ -63,25 +100,57 @@ class GitHubPRs:
             "--base", base,
         ]
         try:
+            if _gh_http.available():
+                data = _gh_http.request(
+                    "POST", f"/repos/{self.repo}/pulls",
+                    json_body={"title": title, "body": body, "head": head, "base": base},
+                )
+                return str(data.get("html_url") or "")
             result = self._run_gh(args)
             return result.stdout.strip()
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError) as e:
+        except (
+            subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            FileNotFoundError, GhApiError,
+        ) as e:
             logger.error("Failed to create PR: %s", e)
             return None
+        finally:
+            _cache.invalidate_prefix(self.repo, "prs")
 
     def list_prs(self, state: str = "open", limit: int = 50) -> list[dict[str, Any]]:
-        """List PRs."""
+        """List PRs. Parsed results are cached briefly and shared across instances."""
         args = [
             "pr", "list",
             "--state", state,
             "--limit", str(limit),
             "--json", "number,title,state,url,headRefName",
         ]
-        try:
+
+        def _fetch() -> list[dict[str, Any]]:
+            if _gh_http.available():
+                return self._api_list_prs(state, limit)
             result = self._run_gh(args)
-            return json.loads(result.stdout) if result.stdout.strip() else []
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+            return _gh_http.loads(result.stdout) if result.stdout.strip() else []
+
+        try:
+            prs = _cache.get_or_fetch((self.repo, "prs", state, limit), _fetch)
+        except (
+            subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            json.JSONDecodeError, FileNotFoundError, GhApiError,
+        ):
             return []
+        return copy.deepcopy(prs)
+
+    def _api_list_prs(self, state: str, limit: int) -> list[dict[str, Any]]:
+        # REST has no "merged" state filter; fetch closed and keep merged ones
+        api_state = "closed" if state == "merged" else state
+        raw = _gh_http.paginate(
+            f"/repos/{self.repo}/pulls", params={"state": api_state}, limit=limit,
+        )
+        prs = [_gh_http.pr_from_rest(item) for item in raw]
+        if state == "merged":
+            prs = [pr for pr in prs if pr["state"] == "MERGED"]
+        return prs
 
     def merge_pr(
         self,
@@ -97,21 +166,74 @@ class GitHubPRs:
         if delete_branch:
             args.append("--delete-branch")
         try:
-            self._run_gh(args)
+            if _gh_http.available():
+                self._api_merge_pr(pr_number, method, delete_branch)
+            else:
+                self._run_gh(args)
             logger.info("Merged PR #%d (%s)", pr_number, method)
             return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, GhApiError) as e:
             logger.error("Failed to merge PR #%d: %s", pr_number, e)
             return False
+        finally:
+            _cache.invalidate((self.repo, "pr", pr_number))
+            _cache.invalidate_prefix(self.repo, "prs")
 
     def get_pr(self, pr_number: int) -> dict[str, Any] | None:
-        """Get PR details."""
+        """Get PR details. Parsed results are cached briefly."""
         args = [
             "pr", "view", str(pr_number),
             "--json", "number,title,state,url,body,headRefName,files",
         ]
-        try:
+
+        def _fetch() -> dict[str, Any] | None:
+            if _gh_http.available():
+                return self._api_get_pr(pr_number)
             result = self._run_gh(args)
-            return json.loads(result.stdout) if result.stdout.strip() else None
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+            return _gh_http.loads(result.stdout) if result.stdout.strip() else None
+
+        try:
+            pr = _cache.get_or_fetch((self.repo, "pr", pr_number), _fetch)
+        except (
+            subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            json.JSONDecodeError, FileNotFoundError, GhApiError,
+        ):
             return None
+        return copy.deepcopy(pr)
+
+    def _api_get_pr(self, pr_number: int) -> dict[str, Any] | None:
+        data = _gh_http.request("GET", f"/repos/{self.repo}/pulls/{pr_number}")
+        if not data:
+            return None
+        pr = _gh_http.pr_from_rest(data)
+        files = _gh_http.paginate(
+            f"/repos/{self.repo}/pulls/{pr_number}/files", limit=3000,
+        )
+        pr["files"] = [
+            {
+                "path": f.get("filename", ""),
+                "additions": f.get("additions", 0),
+                "deletions": f.get("deletions", 0),
+            }
+            for f in files
+        ]
+        return pr
+
+    def _api_merge_pr(self, pr_number: int, method: str, delete_branch: bool) -> None:
+        _gh_http.request(
+            "PUT", f"/repos/{self.repo}/pulls/{pr_number}/merge",
+            json_body={"merge_method": method},
+        )
+        if not delete_branch:
+            return
+        data = _gh_http.request("GET", f"/repos/{self.repo}/pulls/{pr_number}")
+        head = (data or {}).get("head") or {}
+        branch = head.get("ref")
+        # Never delete branches that live on a fork
+        if branch and (head.get("repo") or {}).get("full_name", self.repo) == self.repo:
+            try:
+                _gh_http.request(
+                    "DELETE", f"/repos/{self.repo}/git/refs/heads/{quote(branch)}",
+                )
+            except GhApiError as e:
+                logger.warning("Merged PR #%d but could not delete %s: %s", pr_number, branch, e)
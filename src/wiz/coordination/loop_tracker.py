@@ -2,28 +2,78 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import weakref
 
 from wiz.coordination.strikes import StrikeTracker
 
 logger = logging.getLogger(__name__)
 
 
+# Live trackers, flushed by one exit hook; collected trackers drop out
+_live: weakref.WeakSet[LoopTracker] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    for tracker in list(_live):
+        tracker.flush()
+
+
 class LoopTracker:
-    """Track fix-review cycles per issue to prevent infinite loops."""
+    """Track fix-review cycles per issue to prevent infinite loops.
 
-    def __init__(self, strikes: StrikeTracker, max_cycles: int = 3) -> None:
+    Cycle counts are kept in memory and written to the StrikeTracker in
+    batches (every `flush_every` cycles, on close(), and at interpreter
+    exit). Reads always see unflushed cycles. The tracker assumes it is
+    the only writer of issue strikes while it is open.
+    """
+
+    def __init__(
+        self, strikes: StrikeTracker, max_cycles: int = 3, flush_every: int = 8,
+    ) -> None:
         self.strikes = strikes
         self.max_cycles = max_cycles
+        self.flush_every = flush_every
+        self._counts: dict[int, int] = {}
+        self._pending: list[tuple[int, str]] = []
+        _live.add(self)
 
     def record_cycle(self, issue_number: int, reason: str) -> int:
         """Record a fix-review cycle. Returns new cycle count."""
-        return self.strikes.record_issue_strike(issue_number, reason)
+        count = self.get_cycle_count(issue_number) + 1
+        self._counts[issue_number] = count
+        self._pending.append((issue_number, reason))
+        logger.info("Issue #%d cycle %d: %s", issue_number, count, reason)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+        return count
 
     def is_max_reached(self, issue_number: int) -> bool:
         """Check if max cycles reached for an issue."""
-        return self.strikes.is_escalated(issue_number, self.max_cycles)
+        count = self.get_cycle_count(issue_number)
+        if count >= self.max_cycles:
+            logger.warning(
+                "Issue #%d escalated: %d cycles >= %d max",
+                issue_number, count, self.max_cycles,
+            )
+            return True
+        return False
 
     def get_cycle_count(self, issue_number: int) -> int:
         """Get current cycle count for an issue."""
-        return self.strikes.get_issue_strikes(issue_number)
+        if issue_number not in self._counts:
+            self._counts[issue_number] = self.strikes.get_issue_strikes(issue_number)
+        return self._counts[issue_number]
+
+    def flush(self) -> None:
+        """Write buffered cycles to the strike store."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self.strikes.record_issue_strikes(pending)
+
+    def close(self) -> None:
+        """Flush buffered cycles. The tracker stays usable afterwards."""
+        self.flush()
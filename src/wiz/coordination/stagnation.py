@@ -13,6 +13,8 @@ logger = logging.getLogger(__name__)
 class StagnationDetector:
     """Track consecutive no-change iterations and trigger circuit breaker."""
 
+    __slots__ = ("limit", "count")
+
     def __init__(self, limit: int = 3) -> None:
         self.limit = limit
         self.count = 0
@@ -22,18 +24,17 @@ class StagnationDetector:
 
         Returns True if circuit breaker should trigger (stop).
         """
-        if not files_changed:
-            self.count += 1
-            logger.warning(
-                "No changes - stagnation count: %d/%d",
-                self.count,
-                self.limit,
-            )
-            if self.count >= self.limit:
-                logger.error("CIRCUIT BREAKER: Stopping due to stagnation")
-                return True
-        else:
-            self.count = 0
+        self.count = 0 if files_changed else self.count + 1
+        if not self.count:
+            return False
+        logger.warning(
+            "No changes - stagnation count: %d/%d",
+            self.count,
+            self.limit,
+        )
+        if self.count >= self.limit:
+            logger.error("CIRCUIT BREAKER: Stopping due to stagnation")
+            return True
         return False
 
     def reset(self) -> None:
@@ -4,76 +4,220 @@ from __future__ import annotations
 
 import json
 import logging
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Any
 
 logger = logging.getLogger(__name__)
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    number INTEGER PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issue_history (
+    number INTEGER NOT NULL,
+    reason TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_by_count ON files (count);
+CREATE TABLE IF NOT EXISTS file_issues (
+    path TEXT NOT NULL,
+    issue INTEGER NOT NULL,
+    PRIMARY KEY (path, issue)
+);
+"""
+
+_INC_ISSUE = (
+    "INSERT INTO issues (number, count) VALUES (?, 1) "
+    "ON CONFLICT (number) DO UPDATE SET count = count + 1"
+)
+_INC_FILE = (
+    "INSERT INTO files (path, count) VALUES (?, 1) "
+    "ON CONFLICT (path) DO UPDATE SET count = count + 1"
+)
+# sqlite3 messages for a damaged file; anything else (locked, unable to
+# open, ...) is transient or environmental and must not wipe the strikes
+_CORRUPT_MESSAGES = ("file is not a database", "database disk image is malformed")
+
+# Ordered by count so the files_by_count index serves both filter and order
+_FLAGGED_FILES = "SELECT path FROM files WHERE count >= ? ORDER BY count"
+
 
 class StrikeTracker:
-    """Track per-issue strikes and per-file failures for escalation."""
+    """Track per-issue strikes and per-file failures for escalation.
+
+    Stored in SQLite (WAL mode) next to the configured strike file, so
+    each record is a single-row upsert rather than a rewrite of the whole
+    history. A legacy JSON strike file is imported on first open.
+    """
 
     def __init__(self, strike_file: Path) -> None:
         self.strike_file = Path(strike_file)
-        self._data: dict[str, Any] = {"issues": {}, "files": {}}
-        self._load()
+        self.db_path = self.strike_file.with_suffix(".db")
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            conn = self._open()
+        except sqlite3.DatabaseError as e:
+            if not any(msg in str(e) for msg in _CORRUPT_MESSAGES):
+                raise
+            logger.warning("Corrupt strike database %s, resetting", self.db_path)
+            self.db_path.unlink(missing_ok=True)
+            conn = self._open()
+        if self.strike_file.exists() and self.strike_file != self.db_path:
+            self._migrate_json(conn)
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
 
-    def _load(self) -> None:
-        if self.strike_file.exists():
-            try:
-                self._data = json.loads(self.strike_file.read_text())
-            except (json.JSONDecodeError, KeyError):
-                logger.warning("Corrupt strike file %s, resetting", self.strike_file)
-                self._data = {"issues": {}, "files": {}}
+    def _migrate_json(self, conn: sqlite3.Connection) -> None:
+        """Import a legacy strikes.json, then rename it so it's read only once."""
+        try:
+            data = json.loads(self.strike_file.read_text())
+            issues = data.get("issues", {})
+            files = data.get("files", {})
+        except (json.JSONDecodeError, AttributeError):
+            logger.warning("Corrupt strike file %s, skipping import", self.strike_file)
+            return
+        with conn:
+            conn.execute("BEGIN")
+            for key, entry in issues.items():
+                conn.execute(
+                    "INSERT OR REPLACE INTO issues (number, count) VALUES (?, ?)",
+                    (int(key), entry.get("count", 0)),
+                )
+                conn.executemany(
+                    "INSERT INTO issue_history (number, reason) VALUES (?, ?)",
+                    [(int(key), reason) for reason in entry.get("history", [])],
+                )
+            for path, entry in files.items():
+                conn.execute(
+                    "INSERT OR REPLACE INTO files (path, count) VALUES (?, ?)",
+                    (path, entry.get("count", 0)),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO file_issues (path, issue) VALUES (?, ?)",
+                    [(path, issue) for issue in entry.get("issues", [])],
+                )
+        self.strike_file.rename(self.strike_file.with_suffix(".json.migrated"))
+        logger.info("Imported legacy strike file %s into %s", self.strike_file, self.db_path)
 
-    def _save(self) -> None:
-        self.strike_file.parent.mkdir(parents=True, exist_ok=True)
-        self.strike_file.write_text(json.dumps(self._data, indent=2))
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
 
     def record_issue_strike(self, issue_number: int, reason: str) -> int:
         """Record a strike for an issue. Returns new strike count."""
-        key = str(issue_number)
-        if key not in self._data["issues"]:
-            self._data["issues"][key] = {"count": 0, "history": []}
-        self._data["issues"][key]["count"] += 1
-        self._data["issues"][key]["history"].append(reason)
-        self._save()
-        count = self._data["issues"][key]["count"]
-        logger.info("Issue #%s strike %d: %s", key, count, reason)
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute(_INC_ISSUE, (issue_number,))
+            self._conn.execute(
+                "INSERT INTO issue_history (number, reason) VALUES (?, ?)",
+                (issue_number, reason),
+            )
+            count = self._conn.execute(
+                "SELECT count FROM issues WHERE number = ?", (issue_number,),
+            ).fetchone()[0]
+        logger.info("Issue #%s strike %d: %s", issue_number, count, reason)
         return count
 
+    def record_issue_strikes(self, strikes: list[tuple[int, str]]) -> None:
+        """Record several (issue_number, reason) strikes in one transaction."""
+        if not strikes:
+            return
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(_INC_ISSUE, [(n,) for n, _ in strikes])
+            self._conn.executemany(
+                "INSERT INTO issue_history (number, reason) VALUES (?, ?)", strikes,
+            )
+        logger.info("Recorded %d issue strikes", len(strikes))
+
     def get_issue_strikes(self, issue_number: int) -> int:
         """Get strike count for an issue."""
-        key = str(issue_number)
-        return self._data["issues"].get(key, {}).get("count", 0)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT count FROM issues WHERE number = ?", (issue_number,),
+            ).fetchone()
+        return row[0] if row else 0
+
+    def get_issue_history(self, issue_number: int) -> list[str]:
+        """Get the recorded strike reasons for an issue, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT reason FROM issue_history WHERE number = ? ORDER BY rowid",
+                (issue_number,),
+            ).fetchall()
+        return [r[0] for r in rows]
 
     def record_file_failure(self, file_path: str, issue_number: int) -> int:
         """Record a failure for a file (across issues). Returns new count."""
-        if file_path not in self._data["files"]:
-            self._data["files"][file_path] = {"count": 0, "issues": []}
-        self._data["files"][file_path]["count"] += 1
-        if issue_number not in self._data["files"][file_path]["issues"]:
-            self._data["files"][file_path]["issues"].append(issue_number)
-        self._save()
-        count = self._data["files"][file_path]["count"]
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute(_INC_FILE, (file_path,))
+            self._conn.execute(
+                "INSERT OR IGNORE INTO file_issues (path, issue) VALUES (?, ?)",
+                (file_path, issue_number),
+            )
+            count = self._conn.execute(
+                "SELECT count FROM files WHERE path = ?", (file_path,),
+            ).fetchone()[0]
         logger.info("File %s failure %d (issue #%d)", file_path, count, issue_number)
         return count
 
+    def get_file_failures(self, file_path: str) -> int:
+        """Get failure count for a file."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT count FROM files WHERE path = ?", (file_path,),
+            ).fetchone()
+        return row[0] if row else 0
+
+    def get_file_issues(self, file_path: str) -> list[int]:
+        """Get the distinct issues a file has failed under."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT issue FROM file_issues WHERE path = ? ORDER BY rowid",
+                (file_path,),
+            ).fetchall()
+        return [r[0] for r in rows]
+
     def is_escalated(self, issue_number: int, max_strikes: int = 3) -> bool:
         """Check if an issue has reached the escalation threshold."""
         strikes = self.get_issue_strikes(issue_number)
         if strikes >= max_strikes:
-            logger.warning("Issue #%d escalated: %d strikes >= %d max", issue_number, strikes, max_strikes)
+            logger.warning(
+                "Issue #%d escalated: %d strikes >= %d max",
+                issue_number, strikes, max_strikes,
+            )
             return True
         return False
 
     def get_flagged_files(self, max_strikes: int = 3) -> list[str]:
-        """Get files that have exceeded the failure threshold."""
-        flagged = [
-            fp
-            for fp, data in self._data["files"].items()
-            if data.get("count", 0) >= max_strikes
-        ]
+        """Get files that have exceeded the failure threshold.
+
+        Served by the files_by_count index, so only flagged rows are read.
+        """
+        with self._lock:
+            rows = self._conn.execute(_FLAGGED_FILES, (max_strikes,)).fetchall()
+        flagged = [r[0] for r in rows]
         if flagged:
             logger.warning("Flagged files (>=%d failures): %s", max_strikes, flagged)
         return flagged
@@ -15,6 +15,7 @@ class WorktreeManager:
     def __init__(self, repo_path: Path, base_dir: str = ".worktrees") -> None:
         self.repo_path = Path(repo_path)
         self.base_dir = base_dir
+        self._common_dir: Path | None = None
 
     def _worktree_path(self, agent_type: str, issue: int | str) -> Path:
         return self.repo_path / self.base_dir / f"{agent_type}-{issue}"
@@ -35,16 +36,66 @@ class WorktreeManager:
             timeout=30,
         )
 
-    def _branch_exists(self, branch: str) -> bool:
-        """Check whether a local branch already exists."""
+    def _git_common_dir(self) -> Path | None:
+        """Locate the git directory holding refs, or None if it can't be read directly.
+
+        Handles both a plain `.git` directory and the `gitdir:` pointer file
+        left in linked worktrees. Reftable repositories return None.
+        """
+        if self._common_dir is not None:
+            return self._common_dir
+        dot_git = self.repo_path / ".git"
         try:
-            self._run_git(["rev-parse", "--verify", f"refs/heads/{branch}"])
-            return True
-        except subprocess.CalledProcessError:
+            if dot_git.is_dir():
+                git_dir = dot_git
+            elif dot_git.is_file():
+                content = dot_git.read_text().strip()
+                if not content.startswith("gitdir:"):
+                    return None
+                git_dir = Path(content[len("gitdir:"):].strip())
+                if not git_dir.is_absolute():
+                    git_dir = self.repo_path / git_dir
+                commondir = git_dir / "commondir"
+                if commondir.is_file():
+                    git_dir = git_dir / commondir.read_text().strip()
+            else:
+                return None
+        except OSError:
+            return None
+        if (git_dir / "reftable").exists():
+            return None
+        self._common_dir = git_dir
+        return git_dir
+
+    def _read_branch_ref(self, branch: str) -> bool | None:
+        """Look a branch up in the loose refs and packed-refs. None if unsure."""
+        git_dir = self._git_common_dir()
+        if git_dir is None:
+            return None
+        ref = f"refs/heads/{branch}"
+        try:
+            if (git_dir / ref).is_file():
+                return True
+            packed = git_dir / "packed-refs"
+            if not packed.exists():
+                return False
+            with packed.open() as f:
+                for line in f:
+                    # "<sha> <refname>"; skip "# pack-refs" header and "^<sha>" peel lines
+                    if line[:1] not in ("#", "^") and line.rstrip("\n").endswith(f" {ref}"):
+                        return True
             return False
+        except OSError:
+            return None
 
     def create(self, agent_type: str, issue: int | str) -> Path:
-        """Create a worktree. Returns the worktree path."""
+        """Create a worktree. Returns the worktree path.
+
+        Reuses the branch if it already exists, otherwise creates it. This
+        takes a single `git worktree add` unless the refs can't be read
+        directly and the branch turns out to exist, in which case the add
+        is retried without `-b`.
+        """
         wt_path = self._worktree_path(agent_type, issue)
         branch = self._branch_name(agent_type, issue)
 
@@ -52,10 +103,16 @@ class WorktreeManager:
             return wt_path
 
         wt_path.parent.mkdir(parents=True, exist_ok=True)
-        if self._branch_exists(branch):
+        if self._read_branch_ref(branch):
             self._run_git(["worktree", "add", str(wt_path), branch])
         else:
-            self._run_git(["worktree", "add", "-b", branch, str(wt_path)])
+            try:
+                self._run_git(["worktree", "add", "-b", branch, str(wt_path)])
+            except subprocess.CalledProcessError as e:
+                stderr = e.stderr or ""
+                if "already exists" not in stderr or f"'{branch}'" not in stderr:
+                    raise
+                self._run_git(["worktree", "add", str(wt_path), branch])
         logger.info("Created worktree: %s (branch: %s)", wt_path, branch)
         return wt_path
 
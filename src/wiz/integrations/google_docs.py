@@ -4,17 +4,31 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 SCOPES = [
     "https://www.googleapis.com/auth/documents",
     "https://www.googleapis.com/auth/drive.file",
 ]
 
+# Requests per documents.batchUpdate call for long documents
+BATCH_UPDATE_SIZE = 500
+
+# Markdown patterns, compiled once rather than looked up per line/character
+_HEADING_RE = re.compile(r"^(#{1,3})\s+(.*)")
+_HRULE_RE = re.compile(r"^-{3,}$")
+_BULLET_RE = re.compile(r"^[-*]\s+(.*)")
+# **bold** (group 1) or [text](url) (groups 2, 3); bold wins at the same position
+_INLINE_RE = re.compile(r"\*\*(.+?)\*\*|\[([^\]]+)\]\(([^)]+)\)")
+
 
 @dataclass
 class DocResult:
@@ -124,10 +138,11 @@ class GoogleDocsClient:
             if image_prompt:
                 full_text += "\n\n---\n\n## Image Generation Prompt\n\n" + image_prompt.strip()
 
-            requests = _markdown_to_requests(full_text)
-            if requests:
+            # Requests are applied in order, so splitting them across several
+            # calls is safe; it bounds the size of each request body.
+            for batch in _batched(_iter_markdown_requests(full_text), BATCH_UPDATE_SIZE):
                 self.service.documents().batchUpdate(
-                    documentId=doc_id, body={"requests": requests}
+                    documentId=doc_id, body={"requests": batch}
                 ).execute()
 
             # Move to folder if configured
@@ -148,99 +163,78 @@ class GoogleDocsClient:
             return DocResult(success=False, error=str(e))
 
 
-def _markdown_to_requests(text: str) -> list[dict[str, Any]]:
-    """Convert markdown text to Google Docs API batchUpdate requests.
+_HEADING_STYLES = {1: "HEADING_1", 2: "HEADING_2", 3: "HEADING_3"}
 
-    Handles: headings (#/##/###), **bold**, code blocks, bullet lists, [links](url).
-    """
-    requests: list[dict[str, Any]] = []
-    # Track formatting ranges to apply after all text is inserted
-    format_ops: list[dict[str, Any]] = []
 
+def _iter_segments(text: str) -> Iterator[tuple[str, int, bool, bool]]:
+    """Split markdown into (raw_text, heading_level, is_code, is_bullet) paragraphs."""
     lines = text.split("\n")
-    # We insert all text first, then apply formatting.
-    # Google Docs API inserts at index 1 (after the implicit newline).
-    # We build the full text and track ranges for formatting.
-
-    segments: list[dict[str, Any]] = []  # {text, heading, bold_ranges, code, bullet, links}
-
+    n_lines = len(lines)
     i = 0
-    while i < len(lines):
+    while i < n_lines:
         line = lines[i]
 
         # Code block
         if line.strip().startswith("```"):
             code_lines = []
             i += 1
-            while i < len(lines) and not lines[i].strip().startswith("```"):
+            while i < n_lines and not lines[i].strip().startswith("```"):
                 code_lines.append(lines[i])
                 i += 1
             i += 1  # skip closing ```
-            segments.append({"text": "\n".join(code_lines) + "\n", "code": True})
+            yield "\n".join(code_lines) + "\n", 0, True, False
             continue
 
-        # Heading
-        heading_match = re.match(r"^(#{1,3})\s+(.*)", line)
+        heading_match = _HEADING_RE.match(line)
+        bullet_match = None if heading_match else _BULLET_RE.match(line)
         if heading_match:
-            level = len(heading_match.group(1))
-            heading_text = heading_match.group(2)
-            segments.append({"text": heading_text + "\n", "heading": level})
-            i += 1
-            continue
+            yield heading_match.group(2) + "\n", len(heading_match.group(1)), False, False
+        elif _HRULE_RE.match(line.strip()):
+            yield "---\n", 0, False, False
+        elif bullet_match:
+            yield bullet_match.group(1) + "\n", 0, False, True
+        else:
+            yield line + "\n", 0, False, False
+        i += 1
 
-        # Horizontal rule
-        if re.match(r"^-{3,}$", line.strip()):
-            segments.append({"text": "---\n", "code": False})
-            i += 1
-            continue
 
-        # Bullet
-        bullet_match = re.match(r"^[-*]\s+(.*)", line)
-        if bullet_match:
-            segments.append({"text": bullet_match.group(1) + "\n", "bullet": True})
-            i += 1
-            continue
+def _iter_markdown_requests(text: str) -> Iterator[dict[str, Any]]:
+    """Yield Google Docs API batchUpdate requests for markdown text.
 
-        # Regular line
-        segments.append({"text": line + "\n", "code": False})
-        i += 1
+    Handles: headings (#/##/###), **bold**, code blocks, bullet lists, [links](url).
+    Inserts are yielded as they are produced; formatting ops are held back and
+    yielded after the last insert. Google Docs inserts at index 1 (after the
+    implicit newline).
+    """
+    format_ops: list[dict[str, Any]] = []
+    cursor = 1
 
-    # Now build the full document text and collect formatting
-    cursor = 1  # Docs start at index 1
-    for seg in segments:
-        raw = seg["text"]
-        # Extract inline formatting before inserting
-        # Process bold and links within the raw text
+    for raw, heading, code, bullet in _iter_segments(text):
         clean_text, inline_formats = _parse_inline(raw, cursor)
-
-        # Insert the clean text
-        requests.append({
+        yield {
             "insertText": {
                 "location": {"index": cursor},
                 "text": clean_text,
             }
-        })
-
-        seg_len = len(clean_text)
+        }
+        end = cursor + len(clean_text)
 
-        # Heading style
-        if seg.get("heading"):
-            level = seg["heading"]
-            named = {1: "HEADING_1", 2: "HEADING_2", 3: "HEADING_3"}
-            style = named.get(level, "HEADING_3")
+        if heading:
             format_ops.append({
                 "updateParagraphStyle": {
-                    "range": {"startIndex": cursor, "endIndex": cursor + seg_len},
-                    "paragraphStyle": {"namedStyleType": style},
+                    "range": {"startIndex": cursor, "endIndex": end},
+                    "paragraphStyle": {
+                        "namedStyleType": _HEADING_STYLES.get(heading, "HEADING_3"),
+                    },
                     "fields": "namedStyleType",
                 }
             })
 
         # Code block — monospace font
-        if seg.get("code"):
+        if code:
             format_ops.append({
                 "updateTextStyle": {
-                    "range": {"startIndex": cursor, "endIndex": cursor + seg_len},
+                    "range": {"startIndex": cursor, "endIndex": end},
                     "textStyle": {
                         "weightedFontFamily": {"fontFamily": "Courier New"},
                     },
@@ -248,70 +242,72 @@ def _markdown_to_requests(text: str) -> list[dict[str, Any]]:
                 }
             })
 
-        # Bullet
-        if seg.get("bullet"):
+        if bullet:
             format_ops.append({
                 "createParagraphBullets": {
-                    "range": {"startIndex": cursor, "endIndex": cursor + seg_len},
+                    "range": {"startIndex": cursor, "endIndex": end},
                     "bulletPreset": "BULLET_DISC_CIRCLE_SQUARE",
                 }
             })
 
         # Inline bold and link formatting
         format_ops.extend(inline_formats)
+        cursor = end
 
-        cursor += seg_len
+    yield from format_ops
+
+
+def _markdown_to_requests(text: str) -> list[dict[str, Any]]:
+    """Convert markdown text to Google Docs API batchUpdate requests."""
+    return list(_iter_markdown_requests(text))
 
-    # Append formatting ops after all inserts
-    requests.extend(format_ops)
-    return requests
+
+def _batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield successive lists of up to size items."""
+    it = iter(items)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
 
 
 def _parse_inline(
     text: str, base_offset: int
 ) -> tuple[str, list[dict[str, Any]]]:
-    """Strip inline markdown (**bold**, [text](url)) and return clean text + format ops."""
+    """Strip inline markdown (**bold**, [text](url)) and return clean text + format ops.
+
+    One scan over the text: plain runs between matches are copied through
+    and joined once at the end.
+    """
     formats: list[dict[str, Any]] = []
-    result = ""
+    parts: list[str] = []
+    length = 0
     pos = 0
 
-    while pos < len(text):
-        # Bold: **text**
-        bold_match = re.match(r"\*\*(.+?)\*\*", text[pos:])
-        if bold_match:
-            start = base_offset + len(result)
-            inner = bold_match.group(1)
-            result += inner
-            end = base_offset + len(result)
-            formats.append({
-                "updateTextStyle": {
-                    "range": {"startIndex": start, "endIndex": end},
-                    "textStyle": {"bold": True},
-                    "fields": "bold",
-                }
-            })
-            pos += bold_match.end()
-            continue
-
-        # Link: [text](url)
-        link_match = re.match(r"\[([^\]]+)\]\(([^)]+)\)", text[pos:])
-        if link_match:
-            start = base_offset + len(result)
-            link_text = link_match.group(1)
-            link_url = link_match.group(2)
-            result += link_text
-            end = base_offset + len(result)
-            formats.append({
-                "updateTextStyle": {
-                    "range": {"startIndex": start, "endIndex": end},
-                    "textStyle": {"link": {"url": link_url}},
-                    "fields": "link",
-                }
-            })
-            pos += link_match.end()
-            continue
-
-        result += text[pos]
-        pos += 1
+    for m in _INLINE_RE.finditer(text):
+        if m.start() > pos:
+            parts.append(text[pos:m.start()])
+            length += m.start() - pos
+        bold, link_text, link_url = m.groups()
+        inner = bold if bold is not None else link_text
+        start = base_offset + length
+        parts.append(inner)
+        length += len(inner)
+        if bold is not None:
+            style: dict[str, Any] = {"bold": True}
+            fields = "bold"
+        else:
+            style = {"link": {"url": link_url}}
+            fields = "link"
+        formats.append({
+            "updateTextStyle": {
+                "range": {"startIndex": start, "endIndex": base_offset + length},
+                "textStyle": style,
+                "fields": fields,
+            }
+        })
+        pos = m.end()
 
-    return result, formats
+    parts.append(text[pos:])
+    return "".join(parts), formats
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -13,11 +16,29 @@ logger = logging.getLogger(__name__)
 DEFAULT_IMAGE_PROMPTS_DIR = "~/Documents/image-prompts"
 
 
+@dataclass(slots=True)
+class Draft:
+    """A parsed draft block, as produced by the social/blog agents."""
+
+    title: str = "untitled"
+    image_prompt: str | None = None
+    posts: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Draft:
+        return cls(
+            title=data.get("draft_title", "untitled"),
+            image_prompt=data.get("image_prompt"),
+            posts=data.get("posts", []),
+        )
+
+
 def save_image_prompt(
     title: str,
     prompt_text: str,
     source: str = "social",
     output_dir: str = DEFAULT_IMAGE_PROMPTS_DIR,
+    dir_fd: int | None = None,
 ) -> Path | None:
     """Save an image generation prompt to a markdown file.
 
@@ -26,13 +47,16 @@ def save_image_prompt(
         prompt_text: The image generation prompt.
         source: Where this came from ("social", "blog").
         output_dir: Directory to write files to.
+        dir_fd: Optional open descriptor for output_dir (which must then
+            already exist); the file is created relative to it.
 
     Returns:
         Path to the saved file, or None on failure.
     """
     try:
         out = Path(output_dir).expanduser()
-        out.mkdir(parents=True, exist_ok=True)
+        if dir_fd is None:
+            out.mkdir(parents=True, exist_ok=True)
 
         date_str = datetime.now().strftime("%Y-%m-%d")
         slug = _slugify(title)
@@ -48,7 +72,16 @@ def save_image_prompt(
 
 {prompt_text.strip()}
 """
-        path.write_text(content)
+        if dir_fd is None:
+            path.write_text(content)
+        else:
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666, dir_fd=dir_fd)
+            try:
+                data = content.encode()
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
         logger.info("Saved image prompt to %s", path)
         return path
     except Exception as e:
@@ -56,47 +89,91 @@ def save_image_prompt(
         return None
 
 
-def extract_image_prompts(drafts: list[dict[str, Any]]) -> list[dict[str, str]]:
+def extract_image_prompts(
+    drafts: list[dict[str, Any]] | list[Draft],
+) -> list[dict[str, str]]:
     """Extract image_prompt fields from parsed draft blocks.
 
-    Returns list of dicts with 'title' and 'prompt' keys.
+    Accepts raw draft dicts or Draft objects; dicts are converted once up
+    front. Returns list of dicts with 'title' and 'prompt' keys.
     """
     prompts: list[dict[str, str]] = []
-    for draft in drafts:
-        prompt = draft.get("image_prompt", "").strip()
+    for draft in [d if isinstance(d, Draft) else Draft.from_dict(d) for d in drafts]:
+        prompt = (draft.image_prompt or "").strip()
         if prompt:
-            title = draft.get("draft_title", "untitled")
-            prompts.append({"title": title, "prompt": prompt})
+            prompts.append({"title": draft.title, "prompt": prompt})
     return prompts
 
 
 def save_all_image_prompts(
-    drafts: list[dict[str, Any]],
+    drafts: list[dict[str, Any]] | list[Draft],
     source: str = "social",
     output_dir: str = DEFAULT_IMAGE_PROMPTS_DIR,
 ) -> list[Path]:
     """Extract and save all image prompts from parsed drafts.
 
-    Returns list of paths to saved files.
+    Returns list of paths to saved files. Where supported, the output
+    directory is created and opened once and every file is written
+    relative to that descriptor, so the path is not re-resolved per draft.
     """
     extracted = extract_image_prompts(drafts)
+    if not extracted:
+        return []
+    dir_fd = _open_dir(output_dir)
     paths: list[Path] = []
-    for item in extracted:
-        path = save_image_prompt(
-            title=item["title"],
-            prompt_text=item["prompt"],
-            source=source,
-            output_dir=output_dir,
-        )
-        if path:
-            paths.append(path)
+    try:
+        for item in extracted:
+            path = save_image_prompt(
+                title=item["title"],
+                prompt_text=item["prompt"],
+                source=source,
+                output_dir=output_dir,
+                dir_fd=dir_fd,
+            )
+            if path:
+                paths.append(path)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
     return paths
 
 
+def _open_dir(output_dir: str) -> int | None:
+    """Create output_dir and open it for dir_fd-relative writes, or return None."""
+    if os.open not in os.supports_dir_fd or not hasattr(os, "O_DIRECTORY"):
+        return None
+    try:
+        out = Path(output_dir).expanduser()
+        out.mkdir(parents=True, exist_ok=True)
+        return os.open(out, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError as e:
+        logger.debug("Cannot open %s as a directory fd: %s", output_dir, e)
+        return None
+
+
+# ASCII fast path for _slugify: drop everything the regex path would strip
+# (not \w, whitespace or "-") and turn "_" into a separator.
+_SLUG_TABLE: dict[int, str | None] = {
+    c: None
+    for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in "-_")
+}
+_SLUG_TABLE[ord("_")] = " "
+
+
+@functools.lru_cache(maxsize=1024)
 def _slugify(text: str) -> str:
-    """Convert text to a filename-safe slug."""
+    """Convert text to a filename-safe slug (memoized; titles recur across runs)."""
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_]+", "-", text)
-    text = re.sub(r"-+", "-", text)
-    return text[:60].strip("-")
+    if not text.isascii():
+        text = re.sub(r"[^\w\s-]", "", text)
+        text = re.sub(r"[\s_]+", "-", text)
+        text = re.sub(r"-+", "-", text)
+        return text[:60].strip("-")
+    # Runs of whitespace/"-" collapse to one "-"; a leading separator is kept
+    # until after truncation, exactly as the regex path does.
+    text = text.translate(_SLUG_TABLE)
+    slug = "-".join(text.replace("-", " ").split())
+    if slug and (text[0] == "-" or text[0].isspace()):
+        slug = "-" + slug
+    return slug[:60].strip("-")
@@ -37,12 +37,15 @@ class TypefullyClient:
         enabled: bool = True,
         base_url: str = TYPEFULLY_BASE_URL,
         timeout: int = 30,
+        session: requests.Session | None = None,
     ) -> None:
         self.api_key = api_key
         self.social_set_id = social_set_id
         self.enabled = enabled
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        # One keep-alive session per client instead of a new one per call
+        self.session = session or requests.Session()
 
     @classmethod
     def from_config(cls, config: SocialManagerConfig) -> TypefullyClient:
@@ -102,7 +105,7 @@ class TypefullyClient:
             body["draft_title"] = draft_title
 
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 f"{self.base_url}/social-sets/{self.social_set_id}/drafts",
                 headers=self._headers(),
                 json=body,
@@ -134,7 +137,7 @@ class TypefullyClient:
             params["status"] = status
 
         try:
-            resp = requests.get(
+            resp = self.session.get(
                 f"{self.base_url}/social-sets/{self.social_set_id}/drafts",
                 headers=self._headers(),
                 params=params,
@@ -7,6 +7,9 @@ import logging
 import sys
 from typing import Any
 
+# Bound once; same output as json.dumps with default arguments
+_encode = json.JSONEncoder().encode
+
 
 class JsonFormatter(logging.Formatter):
     """JSON log formatter for structured output."""
@@ -19,10 +22,12 @@ class JsonFormatter(logging.Formatter):
             "message": record.getMessage(),
         }
         if record.exc_info and record.exc_info[0]:
-            log_entry["exception"] = self.formatException(
-                record.exc_info,
-            )
-        return json.dumps(log_entry)
+            # Cached on the record, as logging.Formatter does, so every
+            # handler formatting the same record reuses the traceback text
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_entry["exception"] = record.exc_text
+        return _encode(log_entry)
 
 
 def setup_logging(
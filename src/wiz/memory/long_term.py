@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections import defaultdict
 from pathlib import Path
 
 
@@ -14,6 +15,9 @@ class LongTermMemory:
         self.index_path = self.base_dir / "index.md"
         self.topics_dir = self.base_dir / "topics"
         self._index: dict[str, str] = {}
+        # Lookup structures over _index keys, rebuilt lazily after changes
+        self._trigrams: dict[str, set[str]] | None = None
+        self._key_lengths: list[int] = []
 
     def load_index(self) -> dict[str, str]:
         """Parse index.md into keyword->filename map.
@@ -21,6 +25,7 @@ class LongTermMemory:
         Expected format per line: `keyword: filename.md`
         """
         self._index = {}
+        self._trigrams = None
         if not self.index_path.exists():
             return {}
 
@@ -44,16 +49,45 @@ class LongTermMemory:
             lines.append(f"{keyword}: {filename}")
         self.index_path.write_text("\n".join(lines) + "\n")
 
+    def _build_lookup(self) -> dict[str, set[str]]:
+        """Map every 3-character substring of each keyword to its keywords."""
+        trigrams: dict[str, set[str]] = defaultdict(set)
+        for key in self._index:
+            for i in range(len(key) - 2):
+                trigrams[key[i:i + 3]].add(key)
+        self._trigrams = trigrams
+        self._key_lengths = sorted({len(key) for key in self._index})
+        return trigrams
+
+    def _matching_keywords(self, query: str) -> set[str]:
+        """Index keywords that contain query or are contained in it."""
+        trigrams = self._trigrams if self._trigrams is not None else self._build_lookup()
+        if len(query) < 3:
+            matched = {k for k in self._index if query in k}
+        else:
+            # A keyword containing query must contain all of query's trigrams
+            grams = {query[i:i + 3] for i in range(len(query) - 2)}
+            candidates = set.intersection(*(trigrams.get(g, set()) for g in grams))
+            matched = {k for k in candidates if query in k}
+        # Keywords inside query: check each window of a length some keyword has
+        for n in self._key_lengths:
+            if n > len(query):
+                break
+            for i in range(len(query) - n + 1):
+                if query[i:i + n] in self._index:
+                    matched.add(query[i:i + n])
+        return matched
+
     def retrieve(self, keywords: list[str]) -> list[tuple[str, str]]:
         """Find topics matching any of the given keywords (exact or partial).
 
-        Returns list of (keyword, content) tuples.
+        Returns list of (keyword, content) tuples, per query in index order.
         """
         results = []
         for query in keywords:
-            query_lower = query.lower()
+            matched = self._matching_keywords(query.lower())
             for index_keyword, filename in self._index.items():
-                if query_lower in index_keyword or index_keyword in query_lower:
+                if index_keyword in matched:
                     topic_path = self.topics_dir / filename
                     if topic_path.exists():
                         content = topic_path.read_text()
@@ -66,6 +100,7 @@ class LongTermMemory:
         topic_path = self.topics_dir / filename
         topic_path.write_text(content)
         self._index[keyword.lower()] = filename
+        self._trigrams = None
 
     def delete_topic(self, keyword: str) -> bool:
         """Remove a topic from index, delete its file, and persist the index."""
@@ -73,6 +108,7 @@ class LongTermMemory:
         if keyword_lower not in self._index:
             return False
         filename = self._index.pop(keyword_lower)
+        self._trigrams = None
         topic_path = self.topics_dir / filename
         if topic_path.exists():
             topic_path.unlink()
@@ -2,23 +2,69 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import re
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode()
+
+
+_dumps: Callable[[Any], bytes]
+_loads: Callable[[bytes | str], Any]
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # optional speedup: pip install wiz[fast]
+    _dumps = _json_dumps
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9._-]")
+
 
 class RejectionJournal:
     """Records and retrieves rejection feedback in JSONL format.
 
-    Storage: one JSONL file per repo under base_dir.
+    Storage: one JSONL file per repo under base_dir. A writer/reader pair
+    can be injected to keep entries elsewhere (e.g. an in-memory list in
+    tests): writer(entry) stores one entry, reader(repo) returns the stored
+    entries for a repo, or for all repos when repo is None.
     """
 
-    def __init__(self, base_dir: Path | str = "memory/rejections") -> None:
+    def __init__(
+        self,
+        base_dir: Path | str = "memory/rejections",
+        writer: Callable[[dict[str, Any]], None] | None = None,
+        reader: Callable[[str | None], Iterable[dict[str, Any]]] | None = None,
+    ) -> None:
         self.base_dir = Path(base_dir)
+        self._writer = writer
+        self._reader = reader
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _sanitize_repo(repo: str) -> str:
+        """Map a repo name to a journal filename stem.
+
+        "owner/repo" becomes "owner__repo"; other characters outside
+        [A-Za-z0-9._-] become "_" and leading dots are dropped, so the file
+        always lands directly under base_dir. Plain names are unchanged.
+        """
+        stem = _UNSAFE_FILENAME_RE.sub("_", repo.replace("/", "__")).lstrip(".")
+        return stem or "_"
+
+    def _path(self, repo: str) -> Path:
+        return self.base_dir / f"{self._sanitize_repo(repo)}.jsonl"
 
     def record(
         self,
@@ -29,56 +75,87 @@ class RejectionJournal:
         agent: str = "bug-fixer",
     ) -> None:
         """Append a rejection entry to the repo's journal file."""
-        self.base_dir.mkdir(parents=True, exist_ok=True)
-        entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+        self.record_many([{
             "repo": repo,
-            "issue": issue_number,
+            "issue_number": issue_number,
             "branch": branch,
             "feedback": feedback,
             "agent": agent,
-        }
-        path = self.base_dir / f"{repo}.jsonl"
-        with open(path, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        }])
         logger.debug("Recorded rejection for %s#%d", repo, issue_number)
 
-    def read(
-        self,
-        repo: str | None = None,
-        since: datetime | None = None,
-        limit: int = 100,
-    ) -> list[dict[str, Any]]:
-        """Read rejection entries with optional filters."""
-        entries: list[dict[str, Any]] = []
+    def record_many(self, rejections: Iterable[dict[str, Any]]) -> int:
+        """Append several rejections, opening each repo's journal file once.
+
+        Each item takes the keyword arguments of record(). Returns the
+        number of entries written.
+        """
+        entries = [
+            {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "repo": r["repo"],
+                "issue": r["issue_number"],
+                "branch": r["branch"],
+                "feedback": r["feedback"],
+                "agent": r.get("agent", "bug-fixer"),
+            }
+            for r in rejections
+        ]
+        if self._writer is not None:
+            for entry in entries:
+                self._writer(entry)
+            return len(entries)
+
+        by_repo: dict[str, list[bytes]] = {}
+        for entry in entries:
+            by_repo.setdefault(entry["repo"], []).append(_dumps(entry) + b"\n")
+        if by_repo:
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+        for repo, lines in by_repo.items():
+            with open(self._path(repo), "ab") as f:
+                f.writelines(lines)
+        return len(entries)
 
+    def _read_files(self, repo: str | None) -> Iterator[dict[str, Any]]:
+        """Yield the parsed entries of one repo's journal file, or of all of them."""
         if repo:
-            files = [self.base_dir / f"{repo}.jsonl"]
+            files = [self._path(repo)]
         else:
             if not self.base_dir.exists():
-                return []
+                return
             files = list(self.base_dir.glob("*.jsonl"))
 
         for path in files:
             if not path.exists():
                 continue
-            for line in path.read_text().splitlines():
+            for line in path.read_bytes().splitlines():
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
+                    yield _loads(line)
+                except ValueError:
                     continue
-                if since:
-                    ts = entry.get("timestamp", "")
-                    try:
-                        entry_time = datetime.fromisoformat(ts)
-                        if entry_time < since:
-                            continue
-                    except (ValueError, TypeError):
+
+    def read(
+        self,
+        repo: str | None = None,
+        since: datetime | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Read rejection entries with optional filters."""
+        source = self._reader(repo) if self._reader is not None else self._read_files(repo)
+        entries: list[dict[str, Any]] = []
+        for entry in source:
+            if since:
+                ts = entry.get("timestamp", "")
+                try:
+                    entry_time = datetime.fromisoformat(ts)
+                    if entry_time < since:
                         continue
-                entries.append(entry)
+                except (ValueError, TypeError):
+                    continue
+            entries.append(entry)
 
         # Sort by timestamp descending (most recent first)
         entries.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
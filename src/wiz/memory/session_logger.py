@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
+from typing import TextIO
 
 
 class SessionLogger:
@@ -15,34 +16,43 @@ class SessionLogger:
         self.retention_days = retention_days
         self._current_log: Path | None = None
         self._session_start: float | None = None
+        # Held open for the whole session; each line is flushed as written
+        self._fh: TextIO | None = None
 
     def start_session(self, name: str = "") -> Path:
         """Start a new session log. Returns the log file path."""
         self.log_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         suffix = f"_{name}" if name else ""
+        self._close()
         self._current_log = self.log_dir / f"session_{timestamp}{suffix}.log"
-        self._session_start = time.time()
+        self._fh = open(self._current_log, "a")  # noqa: SIM115 - closed in end_session
+        self._session_start = time.monotonic()
         self.log(f"Session started: {name or 'unnamed'}")
         return self._current_log
 
     def log(self, message: str) -> None:
         """Append a timestamped line to the current session log."""
-        if self._current_log is None:
+        if self._fh is None:
             return
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        line = f"[{timestamp}] {message}\n"
-        with open(self._current_log, "a") as f:
-            f.write(line)
+        self._fh.write(f"[{timestamp}] {message}\n")
+        self._fh.flush()
+
+    def _close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
     def end_session(self, summary: str = "") -> float:
         """End the current session. Returns elapsed seconds."""
         elapsed = 0.0
         if self._session_start is not None:
-            elapsed = time.time() - self._session_start
+            elapsed = time.monotonic() - self._session_start
         if summary:
             self.log(f"Summary: {summary}")
         self.log(f"Session ended ({elapsed:.1f}s)")
+        self._close()
         self._current_log = None
         self._session_start = None
         return elapsed
@@ -51,10 +61,10 @@ class SessionLogger:
         """Remove session logs older than retention period. Returns count removed."""
         if not self.log_dir.exists():
             return 0
-        cutoff = datetime.now() - timedelta(days=self.retention_days)
+        cutoff = time.time() - self.retention_days * 86400
         removed = 0
         for log_file in self.log_dir.glob("session_*.log"):
-            if datetime.fromtimestamp(log_file.stat().st_mtime) < cutoff:
+            if log_file.stat().st_mtime < cutoff:
                 log_file.unlink()
                 removed += 1
         return removed
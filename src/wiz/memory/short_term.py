@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from pathlib import Path
 
 
@@ -11,14 +12,14 @@ class ShortTermMemory:
     def __init__(self, path: Path, max_lines: int = 50) -> None:
         self.path = Path(path)
         self.max_lines = max_lines
-        self._lines: list[str] = []
+        # Bounded: appending past max_lines drops the oldest lines in O(1)
+        self._lines: deque[str] = deque(maxlen=max_lines)
 
     def load(self) -> list[str]:
-        """Load memory from file. Returns lines."""
+        """Load memory from file, keeping at most max_lines. Returns lines."""
+        self._lines.clear()
         if self.path.exists():
-            self._lines = self.path.read_text().splitlines()
-        else:
-            self._lines = []
+            self._lines.extend(self.path.read_text().splitlines())
         return list(self._lines)
 
     def save(self) -> None:
@@ -28,11 +29,7 @@ class ShortTermMemory:
 
     def append(self, text: str) -> None:
         """Append text, evicting oldest lines if over limit."""
-        new_lines = text.splitlines()
-        self._lines.extend(new_lines)
-        # Evict oldest lines if over limit
-        if len(self._lines) > self.max_lines:
-            self._lines = self._lines[-self.max_lines :]
+        self._lines.extend(text.splitlines())
 
     @property
     def lines(self) -> list[str]:
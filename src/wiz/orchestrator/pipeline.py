@@ -68,65 +68,70 @@ class DevCyclePipeline:
             strikes, self.config.agents.reviewer.max_review_cycles
         )
 
-        # Rejection journal for persistent learning
-        journal = RejectionJournal()
-
-        # Distributed locking (multi-machine) — only when machine_id is configured
-        distributed_locks: DistributedLockManager | None = None
-        if self.config.global_.machine_id:
-            distributed_locks = DistributedLockManager(
-                github, self.config.global_.machine_id
-            )
-            cleaned = distributed_locks.cleanup_stale()
-            if cleaned:
-                logger.info("Cleaned up %d stale distributed claims", cleaned)
-
-        for phase in phases:
-            remaining = self._time_remaining(start_time, cycle_timeout)
-            if remaining <= 0:
-                logger.warning("Cycle timeout reached, skipping %s", phase)
-                state.timed_out = True
-                break
-
-            logger.info(
-                "=== %s: %s (%.0fs remaining) ===", repo.name, phase, remaining
-            )
-            phase_start = time.time()
+        try:
+            # Rejection journal for persistent learning
+            journal = RejectionJournal()
+
+            # Distributed locking (multi-machine) — only when machine_id is configured
+            distributed_locks: DistributedLockManager | None = None
+            if self.config.global_.machine_id:
+                distributed_locks = DistributedLockManager(
+                    github, self.config.global_.machine_id
+                )
+                cleaned = distributed_locks.cleanup_stale()
+                if cleaned:
+                    logger.info("Cleaned up %d stale distributed claims", cleaned)
+
+            for phase in phases:
+                remaining = self._time_remaining(start_time, cycle_timeout)
+                if remaining <= 0:
+                    logger.warning("Cycle timeout reached, skipping %s", phase)
+                    state.timed_out = True
+                    break
+
+                logger.info(
+                    "=== %s: %s (%.0fs remaining) ===", repo.name, phase, remaining
+                )
+                phase_start = time.time()
+
+                try:
+                    if phase == "bug_hunt":
+                        result = self._run_bug_hunt(repo, github, remaining)
+                    elif phase == "bug_fix":
+                        result = self._run_bug_fix(
+                            repo, github, worktree, locks, remaining,
+                            distributed_locks=distributed_locks,
+                        )
+                    elif phase == "review":
+                        result = self._run_review(
+                            repo, github, prs, loop_tracker, remaining,
+                            distributed_locks=distributed_locks,
+                            rejection_journal=journal,
+                        )
+                    else:
+                        valid_phases = ["bug_hunt", "bug_fix", "review"]
+                        logger.warning(
+                            "Unknown phase: %s (valid: %s)", phase, ", ".join(valid_phases)
+                        )
+                        result = {"skipped": True, "reason": f"unknown_phase: {phase}"}
+                        phase_elapsed = time.time() - phase_start
+                        state.add_phase(phase, False, result, phase_elapsed)
+                        continue
 
-            try:
-                if phase == "bug_hunt":
-                    result = self._run_bug_hunt(repo, github, remaining)
-                elif phase == "bug_fix":
-                    result = self._run_bug_fix(
-                        repo, github, worktree, locks, remaining,
-                        distributed_locks=distributed_locks,
-                    )
-                elif phase == "review":
-                    result = self._run_review(
-                        repo, github, prs, loop_tracker, remaining,
-                        distributed_locks=distributed_locks,
-                        rejection_journal=journal,
-                    )
-                else:
-                    valid_phases = ["bug_hunt", "bug_fix", "review"]
-                    logger.warning(
-                        "Unknown phase: %s (valid: %s)", phase, ", ".join(valid_phases)
-                    )
-                    result = {"skipped": True, "reason": f"unknown_phase: {phase}"}
                     phase_elapsed = time.time() - phase_start
-                    state.add_phase(phase, False, result, phase_elapsed)
-                    continue
-
-                phase_elapsed = time.time() - phase_start
-                state.add_phase(phase, True, result, phase_elapsed)
+                    state.add_phase(phase, True, result, phase_elapsed)
 
-            except Exception as e:
-                phase_elapsed = time.time() - phase_start
-                logger.error("Phase %s failed: %s", phase, e, exc_info=True)
-                state.add_phase(phase, False, {"error": str(e)}, phase_elapsed)
-
-        # Worktree cleanup based on config
-        self._cleanup_worktrees(worktree)
+                except Exception as e:
+                    phase_elapsed = time.time() - phase_start
+                    logger.error("Phase %s failed: %s", phase, e, exc_info=True)
+                    state.add_phase(phase, False, {"error": str(e)}, phase_elapsed)
+
+            # Worktree cleanup based on config
+            self._cleanup_worktrees(worktree)
+        finally:
+            # Persist buffered review cycles, then release the strike database
+            loop_tracker.close()
+            strikes.close()
 
         state.total_elapsed = time.time() - start_time
         return state
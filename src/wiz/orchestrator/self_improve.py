@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import fnmatch
 import logging
+import os
+import re
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
 PROTECTED_PATTERNS = [
     "config/wiz.yaml",
     "CLAUDE.md",
@@ -22,21 +26,31 @@ class SelfImprovementGuard:
 
     def __init__(self, patterns: list[str] | None = None) -> None:
         self.patterns = patterns or PROTECTED_PATTERNS
+        # Plain paths are set lookups; the globs are OR-ed into one regex.
+        # normcase on both sides keeps fnmatch.fnmatch's semantics.
+        normalized = [os.path.normcase(p) for p in self.patterns]
+        globs = [p for p in normalized if _GLOB_CHARS.search(p)]
+        self._literals = frozenset(p for p in normalized if not _GLOB_CHARS.search(p))
+        self._glob_re = (
+            re.compile("|".join(fnmatch.translate(g) for g in globs)) if globs else None
+        )
 
     def is_protected(self, file_path: str) -> bool:
         """Check if a file matches any protected pattern."""
-        for pattern in self.patterns:
-            if fnmatch.fnmatch(file_path, pattern):
-                return True
-        return False
+        file_path = os.path.normcase(file_path)
+        if file_path in self._literals:
+            return True
+        return self._glob_re is not None and self._glob_re.match(file_path) is not None
 
     def validate_changes(self, changed_files: list[str]) -> dict[str, Any]:
         """Validate a list of changed files against protected patterns.
 
         Returns dict with protected files found and whether human review is needed.
         """
-        protected_found = [f for f in changed_files if self.is_protected(f)]
-        non_protected = [f for f in changed_files if not self.is_protected(f)]
+        protected_found: list[str] = []
+        non_protected: list[str] = []
+        for f in changed_files:
+            (protected_found if self.is_protected(f) else non_protected).append(f)
 
         return {
             "protected_files": protected_found,
@@ -4,6 +4,27 @@ from pathlib import Path
 
 import pytest
 
+from wiz.config.schema import SocialManagerConfig, TelegramConfig
+from wiz.coordination import _gh_http
+from wiz.coordination._json_cache import cache as github_json_cache
+from wiz.coordination.github_prs import clear_default_branch_cache
+
+
+@pytest.fixture(autouse=True)
+def _isolate_github(monkeypatch: pytest.MonkeyPatch):
+    """Keep tests on the gh CLI path and clear module-level GitHub caches."""
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.setattr(_gh_http, "_cli_token", None)
+    monkeypatch.setattr(_gh_http, "_cli_token_resolved", True)
+    _gh_http.reset_session()
+    clear_default_branch_cache()
+    github_json_cache.clear()
+    yield
+    _gh_http.reset_session()
+    clear_default_branch_cache()
+    github_json_cache.clear()
+
 
 @pytest.fixture
 def sample_config_yaml(tmp_path: Path) -> Path:
@@ -31,3 +52,15 @@ def empty_config_yaml(tmp_path: Path) -> Path:
     config = tmp_path / "wiz.yaml"
     config.write_text("{}\n")
     return config
+
+
+@pytest.fixture(scope="module")
+def base_social_config() -> SocialManagerConfig:
+    """Validated once per module; use .model_copy(update=...) for variants."""
+    return SocialManagerConfig(typefully_social_set_id=12345)
+
+
+@pytest.fixture(scope="module")
+def base_telegram_config() -> TelegramConfig:
+    """Validated once per module; use .model_copy(update=...) for variants."""
+    return TelegramConfig(enabled=True, bot_token="tok", chat_id="123")
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 from wiz.bridge.client import BridgeClient
 from wiz.bridge.monitor import BridgeEventMonitor
 from wiz.bridge.runner import SessionRunner, ensure_hooks
+from wiz.coordination._json_cache import cache as github_cache
 
 
 # All bridge session tests need ensure_hooks mocked to avoid touching real settings
@@ -237,6 +238,17 @@ class TestSessionRunner:
         call_args = mock_run.call_args
         assert call_args[0][0][:3] == ["codex", "exec", "--full-auto"]
 
+    @patch("wiz.bridge.runner.subprocess.run")
+    @patch("wiz.bridge.runner.shutil.which", return_value="/usr/bin/codex")
+    def test_session_drops_cached_github_reads(self, mock_which, mock_run):
+        """Agents write to GitHub out of process; reads after a session must refetch."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        github_cache.put(("u/r", "issues", ("wiz-bug",)), [{"number": 1}])
+
+        self._make_runner().run("test", "/tmp", "prompt", agent="codex", timeout=30)
+
+        assert github_cache.get(("u/r", "issues", ("wiz-bug",))) is None
+
     @patch("wiz.bridge.runner.shutil.which", return_value=None)
     def test_codex_not_installed(self, mock_which):
         runner = self._make_runner()
@@ -0,0 +1,61 @@
+"""Tests for the shared gh worker pool."""
+
+import subprocess
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from wiz.coordination import _exec
+
+
+class TestRunConcurrently:
+    def test_results_in_call_order(self):
+        assert _exec.run_concurrently([lambda: 1, lambda: 2, lambda: 3]) == [1, 2, 3]
+
+    def test_single_call_runs_inline(self):
+        caller = threading.current_thread()
+        result = _exec.run_concurrently([lambda: threading.current_thread()])
+        assert result == [caller]
+
+    def test_calls_overlap(self):
+        barrier = threading.Barrier(3, timeout=5)
+        assert sorted(_exec.run_concurrently([barrier.wait] * 3)) == [0, 1, 2]
+
+    def test_reraises_after_all_finish(self):
+        done = []
+
+        def _fail():
+            raise ValueError("boom")
+
+        def _slow():
+            done.append(True)
+
+        with pytest.raises(ValueError):
+            _exec.run_concurrently([_fail, _slow])
+        assert done == [True]
+
+    def test_pool_is_shared(self):
+        assert _exec.get_pool() is _exec.get_pool()
+
+
+class TestRunGhMany:
+    @patch("wiz.coordination._exec.subprocess.run")
+    def test_runs_each_command_unchecked(self, mock_run):
+        mock_run.side_effect = lambda cmd, **kw: MagicMock(returncode=len(cmd))
+        results = _exec.run_gh_many([["gh", "a"], ["gh", "b", "c"]], timeout=5)
+        assert [r.returncode for r in results] == [2, 3]
+        assert mock_run.call_args[1]["check"] is False
+        assert mock_run.call_args[1]["timeout"] == 5
+
+    @patch("wiz.coordination._exec.subprocess.run")
+    def test_missing_gh_propagates(self, mock_run):
+        mock_run.side_effect = FileNotFoundError(2, "No such file or directory")
+        with pytest.raises(FileNotFoundError):
+            _exec.run_gh_many([["gh", "a"], ["gh", "b"]])
+
+    @patch("wiz.coordination._exec.subprocess.run")
+    def test_timeout_propagates(self, mock_run):
+        mock_run.side_effect = subprocess.TimeoutExpired("gh", 30)
+        with pytest.raises(subprocess.TimeoutExpired):
+            _exec.run_gh_many([["gh", "a"]])
@@ -0,0 +1,179 @@
+"""Tests for the pooled GitHub REST transport."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from wiz.coordination import _gh_http
+from wiz.coordination._gh_http import GhApiError
+
+
+def _response(status_code=200, payload=None, etag=None):
+    resp = MagicMock(status_code=status_code)
+    resp.content = json.dumps(payload).encode() if payload is not None else b""
+    resp.headers = {"ETag": etag} if etag else {}
+    return resp
+
+
+class TestSession:
+    def test_unavailable_without_token(self):
+        assert _gh_http.available() is False
+        assert _gh_http.get_session() is None
+
+    def test_request_without_token_raises(self):
+        with pytest.raises(GhApiError):
+            _gh_http.request("GET", "/repos/user/repo")
+
+    def test_session_is_shared(self, monkeypatch):
+        monkeypatch.setenv("GH_TOKEN", "tok")
+        first = _gh_http.get_session()
+        assert first is not None
+        assert _gh_http.get_session() is first
+        assert first.headers["Authorization"] == "Bearer tok"
+
+    def test_github_token_fallback(self, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKEN", "other")
+        assert _gh_http.get_token() == "other"
+
+
+class TestCliToken:
+    @pytest.fixture(autouse=True)
+    def _unresolved(self, monkeypatch):
+        monkeypatch.setattr(_gh_http, "_cli_token_resolved", False)
+
+    @patch("wiz.coordination._gh_http.subprocess.run")
+    def test_gh_auth_token_read_once(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="gho_abc\n", returncode=0)
+        assert _gh_http.get_token() == "gho_abc"
+        assert _gh_http.get_token() == "gho_abc"
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0] == ["gh", "auth", "token"]
+
+    @patch("wiz.coordination._gh_http.subprocess.run")
+    def test_env_token_skips_gh(self, mock_run, monkeypatch):
+        monkeypatch.setenv("GH_TOKEN", "env")
+        assert _gh_http.get_token() == "env"
+        mock_run.assert_not_called()
+
+    @patch("wiz.coordination._gh_http.subprocess.run")
+    def test_missing_gh_cached_as_unavailable(self, mock_run):
+        mock_run.side_effect = FileNotFoundError(2, "No such file or directory")
+        assert _gh_http.available() is False
+        assert _gh_http.available() is False
+        assert mock_run.call_count == 1
+
+
+class TestRequest:
+    @pytest.fixture(autouse=True)
+    def _token(self, monkeypatch):
+        monkeypatch.setenv("GH_TOKEN", "tok")
+
+    @patch("requests.Session.request")
+    def test_returns_parsed_json(self, mock_request):
+        mock_request.return_value = _response(200, {"number": 1})
+        assert _gh_http.request("GET", "/repos/user/repo/issues/1") == {"number": 1}
+        assert mock_request.call_args[0] == (
+            "GET", "https://api.github.com/repos/user/repo/issues/1",
+        )
+
+    @patch("requests.Session.request")
+    def test_invalid_json_raises(self, mock_request):
+        resp = _response(200)
+        resp.content = b"<html>"
+        mock_request.return_value = resp
+        with pytest.raises(GhApiError):
+            _gh_http.request("GET", "/x")
+
+    @patch("requests.Session.request")
+    def test_no_content_returns_none(self, mock_request):
+        mock_request.return_value = _response(204)
+        assert _gh_http.request("DELETE", "/x") is None
+
+    @patch("requests.Session.request")
+    def test_http_error_carries_status(self, mock_request):
+        mock_request.return_value = _response(422, {"message": "exists"})
+        with pytest.raises(GhApiError) as exc:
+            _gh_http.request("POST", "/x")
+        assert exc.value.status_code == 422
+
+    @patch("requests.Session.request")
+    def test_transport_error_wrapped(self, mock_request):
+        mock_request.side_effect = requests.ConnectionError("down")
+        with pytest.raises(GhApiError):
+            _gh_http.request("GET", "/x")
+
+    @patch("requests.Session.request")
+    def test_get_304_returns_cached_body(self, mock_request):
+        mock_request.side_effect = [
+            _response(200, {"number": 42}, etag='W/"abc"'),
+            _response(304),
+        ]
+        first = _gh_http.request("GET", "/repos/user/repo/issues/42")
+        second = _gh_http.request("GET", "/repos/user/repo/issues/42")
+        assert first == second == {"number": 42}
+        assert mock_request.call_args_list[0][1]["headers"] is None
+        assert mock_request.call_args_list[1][1]["headers"] == {"If-None-Match": 'W/"abc"'}
+
+    @patch("requests.Session.request")
+    def test_etag_keyed_by_params(self, mock_request):
+        mock_request.side_effect = [
+            _response(200, [1], etag='"p1"'),
+            _response(200, [2], etag='"p2"'),
+        ]
+        _gh_http.request("GET", "/x", params={"page": 1})
+        _gh_http.request("GET", "/x", params={"page": 2})
+        assert mock_request.call_args_list[1][1]["headers"] is None
+
+    @patch("requests.Session.request")
+    def test_changed_resource_replaces_etag(self, mock_request):
+        mock_request.side_effect = [
+            _response(200, {"v": 1}, etag='"1"'),
+            _response(200, {"v": 2}, etag='"2"'),
+            _response(304),
+        ]
+        _gh_http.request("GET", "/x")
+        assert _gh_http.request("GET", "/x") == {"v": 2}
+        assert _gh_http.request("GET", "/x") == {"v": 2}
+        assert mock_request.call_args[1]["headers"] == {"If-None-Match": '"2"'}
+
+    @patch("requests.Session.request")
+    def test_writes_are_unconditional(self, mock_request):
+        mock_request.return_value = _response(200, {"ok": True}, etag='"w"')
+        _gh_http.request("POST", "/x")
+        _gh_http.request("POST", "/x")
+        assert mock_request.call_args[1]["headers"] is None
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_paginate_stops_on_short_page(self, mock_request):
+        mock_request.side_effect = [[{"n": i} for i in range(100)], [{"n": 100}]]
+        items = _gh_http.paginate("/x", limit=150)
+        assert len(items) == 101
+        assert mock_request.call_count == 2
+
+
+class TestNormalize:
+    def test_issue_from_rest(self):
+        issue = _gh_http.issue_from_rest({
+            "number": 3, "title": "Bug", "state": "open",
+            "html_url": "https://github.com/u/r/issues/3", "body": None,
+            "labels": [{"name": "wiz-bug", "color": "fff"}],
+            "user": {"login": "alice"},
+        })
+        assert issue == {
+            "number": 3, "title": "Bug", "labels": [{"name": "wiz-bug"}],
+            "state": "OPEN", "url": "https://github.com/u/r/issues/3",
+            "body": "", "author": {"login": "alice"},
+        }
+
+    def test_issue_from_rest_null_user(self):
+        assert _gh_http.issue_from_rest({"number": 1, "user": None})["author"] is None
+
+    def test_pr_from_rest_merged(self):
+        pr = _gh_http.pr_from_rest({
+            "number": 5, "state": "closed", "merged_at": "2026-01-01T00:00:00Z",
+            "head": {"ref": "fix/5"},
+        })
+        assert pr["state"] == "MERGED"
+        assert pr["headRefName"] == "fix/5"
@@ -2,8 +2,13 @@
 
 import json
 import subprocess
+import threading
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from wiz.coordination._gh_http import GhApiError
+from wiz.coordination._json_cache import cache as _cache
 from wiz.coordination.github_issues import GitHubIssues
 
 
@@ -46,6 +51,11 @@ class TestGitHubIssues:
         mock_run.return_value = MagicMock(stdout="", returncode=0)
         assert self.gh.list_issues() == []
 
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_list_issues_invalid_json(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="not json", returncode=0)
+        assert self.gh.list_issues() == []
+
     @patch("wiz.coordination.github_issues.subprocess.run")
     def test_add_comment(self, mock_run):
         mock_run.return_value = MagicMock(returncode=0)
@@ -58,6 +68,42 @@ class TestGitHubIssues:
         # ensure_labels (1 call) + add-label + remove-label = 3
         assert mock_run.call_count == 3
 
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_update_labels_runs_edits_concurrently(self, mock_run):
+        # Both edits must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _run(cmd, **kwargs):
+            if "edit" in cmd:
+                barrier.wait()
+            return MagicMock(returncode=0)
+
+        mock_run.side_effect = _run
+        assert self.gh.update_labels(1, add=["a"], remove=["b"]) is True
+        edits = [c[0][0] for c in mock_run.call_args_list if "edit" in c[0][0]]
+        assert {e[4] for e in edits} == {"--add-label", "--remove-label"}
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_update_labels_edit_failure_returns_false(self, mock_run):
+        def _run(cmd, **kwargs):
+            if "--remove-label" in cmd:
+                raise subprocess.CalledProcessError(1, "gh")
+            return MagicMock(returncode=0)
+
+        mock_run.side_effect = _run
+        assert self.gh.update_labels(1, add=["a"], remove=["b"]) is False
+
+    @patch("wiz.coordination.github_issues.run_gh_many")
+    def test_ensure_labels_single_batch(self, mock_many):
+        mock_many.return_value = [MagicMock(returncode=0), MagicMock(returncode=1)]
+        self.gh.ensure_labels(["a", "b", "a"])
+        assert mock_many.call_count == 1
+        assert len(mock_many.call_args[0][0]) == 2
+        assert self.gh._ensured_labels == {"a"}
+        mock_many.return_value = [MagicMock(returncode=0)]
+        self.gh.ensure_labels(["a", "b"])
+        assert [c[3] for c in mock_many.call_args[0][0]] == ["b"]
+
     @patch("wiz.coordination.github_issues.subprocess.run")
     def test_close_issue(self, mock_run):
         mock_run.return_value = MagicMock(returncode=0)
@@ -84,6 +130,107 @@ class TestGitHubIssues:
         )
         assert self.gh.check_duplicate("new bug") is False
 
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_check_duplicate_reuses_snapshot(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps([{"title": "Existing Bug"}]),
+            returncode=0,
+        )
+        assert self.gh.check_duplicate("existing bug") is True
+        assert self.gh.check_duplicate("other bug") is False
+        assert mock_run.call_count == 1
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_check_duplicate_seeded_by_list_issues(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps([{"title": "Existing Bug"}]),
+            returncode=0,
+        )
+        self.gh.list_issues()
+        _cache.clear()
+        assert self.gh.check_duplicate("never seen") is False
+        assert self.gh.check_duplicate("Existing Bug") is True
+        assert mock_run.call_count == 1
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_labelled_listing_does_not_seed_duplicates(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps([{"title": "Labelled Bug"}]),
+            returncode=0,
+        )
+        self.gh.list_issues(labels=["wiz-bug"])
+        assert self.gh._open_titles is None
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_create_issue_updates_duplicate_snapshot(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps([{"title": "Existing Bug"}]),
+            returncode=0,
+        )
+        self.gh.check_duplicate("anything")
+        mock_run.return_value = MagicMock(
+            stdout="https://github.com/user/repo/issues/2\n", returncode=0,
+        )
+        self.gh.create_issue("New Bug", "body")
+        assert self.gh.check_duplicate("new bug") is True
+
+    @patch("wiz.coordination.github_issues.time.monotonic")
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_duplicate_snapshot_expires_with_cache_ttl(self, mock_run, mock_clock):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps([{"title": "Existing Bug"}]),
+            returncode=0,
+        )
+        mock_clock.return_value = 1000.0
+        self.gh.check_duplicate("existing bug")
+        mock_run.return_value = MagicMock(stdout="[]", returncode=0)
+        mock_clock.return_value = 1000.0 + _cache.ttl + 1
+        assert self.gh.check_duplicate("existing bug") is False
+        assert mock_run.call_count == 2
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_close_issue_drops_duplicate_snapshot(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps([{"title": "Existing Bug"}]),
+            returncode=0,
+        )
+        self.gh.check_duplicate("existing bug")
+        self.gh.close_issue(1)
+        mock_run.return_value = MagicMock(stdout="[]", returncode=0)
+        assert self.gh.check_duplicate("existing bug") is False
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_get_issues_batches_single_call(self, mock_run):
+        payload = {"data": {"repository": {
+            "i0": {"number": 1, "title": "A", "labels": {"nodes": [{"name": "wiz-bug"}]}},
+            "i1": {"number": 2, "title": "B", "labels": {"nodes": []}},
+            "i2": None,
+        }}}
+        mock_run.return_value = MagicMock(stdout=json.dumps(payload), returncode=1)
+        result = self.gh.get_issues([1, 2, 3])
+        assert mock_run.call_count == 1
+        assert set(result) == {1, 2}
+        assert result[1]["labels"] == [{"name": "wiz-bug"}]
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:3] == ["gh", "api", "graphql"]
+        assert "owner=user" in cmd
+        assert "name=repo" in cmd
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_get_issues_empty_input(self, mock_run):
+        assert self.gh.get_issues([]) == {}
+        mock_run.assert_not_called()
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_get_issues_filters_by_author(self, mock_run):
+        gh = GitHubIssues("user/repo", allowed_authors=["trusted"])
+        payload = {"data": {"repository": {
+            "i0": {"number": 1, "author": {"login": "trusted"}},
+            "i1": {"number": 2, "author": {"login": "attacker"}},
+        }}}
+        mock_run.return_value = MagicMock(stdout=json.dumps(payload), returncode=0)
+        assert set(gh.get_issues([1, 2])) == {1}
+
     @patch("wiz.coordination.github_issues.subprocess.run")
     def test_get_issue_success(self, mock_run):
         issue_data = {"number": 42, "title": "Bug", "labels": [], "state": "OPEN"}
@@ -114,6 +261,86 @@ class TestGitHubIssues:
         assert self.gh.add_comment(1, "text") is False
 
 
+class TestResponseCache:
+    def setup_method(self):
+        self.gh = GitHubIssues("user/repo")
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_get_issue_second_call_hits_cache(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps({"number": 42, "title": "Bug"}), returncode=0,
+        )
+        self.gh.get_issue(42)
+        assert GitHubIssues("user/repo").get_issue(42)["title"] == "Bug"
+        assert mock_run.call_count == 1
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_add_comment_invalidates_cache(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps({"number": 42, "title": "Bug"}), returncode=0,
+        )
+        self.gh.get_issue(42)
+        self.gh.add_comment(42, "note")
+        self.gh.get_issue(42)
+        assert mock_run.call_count == 3
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_update_labels_invalidates_issue_and_lists(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps([{"number": 42, "title": "Bug"}]), returncode=0,
+        )
+        self.gh.list_issues(labels=["wiz-bug"])
+        self.gh.update_labels(42, remove=["wiz-bug"])
+        self.gh.list_issues(labels=["wiz-bug"])
+        assert mock_run.call_count == 3
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_list_issues_keyed_by_labels(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="[]", returncode=0)
+        self.gh.list_issues(labels=["wiz-bug"])
+        self.gh.list_issues(labels=["needs-fix"])
+        assert mock_run.call_count == 2
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_list_result_is_a_copy(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps([{"number": 1, "title": "Bug"}]), returncode=0,
+        )
+        issues = self.gh.list_issues()
+        issues += [{"number": 2}]
+        assert len(self.gh.list_issues()) == 1
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_issue_dicts_are_copies(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps([{"number": 1, "title": "Bug", "labels": [{"name": "a"}]}]),
+            returncode=0,
+        )
+        issue = self.gh.list_issues()[0]
+        issue["title"] = "edited"
+        issue["labels"].append({"name": "b"})
+        assert self.gh.list_issues()[0] == {
+            "number": 1, "title": "Bug", "labels": [{"name": "a"}],
+        }
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_get_issue_is_a_copy(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps({"number": 42, "title": "Bug"}), returncode=0,
+        )
+        self.gh.get_issue(42)["title"] = "edited"
+        assert self.gh.get_issue(42)["title"] == "Bug"
+        assert mock_run.call_count == 1
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_errors_not_cached(self, mock_run):
+        mock_run.side_effect = subprocess.CalledProcessError(1, "gh")
+        assert self.gh.get_issue(42) is None
+        mock_run.side_effect = None
+        mock_run.return_value = MagicMock(stdout=json.dumps({"number": 42}), returncode=0)
+        assert self.gh.get_issue(42) is not None
+
+
 class TestAuthorFiltering:
     """Tests for procedural author allowlist — security boundary."""
 
@@ -185,6 +412,10 @@ class TestAuthorFiltering:
         issues = [{"number": 1, "author": {"login": "anyone"}}]
         assert len(gh._filter_by_author(issues)) == 1
 
+    def test_allowlist_compiled_once(self):
+        gh = GitHubIssues("user/repo", allowed_authors=["Alice", "BOB", "alice"])
+        assert gh._allowed_authors == frozenset({"alice", "bob"})
+
     @patch("wiz.coordination.github_issues.subprocess.run")
     def test_list_issues_filters_by_author(self, mock_run):
         gh = GitHubIssues("user/repo", allowed_authors=["trusted"])
@@ -207,6 +438,22 @@ class TestAuthorFiltering:
         fields = cmd[json_arg_idx + 1]
         assert "author" in fields
 
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_list_issues_field_projection_keeps_author(self, mock_run):
+        gh = GitHubIssues("user/repo")
+        mock_run.return_value = MagicMock(stdout="[]", returncode=0)
+        gh.list_issues(fields=("number", "title"))
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("--json") + 1] == "number,title,author"
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    def test_check_duplicate_skips_bodies(self, mock_run):
+        gh = GitHubIssues("user/repo")
+        mock_run.return_value = MagicMock(stdout="[]", returncode=0)
+        gh.check_duplicate("title")
+        cmd = mock_run.call_args[0][0]
+        assert "body" not in cmd[cmd.index("--json") + 1]
+
     @patch("wiz.coordination.github_issues.subprocess.run")
     def test_get_issue_rejects_unauthorized(self, mock_run):
         gh = GitHubIssues("user/repo", allowed_authors=["trusted"])
@@ -316,3 +563,116 @@ class TestGetComments:
             stdout=json.dumps({"comments": []}), returncode=0,
         )
         assert self.gh.get_comments(42) == []
+
+
+class TestRestTransport:
+    """With a token in the environment, calls bypass the gh CLI."""
+
+    @pytest.fixture(autouse=True)
+    def _token(self, monkeypatch):
+        monkeypatch.setenv("GH_TOKEN", "tok")
+
+    def setup_method(self):
+        self.gh = GitHubIssues("user/repo", allowed_authors=["trusted"])
+
+    @patch("wiz.coordination.github_issues.subprocess.run")
+    @patch("wiz.coordination._gh_http.request")
+    def test_get_issue_uses_api(self, mock_request, mock_run):
+        mock_request.return_value = {
+            "number": 42, "title": "Bug", "state": "open", "labels": [],
+            "user": {"login": "trusted"},
+        }
+        issue = self.gh.get_issue(42)
+        assert issue["number"] == 42
+        assert issue["author"] == {"login": "trusted"}
+        assert mock_request.call_args[0] == ("GET", "/repos/user/repo/issues/42")
+        mock_run.assert_not_called()
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_get_issue_rejects_unauthorized(self, mock_request):
+        mock_request.return_value = {"number": 42, "user": {"login": "attacker"}}
+        assert self.gh.get_issue(42) is None
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_list_issues_skips_pull_requests(self, mock_request):
+        mock_request.return_value = [
+            {"number": 1, "user": {"login": "trusted"}},
+            {"number": 2, "user": {"login": "trusted"}, "pull_request": {}},
+        ]
+        result = self.gh.list_issues(labels=["wiz-bug", "p1"])
+        assert [i["number"] for i in result] == [1]
+        params = mock_request.call_args[1]["params"]
+        assert params["labels"] == "wiz-bug,p1"
+        assert params["state"] == "open"
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_create_issue(self, mock_request):
+        mock_request.return_value = {"html_url": "https://github.com/user/repo/issues/7"}
+        url = self.gh.create_issue("Title", "Body", labels=["wiz-bug"])
+        assert url == "https://github.com/user/repo/issues/7"
+        method, path = mock_request.call_args[0]
+        assert (method, path) == ("POST", "/repos/user/repo/issues")
+        assert mock_request.call_args[1]["json_body"]["labels"] == ["wiz-bug"]
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_list_issues_projection(self, mock_request):
+        mock_request.return_value = [{"number": 1, "title": "A", "body": "long", "user": None}]
+        self.gh = GitHubIssues("user/repo")
+        assert self.gh.list_issues(fields=("number", "title")) == [
+            {"number": 1, "title": "A", "author": None},
+        ]
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_add_comment(self, mock_request):
+        mock_request.return_value = {"id": 1}
+        assert self.gh.add_comment(3, "hello") is True
+        assert mock_request.call_args[0] == ("POST", "/repos/user/repo/issues/3/comments")
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_update_labels_ignores_missing_label_on_remove(self, mock_request):
+        # The add and the remove run concurrently, so answer by method, not call order
+        def respond(method, path, **kwargs):
+            if method == "DELETE":
+                raise GhApiError("gone", status_code=404)
+            return {"labels": []}
+
+        mock_request.side_effect = respond
+        assert self.gh.update_labels(3, add=["a"], remove=["b"]) is True
+        assert {c[0] for c in mock_request.call_args_list} == {
+            ("POST", "/repos/user/repo/issues/3/labels"),
+            ("DELETE", "/repos/user/repo/issues/3/labels/b"),
+        }
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_close_issue(self, mock_request):
+        mock_request.return_value = {}
+        assert self.gh.close_issue(3) is True
+        assert mock_request.call_args[1]["json_body"] == {"state": "closed"}
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_api_error_returns_failure(self, mock_request):
+        mock_request.side_effect = GhApiError("boom", status_code=500)
+        assert self.gh.get_issue(1) is None
+        assert self.gh.list_issues() == []
+        assert self.gh.add_comment(1, "x") is False
+        assert self.gh.create_issue("t", "b") is None
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_ensure_labels_tolerates_existing(self, mock_request):
+        mock_request.side_effect = GhApiError("exists", status_code=422)
+        self.gh.ensure_labels(["wiz-bug"])
+        assert "wiz-bug" in self.gh._ensured_labels
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_get_issues_single_graphql_post(self, mock_request):
+        mock_request.return_value = {"data": {"repository": {
+            "i0": {"number": 5, "author": {"login": "trusted"}, "labels": {"nodes": []}},
+        }}}
+        result = self.gh.get_issues([5, 5])
+        assert list(result) == [5]
+        assert mock_request.call_count == 1
+        method, path = mock_request.call_args[0]
+        assert (method, path) == ("POST", "/graphql")
+        body = mock_request.call_args[1]["json_body"]
+        assert body["variables"] == {"owner": "user", "name": "repo"}
+        assert body["query"].count("issue(number:") == 1
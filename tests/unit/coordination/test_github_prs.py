@@ -4,6 +4,10 @@ import json
 import subprocess
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from wiz.coordination import github_prs
+from wiz.coordination._gh_http import GhApiError
 from wiz.coordination.github_prs import GitHubPRs
 
 
@@ -76,6 +80,78 @@ class TestMergePR:
         assert "--delete-branch" not in cmd
 
 
+class TestDefaultBranch:
+    @patch("wiz.coordination.github_prs.subprocess.run")
+    def test_get_default_branch_caches_result(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="develop\n", returncode=0)
+        prs = GitHubPRs("user/repo")
+        assert prs.get_default_branch() == "develop"
+        assert prs.get_default_branch() == "develop"
+        assert mock_run.call_count == 1
+
+    @patch("wiz.coordination.github_prs.subprocess.run")
+    def test_cache_shared_across_instances(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="develop\n", returncode=0)
+        GitHubPRs("user/repo").get_default_branch()
+        assert GitHubPRs("user/repo").get_default_branch() == "develop"
+        assert mock_run.call_count == 1
+
+    @patch("wiz.coordination.github_prs.subprocess.run")
+    def test_cache_keyed_by_repo(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="develop\n", returncode=0)
+        GitHubPRs("user/repo").get_default_branch()
+        GitHubPRs("user/other").get_default_branch()
+        assert mock_run.call_count == 2
+
+    @patch("wiz.coordination.github_prs.time.monotonic")
+    @patch("wiz.coordination.github_prs.subprocess.run")
+    def test_cache_expires(self, mock_run, mock_clock):
+        mock_run.return_value = MagicMock(stdout="develop\n", returncode=0)
+        mock_clock.return_value = 1000.0
+        GitHubPRs("user/repo").get_default_branch()
+        mock_clock.return_value = 1000.0 + github_prs.DEFAULT_BRANCH_TTL + 1
+        GitHubPRs("user/repo").get_default_branch()
+        assert mock_run.call_count == 2
+
+    @patch("wiz.coordination.github_prs.subprocess.run")
+    def test_failure_not_cached(self, mock_run):
+        mock_run.side_effect = subprocess.CalledProcessError(1, "gh")
+        assert GitHubPRs("user/repo").get_default_branch() == "main"
+        mock_run.side_effect = None
+        mock_run.return_value = MagicMock(stdout="develop\n", returncode=0)
+        assert GitHubPRs("user/repo").get_default_branch() == "develop"
+
+
+class TestResponseCache:
+    @patch("wiz.coordination.github_prs.subprocess.run")
+    def test_get_pr_second_call_hits_cache(self, mock_run):
+        mock_run.return_value = MagicMock(stdout=json.dumps({"number": 1}), returncode=0)
+        GitHubPRs("user/repo").get_pr(1)
+        GitHubPRs("user/repo").get_pr(1)
+        assert mock_run.call_count == 1
+
+    @patch("wiz.coordination.github_prs.subprocess.run")
+    def test_merge_invalidates_pr(self, mock_run):
+        mock_run.return_value = MagicMock(stdout=json.dumps({"number": 1}), returncode=0)
+        prs = GitHubPRs("user/repo")
+        prs.get_pr(1)
+        prs.merge_pr(1)
+        prs.get_pr(1)
+        assert mock_run.call_count == 3
+
+    @patch("wiz.coordination.github_prs.subprocess.run")
+    def test_get_pr_is_a_copy(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps({"number": 1, "title": "Fix", "files": [{"path": "a.py"}]}),
+            returncode=0,
+        )
+        prs = GitHubPRs("user/repo")
+        pr = prs.get_pr(1)
+        pr["title"] = "edited"
+        pr["files"][0]["path"] = "b.py"
+        assert prs.get_pr(1) == {"number": 1, "title": "Fix", "files": [{"path": "a.py"}]}
+
+
 class TestGhMissing:
     """Regression tests for missing gh CLI (FileNotFoundError)."""
 
@@ -96,3 +172,54 @@ class TestGhMissing:
     def test_get_pr_returns_none_when_gh_missing(self, mock_run):
         mock_run.side_effect = FileNotFoundError(2, "No such file or directory")
         assert self.prs.get_pr(1) is None
+
+
+class TestRestTransport:
+    """With a token in the environment, calls bypass the gh CLI."""
+
+    @pytest.fixture(autouse=True)
+    def _token(self, monkeypatch):
+        monkeypatch.setenv("GH_TOKEN", "tok")
+
+    def setup_method(self):
+        self.prs = GitHubPRs("user/repo")
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_get_default_branch(self, mock_request):
+        mock_request.return_value = {"default_branch": "develop"}
+        assert self.prs.get_default_branch() == "develop"
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_create_pr(self, mock_request):
+        mock_request.return_value = {"html_url": "https://github.com/user/repo/pull/2"}
+        url = self.prs.create_pr("Fix", "Body", head="fix/2", base="main")
+        assert url == "https://github.com/user/repo/pull/2"
+        assert mock_request.call_args[1]["json_body"]["head"] == "fix/2"
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_get_pr_includes_files(self, mock_request):
+        mock_request.side_effect = [
+            {"number": 1, "state": "open", "head": {"ref": "fix/1"}},
+            [{"filename": "src/a.py", "additions": 2, "deletions": 1}],
+        ]
+        pr = self.prs.get_pr(1)
+        assert pr["headRefName"] == "fix/1"
+        assert pr["files"] == [{"path": "src/a.py", "additions": 2, "deletions": 1}]
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_merge_pr_deletes_branch(self, mock_request):
+        mock_request.side_effect = [
+            {"merged": True},
+            {"head": {"ref": "fix/1", "repo": {"full_name": "user/repo"}}},
+            None,
+        ]
+        assert self.prs.merge_pr(1) is True
+        assert mock_request.call_args_list[0][1]["json_body"] == {"merge_method": "squash"}
+        assert mock_request.call_args_list[2][0] == (
+            "DELETE", "/repos/user/repo/git/refs/heads/fix/1",
+        )
+
+    @patch("wiz.coordination._gh_http.request")
+    def test_merge_pr_failure(self, mock_request):
+        mock_request.side_effect = GhApiError("conflict", status_code=405)
+        assert self.prs.merge_pr(1) is False
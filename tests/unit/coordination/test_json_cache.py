@@ -0,0 +1,59 @@
+"""Tests for the parsed GitHub response cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from wiz.coordination._json_cache import ParsedJsonCache
+
+
+class TestParsedJsonCache:
+    def test_get_or_fetch_loads_once(self):
+        cache = ParsedJsonCache()
+        loader = MagicMock(return_value={"number": 1})
+        assert cache.get_or_fetch(("r", "issue", 1), loader) == {"number": 1}
+        assert cache.get_or_fetch(("r", "issue", 1), loader) == {"number": 1}
+        assert loader.call_count == 1
+
+    def test_none_not_cached(self):
+        cache = ParsedJsonCache()
+        loader = MagicMock(return_value=None)
+        cache.get_or_fetch("k", loader)
+        cache.get_or_fetch("k", loader)
+        assert loader.call_count == 2
+
+    def test_loader_error_propagates(self):
+        cache = ParsedJsonCache()
+        with pytest.raises(RuntimeError):
+            cache.get_or_fetch("k", MagicMock(side_effect=RuntimeError))
+        assert cache.get("k") is None
+
+    @patch("wiz.coordination._json_cache.time.monotonic")
+    def test_entries_expire(self, mock_clock):
+        cache = ParsedJsonCache(ttl=10)
+        mock_clock.return_value = 100.0
+        cache.put("k", [1])
+        mock_clock.return_value = 109.0
+        assert cache.get("k") == [1]
+        mock_clock.return_value = 110.0
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self):
+        cache = ParsedJsonCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_invalidate_prefix(self):
+        cache = ParsedJsonCache()
+        cache.put(("r", "issues", ("bug",)), [])
+        cache.put(("r", "issues", ()), [])
+        cache.put(("r", "issue", 1), {})
+        cache.put(("other", "issues", ()), [])
+        cache.invalidate_prefix("r", "issues")
+        assert cache.get(("r", "issues", ())) is None
+        assert cache.get(("r", "issue", 1)) == {}
+        assert cache.get(("other", "issues", ())) == []
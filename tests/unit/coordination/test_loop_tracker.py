@@ -1,7 +1,9 @@
 """Tests for loop tracker."""
 
+import gc
 from pathlib import Path
 
+from wiz.coordination import loop_tracker
 from wiz.coordination.loop_tracker import LoopTracker
 from wiz.coordination.strikes import StrikeTracker
 
@@ -29,3 +31,44 @@ class TestLoopTracker:
         tracker.record_cycle(1, "b")
         assert tracker.is_max_reached(1) is True
         assert tracker.is_max_reached(2) is False
+
+    def test_flush_on_close(self, tmp_path: Path):
+        sf = tmp_path / "strikes.json"
+        tracker = LoopTracker(StrikeTracker(sf), max_cycles=5)
+        for _ in range(3):
+            tracker.record_cycle(1, "rejected")
+        assert StrikeTracker(sf).get_issue_strikes(1) == 0
+        tracker.close()
+        assert StrikeTracker(sf).get_issue_strikes(1) == 3
+        assert StrikeTracker(sf).get_issue_history(1) == ["rejected"] * 3
+
+    def test_flushes_every_n_cycles(self, tmp_path: Path):
+        sf = tmp_path / "strikes.json"
+        tracker = LoopTracker(StrikeTracker(sf), max_cycles=5, flush_every=2)
+        tracker.record_cycle(1, "a")
+        tracker.record_cycle(2, "b")
+        reopened = StrikeTracker(sf)
+        assert reopened.get_issue_strikes(1) == 1
+        assert reopened.get_issue_strikes(2) == 1
+
+    def test_continues_from_persisted_count(self, tmp_path: Path):
+        strikes = StrikeTracker(tmp_path / "strikes.json")
+        strikes.record_issue_strike(1, "earlier run")
+        tracker = LoopTracker(strikes, max_cycles=2)
+        assert tracker.record_cycle(1, "again") == 2
+        assert tracker.is_max_reached(1) is True
+
+    def test_exit_hook_flushes_live_trackers(self, tmp_path: Path):
+        strikes = StrikeTracker(tmp_path / "strikes.json")
+        tracker = LoopTracker(strikes)
+        tracker.record_cycle(42, "rejected")
+        loop_tracker._flush_at_exit()
+        assert strikes.get_issue_strikes(42) == 1
+
+    def test_collected_trackers_not_retained(self, tmp_path: Path):
+        strikes = StrikeTracker(tmp_path / "strikes.json")
+        before = len(loop_tracker._live)
+        for _ in range(5):
+            LoopTracker(strikes)
+        gc.collect()
+        assert len(loop_tracker._live) == before
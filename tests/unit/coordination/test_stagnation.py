@@ -43,3 +43,11 @@ class TestStagnationDetector:
         for _ in range(10):
             assert det.check(files_changed=True) is False
         assert det.count == 0
+
+    def test_trips_at_limit_again_after_change(self):
+        det = StagnationDetector(limit=3)
+        results = [det.check(files_changed=changed) for changed in (
+            False, False, True, False, False, False,
+        )]
+        assert results == [False, False, False, False, False, True]
+        assert det.count == 3
@@ -1,12 +1,16 @@
 """Tests for strike tracker."""
 
+import json
+import sqlite3
 from pathlib import Path
 
-from wiz.coordination.strikes import StrikeTracker
+import pytest
+
+from wiz.coordination.strikes import _FLAGGED_FILES, StrikeTracker
 
 
 class TestStrikeTracker:
-    def test_json_persistence(self, tmp_path: Path):
+    def test_persistence(self, tmp_path: Path):
         sf = tmp_path / ".wiz" / "strikes.json"
         tracker = StrikeTracker(sf)
         tracker.record_issue_strike(1, "bad fix")
@@ -54,6 +58,73 @@ class TestStrikeTracker:
         tracker.record_file_failure("src/a.py", 1)  # Duplicate issue
         tracker.record_file_failure("src/a.py", 2)
         # Should have count=3 but only 2 unique issues
-        data = tracker._data["files"]["src/a.py"]
-        assert data["count"] == 3
-        assert len(data["issues"]) == 2
+        assert tracker.get_file_failures("src/a.py") == 3
+        assert tracker.get_file_issues("src/a.py") == [1, 2]
+
+    def test_issue_history(self, tmp_path: Path):
+        tracker = StrikeTracker(tmp_path / "strikes.json")
+        tracker.record_issue_strike(1, "first")
+        tracker.record_issue_strike(1, "second")
+        assert tracker.get_issue_history(1) == ["first", "second"]
+
+    def test_uses_wal_database(self, tmp_path: Path):
+        tracker = StrikeTracker(tmp_path / "strikes.json")
+        tracker.record_issue_strike(1, "x")
+        assert (tmp_path / "strikes.db").exists()
+        conn = sqlite3.connect(tmp_path / "strikes.db")
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+    def test_migrates_legacy_json(self, tmp_path: Path):
+        legacy = tmp_path / "strikes.json"
+        legacy.write_text(json.dumps({
+            "issues": {"7": {"count": 2, "history": ["a", "b"]}},
+            "files": {"src/x.py": {"count": 3, "issues": [7, 8]}},
+        }))
+        tracker = StrikeTracker(legacy)
+        assert tracker.get_issue_strikes(7) == 2
+        assert tracker.get_issue_history(7) == ["a", "b"]
+        assert tracker.get_flagged_files(max_strikes=3) == ["src/x.py"]
+        assert tracker.get_file_issues("src/x.py") == [7, 8]
+        assert not legacy.exists()
+        # Second open must not import again
+        assert StrikeTracker(legacy).record_issue_strike(7, "c") == 3
+
+    def test_corrupt_legacy_json_ignored(self, tmp_path: Path):
+        legacy = tmp_path / "strikes.json"
+        legacy.write_text("{not json")
+        tracker = StrikeTracker(legacy)
+        assert tracker.get_issue_strikes(1) == 0
+
+    def test_corrupt_database_reset(self, tmp_path: Path):
+        (tmp_path / "strikes.db").write_text("garbage that is not sqlite" * 100)
+        tracker = StrikeTracker(tmp_path / "strikes.json")
+        assert tracker.record_issue_strike(1, "x") == 1
+
+    def test_locked_database_not_reset(self, tmp_path: Path, monkeypatch):
+        tracker = StrikeTracker(tmp_path / "strikes.json")
+        tracker.record_issue_strike(1, "x")
+        tracker.close()
+
+        def locked(self):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(StrikeTracker, "_open", locked)
+        with pytest.raises(sqlite3.OperationalError):
+            StrikeTracker(tmp_path / "strikes.json")
+        monkeypatch.undo()
+        assert StrikeTracker(tmp_path / "strikes.json").get_issue_strikes(1) == 1
+
+    def test_flagged_files_uses_count_index(self, tmp_path: Path):
+        tracker = StrikeTracker(tmp_path / "strikes.json")
+        for i in range(200):
+            tracker.record_file_failure(f"src/f{i}.py", 1)
+        for _ in range(2):
+            tracker.record_file_failure("src/f7.py", 2)
+        assert tracker.get_flagged_files(max_strikes=3) == ["src/f7.py"]
+        conn = sqlite3.connect(tmp_path / "strikes.db")
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {_FLAGGED_FILES}", (3,)).fetchall()
+        conn.close()
+        details = [row[-1] for row in plan]
+        assert any("USING INDEX files_by_count" in d for d in details)
+        assert not any(d.startswith("SCAN") or "TEMP B-TREE" in d for d in details)
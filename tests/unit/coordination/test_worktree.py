@@ -1,45 +1,74 @@
 """Tests for worktree manager."""
 
+import shutil
 import subprocess
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from wiz.coordination.worktree import WorktreeManager
 
 
-class TestWorktreeManager:
-    def setup_method(self):
-        self.wt = WorktreeManager(Path("/tmp/repo"))
+class FakeRun:
+    """Stand-in for subprocess.run that records commands and always succeeds."""
 
-    @patch("wiz.coordination.worktree.subprocess.run")
-    def test_create(self, mock_run):
-        # First call: _branch_exists (rev-parse) → fails (branch doesn't exist)
-        # Second call: worktree add -b → succeeds
-        mock_run.side_effect = [
-            subprocess.CalledProcessError(1, "git"),  # _branch_exists → False
-            MagicMock(returncode=0),  # worktree add -b
-        ]
-        path = self.wt.create("fix", 42)
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], dict]] = []
+        self.stdout = ""
+
+    def __call__(self, cmd, **kwargs):
+        self.calls.append((cmd, kwargs))
+        return SimpleNamespace(returncode=0, stdout=self.stdout, stderr="")
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    fake = FakeRun()
+    monkeypatch.setattr("wiz.coordination.worktree.subprocess.run", fake)
+    return fake
+
+
+@pytest.fixture(scope="module")
+def wt():
+    """Shared manager for the mocked tests; it keeps no per-test state."""
+    return WorktreeManager(Path("/tmp/repo"))
+
+
+class TestWorktreeManager:
+    @pytest.mark.parametrize("branch_exists, expect_b", [(False, True), (True, False)])
+    def test_create(self, fake_run, wt, monkeypatch, branch_exists, expect_b):
+        """One worktree add; -b only when the branch doesn't exist yet."""
+        monkeypatch.setattr(WorktreeManager, "_read_branch_ref", lambda self, b: branch_exists)
+        path = wt.create("fix", 42)
         assert path == Path("/tmp/repo/.worktrees/fix-42")
-        cmd = mock_run.call_args_list[1][0][0]
-        assert "worktree" in cmd
-        assert "add" in cmd
-        assert "-b" in cmd
+        assert len(fake_run.calls) == 1
+        cmd = fake_run.calls[-1][0]
+        assert cmd[1:3] == ["worktree", "add"]
+        assert ("-b" in cmd) is expect_b
         assert "fix/42" in cmd
 
     @patch("wiz.coordination.worktree.subprocess.run")
-    def test_create_existing_branch(self, mock_run):
-        """When the branch already exists, worktree add without -b."""
+    def test_create_retries_when_branch_exists(self, mock_run, wt):
+        """Unreadable refs: -b fails on an existing branch, retry without it."""
         mock_run.side_effect = [
-            MagicMock(returncode=0),  # _branch_exists → True
-            MagicMock(returncode=0),  # worktree add (no -b)
+            subprocess.CalledProcessError(
+                128, "git", stderr="fatal: a branch named 'fix/42' already exists\n",
+            ),
+            MagicMock(returncode=0),
         ]
-        path = self.wt.create("fix", 42)
-        assert path == Path("/tmp/repo/.worktrees/fix-42")
-        cmd = mock_run.call_args_list[1][0][0]
-        assert "worktree" in cmd
-        assert "add" in cmd
-        assert "-b" not in cmd
+        wt.create("fix", 42)
+        assert mock_run.call_count == 2
+        assert "-b" in mock_run.call_args_list[0][0][0]
+        assert "-b" not in mock_run.call_args_list[1][0][0]
+
+    @patch("wiz.coordination.worktree.subprocess.run")
+    def test_create_other_failure_raises(self, mock_run, wt):
+        mock_run.side_effect = subprocess.CalledProcessError(128, "git", stderr="fatal: bad")
+        with pytest.raises(subprocess.CalledProcessError):
+            wt.create("fix", 42)
+        assert mock_run.call_count == 1
 
     @patch("wiz.coordination.worktree.subprocess.run")
     def test_create_existing_returns_path(self, mock_run, tmp_path):
@@ -50,43 +79,135 @@ class TestWorktreeManager:
         assert path == wt_path
         mock_run.assert_not_called()
 
-    @patch("wiz.coordination.worktree.subprocess.run")
-    def test_remove(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0)
-        assert self.wt.remove("fix", 42) is True
+    def test_remove(self, fake_run, wt):
+        assert wt.remove("fix", 42) is True
+        assert fake_run.calls[0][0][1:3] == ["worktree", "remove"]
+        assert fake_run.calls[-1][0] == ["git", "branch", "-D", "fix/42"]
 
     @patch("wiz.coordination.worktree.subprocess.run")
-    def test_remove_failure(self, mock_run):
+    def test_remove_failure(self, mock_run, wt):
         mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-        assert self.wt.remove("fix", 42) is False
+        assert wt.remove("fix", 42) is False
 
-    @patch("wiz.coordination.worktree.subprocess.run")
-    def test_push(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0)
-        assert self.wt.push("fix", 42) is True
-        cmd = mock_run.call_args[0][0]
+    def test_push(self, fake_run, wt):
+        assert wt.push("fix", 42) is True
+        cmd = fake_run.calls[-1][0]
         assert "push" in cmd
         assert "fix/42" in cmd
 
     @patch("wiz.coordination.worktree.subprocess.run")
-    def test_push_failure(self, mock_run):
+    def test_push_failure(self, mock_run, wt):
         mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-        assert self.wt.push("fix", 42) is False
+        assert wt.push("fix", 42) is False
 
-    @patch("wiz.coordination.worktree.subprocess.run")
-    def test_list_worktrees(self, mock_run):
-        mock_run.return_value = MagicMock(
-            stdout=(
-                "worktree /tmp/repo\nbranch refs/heads/main\n\n"
-                "worktree /tmp/repo/.worktrees/fix-1\n"
-                "branch refs/heads/fix/1\n"
-            ),
-            returncode=0,
+    def test_list_worktrees(self, fake_run, wt):
+        fake_run.stdout = (
+            "worktree /tmp/repo\nbranch refs/heads/main\n\n"
+            "worktree /tmp/repo/.worktrees/fix-1\n"
+            "branch refs/heads/fix/1\n"
         )
-        result = self.wt.list_worktrees()
+        result = wt.list_worktrees()
         assert len(result) == 2
+        assert fake_run.calls[-1][0] == ["git", "worktree", "list", "--porcelain"]
 
     @patch("wiz.coordination.worktree.subprocess.run")
-    def test_list_worktrees_error(self, mock_run):
+    def test_list_worktrees_error(self, mock_run, wt):
         mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-        assert self.wt.list_worktrees() == []
+        assert wt.list_worktrees() == []
+
+
+class TestReadBranchRef:
+    def _repo(self, tmp_path):
+        (tmp_path / ".git" / "refs" / "heads").mkdir(parents=True)
+        return WorktreeManager(tmp_path)
+
+    def test_loose_ref(self, tmp_path):
+        wt = self._repo(tmp_path)
+        ref = tmp_path / ".git" / "refs" / "heads" / "fix" / "42"
+        ref.parent.mkdir()
+        ref.write_text("0" * 40 + "\n")
+        assert wt._read_branch_ref("fix/42") is True
+
+    def test_packed_ref(self, tmp_path):
+        wt = self._repo(tmp_path)
+        (tmp_path / ".git" / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted\n"
+            f"{'a' * 40} refs/heads/fix/42\n"
+            f"^{'b' * 40}\n"
+        )
+        assert wt._read_branch_ref("fix/42") is True
+        assert wt._read_branch_ref("fix/4") is False
+
+    def test_missing(self, tmp_path):
+        assert self._repo(tmp_path)._read_branch_ref("fix/42") is False
+
+    def test_linked_worktree_uses_common_dir(self, tmp_path):
+        main = tmp_path / "main"
+        ref = main / ".git" / "refs" / "heads" / "fix" / "42"
+        ref.parent.mkdir(parents=True)
+        ref.write_text("0" * 40 + "\n")
+        wt_git = main / ".git" / "worktrees" / "fix-42"
+        wt_git.mkdir(parents=True)
+        (wt_git / "commondir").write_text("../..\n")
+        linked = tmp_path / "linked"
+        linked.mkdir()
+        (linked / ".git").write_text(f"gitdir: {wt_git}\n")
+        assert WorktreeManager(linked)._read_branch_ref("fix/42") is True
+
+    def test_no_git_dir_is_unknown(self, tmp_path):
+        assert WorktreeManager(tmp_path)._read_branch_ref("fix/42") is None
+
+    def test_reftable_is_unknown(self, tmp_path):
+        (tmp_path / ".git" / "reftable").mkdir(parents=True)
+        assert WorktreeManager(tmp_path)._read_branch_ref("fix/42") is None
+
+
+@pytest.fixture(scope="class")
+def _template_repo(tmp_path_factory):
+    """A one-commit git repo built once per class; tests work on copies."""
+    repo = tmp_path_factory.mktemp("template") / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=repo, check=True)
+    (repo / "README.md").write_text("init\n")
+    subprocess.run(["git", "add", "."], cwd=repo, check=True)
+    subprocess.run(
+        ["git", "-c", "user.email=test@test.com", "-c", "user.name=Test",
+         "commit", "-q", "-m", "init"],
+        cwd=repo, check=True,
+    )
+    return repo
+
+
+@pytest.fixture
+def git_repo(_template_repo, tmp_path):
+    """A private copy of the template repo (cheaper than re-running git)."""
+    return Path(shutil.copytree(_template_repo, tmp_path / "repo", symlinks=True))
+
+
+def _branch_ref_exists(repo: Path, branch: str) -> bool:
+    """Check for a branch via the loose ref or packed-refs, without running git."""
+    git_dir = repo / ".git"
+    if (git_dir / "refs" / "heads" / branch).is_file():
+        return True
+    packed = git_dir / "packed-refs"
+    return packed.exists() and f" refs/heads/{branch}\n" in packed.read_text()
+
+
+@pytest.mark.integration
+class TestWorktreeExistingBranchIntegration:
+    """Real git: create() must reuse a branch left behind by an earlier run."""
+
+    def test_create_reuses_existing_branch(self, git_repo):
+        subprocess.run(["git", "branch", "fix/42"], cwd=git_repo, check=True)
+        path = WorktreeManager(git_repo).create("fix", 42)
+        assert path.is_dir()
+        head = subprocess.run(
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+            cwd=path, capture_output=True, text=True, check=True,
+        )
+        assert head.stdout.strip() == "fix/42"
+
+    def test_create_new_branch_real_repo(self, git_repo):
+        path = WorktreeManager(git_repo).create("feature", 99)
+        assert path.is_dir()
+        assert _branch_ref_exists(git_repo, "feature/99")
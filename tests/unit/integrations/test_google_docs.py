@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from wiz.config.schema import GoogleDocsConfig
 from wiz.integrations.google_docs import (
+    BATCH_UPDATE_SIZE,
     DocResult,
     GoogleDocsClient,
     _markdown_to_requests,
@@ -14,10 +16,51 @@ from wiz.integrations.google_docs import (
 )
 
 
+class FakeService:
+    """Stand-in for the Docs/Drive API clients.
+
+    documents()/files() return the service itself; create/batchUpdate/update
+    record their kwargs and return a request whose execute() gives the
+    configured response (raised if it is an exception).
+    """
+
+    def __init__(self, responses=None):
+        self.responses = responses or {}
+        self.calls: list[tuple[str, dict]] = []
+
+    def documents(self):
+        return self
+
+    def files(self):
+        return self
+
+    def _call(self, name, kwargs):
+        self.calls.append((name, kwargs))
+        return SimpleNamespace(execute=lambda: self._respond(name))
+
+    def _respond(self, name):
+        response = self.responses.get(name, {})
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def create(self, **kwargs):
+        return self._call("create", kwargs)
+
+    def batchUpdate(self, **kwargs):
+        return self._call("batchUpdate", kwargs)
+
+    def update(self, **kwargs):
+        return self._call("update", kwargs)
+
+    def called(self, name):
+        return [kwargs for n, kwargs in self.calls if n == name]
+
+
 class TestGoogleDocsClient:
-    def _make_client(self, enabled=True, folder_id=""):
-        service = MagicMock()
-        drive_service = MagicMock()
+    def _make_client(self, enabled=True, folder_id="", create=None):
+        service = FakeService({"create": create or {"documentId": "doc123"}})
+        drive_service = FakeService()
         return GoogleDocsClient(
             service=service,
             drive_service=drive_service,
@@ -33,56 +76,57 @@ class TestGoogleDocsClient:
 
     def test_create_document_success(self):
         client = self._make_client()
-        client.service.documents().create().execute.return_value = {
-            "documentId": "doc123"
-        }
-        client.service.documents().batchUpdate().execute.return_value = {}
 
         result = client.create_document("Test Doc", "# Hello\n\nWorld")
         assert result.success is True
         assert result.doc_id == "doc123"
         assert result.url == "https://docs.google.com/document/d/doc123/edit"
+        assert client.service.called("create") == [{"body": {"title": "Test Doc"}}]
+        assert [c["documentId"] for c in client.service.called("batchUpdate")] == ["doc123"]
 
-    def test_create_document_with_image_prompt(self):
+    def test_create_document_batches_long_docs(self):
         client = self._make_client()
-        client.service.documents().create().execute.return_value = {
-            "documentId": "doc456"
-        }
-        client.service.documents().batchUpdate().execute.return_value = {}
+        body = "\n".join(f"- item **{i}**" for i in range(200))
+
+        result = client.create_document("Long", body)
+        assert result.success is True
+        batches = [c["body"]["requests"] for c in client.service.called("batchUpdate")]
+        assert len(batches) == 2  # 200 inserts + 400 format ops
+        assert all(len(b) <= BATCH_UPDATE_SIZE for b in batches)
+        assert [r for b in batches for r in b] == _markdown_to_requests(body)
+
+    def test_create_document_with_image_prompt(self):
+        client = self._make_client(create={"documentId": "doc456"})
 
         result = client.create_document(
             "Post", "Content here", image_prompt="A futuristic city"
         )
         assert result.success is True
-        # Verify batchUpdate was called (content includes image prompt section)
-        client.service.documents().batchUpdate.assert_called()
+        # Content includes the image prompt section
+        (call,) = client.service.called("batchUpdate")
+        inserted = "".join(
+            r["insertText"]["text"] for r in call["body"]["requests"] if "insertText" in r
+        )
+        assert "A futuristic city" in inserted
 
     def test_create_document_moves_to_folder(self):
-        client = self._make_client(folder_id="folder789")
-        client.service.documents().create().execute.return_value = {
-            "documentId": "doc_move"
-        }
-        client.service.documents().batchUpdate().execute.return_value = {}
-        client.drive_service.files().update().execute.return_value = {}
+        client = self._make_client(folder_id="folder789", create={"documentId": "doc_move"})
 
         result = client.create_document("Title", "Body")
         assert result.success is True
-        client.drive_service.files().update.assert_called()
+        (update,) = client.drive_service.called("update")
+        assert update["fileId"] == "doc_move"
+        assert update["addParents"] == "folder789"
 
     def test_create_document_no_folder_skip_move(self):
-        client = self._make_client(folder_id="")
-        client.service.documents().create().execute.return_value = {
-            "documentId": "doc_nofolder"
-        }
-        client.service.documents().batchUpdate().execute.return_value = {}
+        client = self._make_client(folder_id="", create={"documentId": "doc_nofolder"})
 
         result = client.create_document("Title", "Body")
         assert result.success is True
-        client.drive_service.files().update.assert_not_called()
+        assert client.drive_service.called("update") == []
 
     def test_create_document_handles_api_error(self):
-        client = self._make_client()
-        client.service.documents().create().execute.side_effect = Exception("API down")
+        client = self._make_client(create=Exception("API down"))
 
         result = client.create_document("Title", "Body")
         assert result.success is False
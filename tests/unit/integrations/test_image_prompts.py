@@ -1,8 +1,10 @@
 """Tests for image prompt saving."""
 
+import os
 from pathlib import Path
 
 from wiz.integrations.image_prompts import (
+    Draft,
     _slugify,
     extract_image_prompts,
     save_all_image_prompts,
@@ -24,6 +26,11 @@ class TestSlugify:
     def test_collapses_whitespace(self):
         assert _slugify("too   many   spaces") == "too-many-spaces"
 
+    def test_cache_hits(self):
+        _slugify.cache_clear()
+        assert _slugify("Repeated Title") == _slugify("Repeated Title")
+        assert _slugify.cache_info().hits == 1
+
 
 class TestExtractImagePrompts:
     def test_extracts_from_drafts(self):
@@ -58,6 +65,11 @@ class TestExtractImagePrompts:
         result = extract_image_prompts(drafts)
         assert result[0]["title"] == "untitled"
 
+    def test_accepts_draft_objects(self):
+        drafts = [Draft(title="Typed", image_prompt=" A harbour "), Draft(title="None")]
+        result = extract_image_prompts(drafts)
+        assert result == [{"title": "Typed", "prompt": "A harbour"}]
+
 
 class TestSaveImagePrompt:
     def test_saves_file(self, tmp_path):
@@ -107,6 +119,37 @@ class TestSaveAllImagePrompts:
         files = list(tmp_path.glob("*.md"))
         assert len(files) == 2
 
+    def test_writes_relative_to_dir_fd(self, tmp_path, monkeypatch):
+        opened = []
+        real_open = os.open
+
+        def spy_open(path, flags, *args, **kwargs):
+            opened.append(kwargs.get("dir_fd"))
+            return real_open(path, flags, *args, **kwargs)
+
+        monkeypatch.setattr("wiz.integrations.image_prompts.os.open", spy_open)
+        monkeypatch.setattr("wiz.integrations.image_prompts.os.supports_dir_fd", {spy_open})
+        out = tmp_path / "new"
+        drafts = [
+            {"draft_title": "Post A", "image_prompt": "Prompt A"},
+            {"draft_title": "Post B", "image_prompt": "Prompt B"},
+        ]
+        paths = save_all_image_prompts(drafts, output_dir=str(out))
+        assert sorted(p.name[11:] for p in paths) == ["post-a.md", "post-b.md"]
+        assert "Prompt B" in paths[1].read_text()
+        # One directory open, then two files created relative to it
+        assert opened[0] is None
+        assert len(opened) == 3 and None not in opened[1:]
+
+    def test_without_dir_fd_support(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "wiz.integrations.image_prompts.os.supports_dir_fd", frozenset(),
+        )
+        drafts = [{"draft_title": "Post A", "image_prompt": "Prompt A"}]
+        paths = save_all_image_prompts(drafts, output_dir=str(tmp_path / "x"))
+        assert len(paths) == 1
+        assert "Prompt A" in paths[0].read_text()
+
     def test_empty_drafts(self, tmp_path):
         paths = save_all_image_prompts([], output_dir=str(tmp_path))
         assert paths == []
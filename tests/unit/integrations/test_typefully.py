@@ -1,12 +1,67 @@
 """Tests for Typefully REST client."""
 
-from unittest.mock import MagicMock, patch
+import inspect
+import json
+from collections import deque
+from unittest.mock import patch
 
 import pytest
+import requests
+from requests.adapters import BaseAdapter
 
-from wiz.config.schema import SocialManagerConfig
 from wiz.integrations.typefully import DraftResult, TypefullyClient
 
+pytestmark = pytest.mark.xdist_group("http_mocks")
+
+_CREATE_DRAFT_SIG = inspect.signature(TypefullyClient.create_draft)
+
+
+class FakeAdapter(BaseAdapter):
+    """Transport adapter that answers from a queue and records requests."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[requests.PreparedRequest] = []
+        self._queue: deque = deque()
+        self.session = requests.Session()
+        self.session.mount("https://", self)
+
+    def enqueue(self, status: int, json_body=None, text: str = "") -> None:
+        self._queue.append((status, json_body, text))
+
+    def enqueue_error(self, exc: Exception) -> None:
+        self._queue.append(exc)
+
+    def send(self, request, **kwargs):
+        self.calls.append(request)
+        item = self._queue.popleft()
+        if isinstance(item, Exception):
+            raise item
+        status, json_body, text = item
+        resp = requests.Response()
+        resp.status_code = status
+        resp._content = json.dumps(json_body).encode() if json_body is not None else text.encode()
+        resp.encoding = "utf-8"
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+    def close(self) -> None:
+        pass
+
+    def last_json(self):
+        return json.loads(self.calls[-1].body)
+
+
+@pytest.fixture
+def fake_typefully():
+    return FakeAdapter()
+
+
+@pytest.fixture
+def client(fake_typefully):
+    return TypefullyClient(api_key="key", social_set_id=100, session=fake_typefully.session)
+
 
 class TestTypefullyClient:
     def test_disabled_client_skips_create(self):
@@ -20,33 +75,26 @@ class TestTypefullyClient:
         assert client.list_drafts() == []
 
     @patch("wiz.integrations.typefully.os.environ", {"TYPEFULLY_API_KEY": "test-key"})
-    def test_from_config_enabled(self):
-        config = SocialManagerConfig(typefully_social_set_id=12345)
-        client = TypefullyClient.from_config(config)
+    def test_from_config_enabled(self, base_social_config):
+        client = TypefullyClient.from_config(base_social_config)
         assert client.enabled is True
         assert client.api_key == "test-key"
         assert client.social_set_id == 12345
 
     @patch("wiz.integrations.typefully.os.environ", {})
-    def test_from_config_disabled_no_key(self):
-        config = SocialManagerConfig(typefully_social_set_id=12345)
-        client = TypefullyClient.from_config(config)
+    def test_from_config_disabled_no_key(self, base_social_config):
+        client = TypefullyClient.from_config(base_social_config)
         assert client.enabled is False
 
     @patch("wiz.integrations.typefully.os.environ", {"TYPEFULLY_API_KEY": "key"})
-    def test_from_config_disabled_no_social_set(self):
-        config = SocialManagerConfig(typefully_social_set_id=0)
+    def test_from_config_disabled_no_social_set(self, base_social_config):
+        config = base_social_config.model_copy(update={"typefully_social_set_id": 0})
         client = TypefullyClient.from_config(config)
         assert client.enabled is False
 
-    @patch("wiz.integrations.typefully.requests.post")
-    def test_create_draft_success(self, mock_post):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 201
-        mock_resp.json.return_value = {"id": 42, "status": "draft"}
-        mock_post.return_value = mock_resp
+    def test_create_draft_success(self, fake_typefully, client):
+        fake_typefully.enqueue(201, {"id": 42, "status": "draft"})
 
-        client = TypefullyClient(api_key="key", social_set_id=100)
         result = client.create_draft(
             posts=[{"text": "Hello world"}],
             platforms=["x"],
@@ -55,85 +103,62 @@ class TestTypefullyClient:
 
         assert result.success is True
         assert result.draft_id == 42
-        mock_post.assert_called_once()
-        call_kwargs = mock_post.call_args
-        body = call_kwargs[1]["json"]
+        assert len(fake_typefully.calls) == 1
+        request = fake_typefully.calls[0]
+        assert request.method == "POST"
+        assert request.url == "https://api.typefully.com/v2/social-sets/100/drafts"
+        assert request.headers["Authorization"] == "Bearer key"
+        body = fake_typefully.last_json()
         assert body["platforms"]["x"]["enabled"] is True
         assert body["platforms"]["x"]["posts"][0]["text"] == "Hello world"
         assert body["draft_title"] == "Test Draft"
 
-    @patch("wiz.integrations.typefully.requests.post")
-    def test_create_draft_multi_platform(self, mock_post):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"id": 99}
-        mock_post.return_value = mock_resp
+    def test_create_draft_multi_platform(self, fake_typefully, client):
+        fake_typefully.enqueue(200, {"id": 99})
 
-        client = TypefullyClient(api_key="key", social_set_id=100)
         result = client.create_draft(
             posts=[{"text": "General text", "linkedin_text": "LinkedIn text"}],
             platforms=["x", "linkedin"],
         )
 
         assert result.success is True
-        body = mock_post.call_args[1]["json"]
+        body = fake_typefully.last_json()
         assert body["platforms"]["x"]["posts"][0]["text"] == "General text"
         assert body["platforms"]["linkedin"]["posts"][0]["text"] == "LinkedIn text"
 
-    @patch("wiz.integrations.typefully.requests.post")
-    def test_create_draft_api_error(self, mock_post):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 400
-        mock_resp.text = "Bad request"
-        mock_post.return_value = mock_resp
+    def test_create_draft_api_error(self, fake_typefully, client):
+        fake_typefully.enqueue(400, text="Bad request")
 
-        client = TypefullyClient(api_key="key", social_set_id=100)
         result = client.create_draft([{"text": "hello"}])
         assert result.success is False
         assert "400" in result.error
+        assert "Bad request" in result.error
 
-    @patch("wiz.integrations.typefully.requests.post")
-    def test_create_draft_network_error(self, mock_post):
-        import requests as req
-        mock_post.side_effect = req.ConnectionError("timeout")
+    def test_create_draft_network_error(self, fake_typefully, client):
+        fake_typefully.enqueue_error(requests.ConnectionError("timeout"))
 
-        client = TypefullyClient(api_key="key", social_set_id=100)
         result = client.create_draft([{"text": "hello"}])
         assert result.success is False
         assert "failed" in result.error.lower()
 
-    @patch("wiz.integrations.typefully.requests.get")
-    def test_list_drafts_success(self, mock_get):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"items": [{"id": 1}, {"id": 2}]}
-        mock_get.return_value = mock_resp
+    def test_list_drafts_success(self, fake_typefully, client):
+        fake_typefully.enqueue(200, {"items": [{"id": 1}, {"id": 2}]})
 
-        client = TypefullyClient(api_key="key", social_set_id=100)
         drafts = client.list_drafts(status="draft", limit=5)
         assert len(drafts) == 2
-        mock_get.assert_called_once()
-        assert mock_get.call_args[1]["params"]["status"] == "draft"
+        assert len(fake_typefully.calls) == 1
+        assert fake_typefully.calls[0].method == "GET"
+        assert fake_typefully.calls[0].url.endswith("/drafts?limit=5&status=draft")
 
-    @patch("wiz.integrations.typefully.requests.get")
-    def test_list_drafts_returns_list_directly(self, mock_get):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = [{"id": 1}]
-        mock_get.return_value = mock_resp
+    def test_list_drafts_returns_list_directly(self, fake_typefully, client):
+        fake_typefully.enqueue(200, [{"id": 1}])
 
-        client = TypefullyClient(api_key="key", social_set_id=100)
         drafts = client.list_drafts()
         assert len(drafts) == 1
 
-    @patch("wiz.integrations.typefully.requests.get")
-    def test_list_drafts_api_error(self, mock_get):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 500
-        mock_resp.text = "Server error"
-        mock_get.return_value = mock_resp
+    def test_list_drafts_api_error(self, fake_typefully, client):
+        fake_typefully.enqueue(500, text="Server error")
 
-        client = TypefullyClient(api_key="key", social_set_id=100)
         assert client.list_drafts() == []
 
     def test_headers_include_api_key(self):
@@ -141,20 +166,15 @@ class TestTypefullyClient:
         headers = client._headers()
         assert headers["Authorization"] == "Bearer my-key"
 
-    @patch("wiz.integrations.typefully.requests.post")
-    def test_linkedin_merges_thread_into_single_post(self, mock_post):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 201
-        mock_resp.json.return_value = {"id": 55}
-        mock_post.return_value = mock_resp
+    def test_linkedin_merges_thread_into_single_post(self, fake_typefully, client):
+        fake_typefully.enqueue(201, {"id": 55})
 
-        client = TypefullyClient(api_key="key", social_set_id=100)
         client.create_draft(
             posts=[{"text": "Post 1"}, {"text": "Post 2"}, {"text": "Post 3"}],
             platforms=["x", "linkedin"],
         )
 
-        body = mock_post.call_args[1]["json"]
+        body = fake_typefully.last_json()
         # X should get all 3 posts as a thread
         assert len(body["platforms"]["x"]["posts"]) == 3
         # LinkedIn should merge into 1 post
@@ -167,6 +187,5 @@ class TestTypefullyClient:
         client = TypefullyClient(api_key="key", social_set_id=100, enabled=False)
         # Disabled client won't make a request, but we can verify the method signature
         # has no publish_at parameter
-        import inspect
-        sig = inspect.signature(client.create_draft)
-        assert "publish_at" not in sig.parameters
+        assert "publish_at" not in _CREATE_DRAFT_SIG.parameters
+        assert client.create_draft([{"text": "x"}]).error == "disabled"
@@ -2,8 +2,28 @@
 
 from pathlib import Path
 
+import pytest
+
 from wiz.memory.long_term import LongTermMemory
 
+pytestmark = pytest.mark.xdist_group("fs_memory")
+
+
+@pytest.fixture(scope="module")
+def sample_ltm(tmp_path_factory) -> LongTermMemory:
+    """A loaded memory over one prebuilt topics tree, for read-only tests."""
+    base = tmp_path_factory.mktemp("long-term")
+    topics = base / "topics"
+    topics.mkdir()
+    (base / "index.md").write_text(
+        "# Header\n\n# Comment\narchitecture: arch.md\nbridge-patterns: bridge.md\n\n"
+    )
+    (topics / "arch.md").write_text("Architecture notes")
+    (topics / "bridge.md").write_text("Bridge patterns info")
+    mem = LongTermMemory(base)
+    mem.load_index()
+    return mem
+
 
 class TestLongTermMemory:
     def test_index_parsing(self, tmp_path: Path):
@@ -17,32 +37,20 @@ class TestLongTermMemory:
         result = mem.load_index()
         assert result == {"architecture": "arch.md", "testing": "test.md"}
 
-    def test_keyword_matching_exact(self, tmp_path: Path):
-        base = tmp_path / "long-term"
-        topics = base / "topics"
-        topics.mkdir(parents=True)
-        (base / "index.md").write_text("bridge: bridge.md\n")
-        (topics / "bridge.md").write_text("Bridge patterns info")
-
-        mem = LongTermMemory(base)
-        mem.load_index()
-        results = mem.retrieve(["bridge"])
+    def test_keyword_matching_exact(self, sample_ltm: LongTermMemory):
+        results = sample_ltm.retrieve(["architecture"])
         assert len(results) == 1
-        assert results[0][0] == "bridge"
-        assert results[0][1] == "Bridge patterns info"
-
-    def test_keyword_matching_partial(self, tmp_path: Path):
-        base = tmp_path / "long-term"
-        topics = base / "topics"
-        topics.mkdir(parents=True)
-        (base / "index.md").write_text("bridge-patterns: bridge.md\n")
-        (topics / "bridge.md").write_text("content")
+        assert results[0][0] == "architecture"
+        assert results[0][1] == "Architecture notes"
 
-        mem = LongTermMemory(base)
-        mem.load_index()
+    def test_keyword_matching_partial(self, sample_ltm: LongTermMemory):
         # "bridge" is contained in "bridge-patterns"
-        results = mem.retrieve(["bridge"])
-        assert len(results) == 1
+        results = sample_ltm.retrieve(["bridge"])
+        assert results == [("bridge-patterns", "Bridge patterns info")]
+
+    def test_keyword_contained_in_query(self, sample_ltm: LongTermMemory):
+        results = sample_ltm.retrieve(["Bridge-Patterns-v2", "no-match"])
+        assert [k for k, _ in results] == ["bridge-patterns"]
 
     def test_topic_crud(self, tmp_path: Path):
         base = tmp_path / "long-term"
@@ -75,12 +83,6 @@ class TestLongTermMemory:
         result = mem.load_index()
         assert result == {}
 
-    def test_skip_comments_and_blanks(self, tmp_path: Path):
-        base = tmp_path / "long-term"
-        base.mkdir()
-        (base / "index.md").write_text(
-            "# Header\n\n# Comment\nkey: file.md\n\n"
-        )
-        mem = LongTermMemory(base)
-        result = mem.load_index()
-        assert result == {"key": "file.md"}
+    def test_skip_comments_and_blanks(self, sample_ltm: LongTermMemory):
+        result = sample_ltm.load_index()
+        assert result == {"architecture": "arch.md", "bridge-patterns": "bridge.md"}
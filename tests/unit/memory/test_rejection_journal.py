@@ -4,8 +4,12 @@ import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import pytest
+
 from wiz.memory.rejection_journal import RejectionJournal
 
+pytestmark = pytest.mark.xdist_group("fs_memory")
+
 
 class TestRejectionJournal:
     def test_record_creates_file(self, tmp_path: Path):
@@ -67,12 +71,32 @@ class TestRejectionJournal:
 
     def test_read_with_limit(self, tmp_path: Path):
         journal = RejectionJournal(tmp_path / "rejections")
-        for i in range(10):
-            journal.record("wiz", i, f"fix/{i}", f"feedback {i}")
+        journal.record_many(
+            {"repo": "wiz", "issue_number": i, "branch": f"fix/{i}", "feedback": f"feedback {i}"}
+            for i in range(10)
+        )
 
         entries = journal.read(limit=3)
         assert len(entries) == 3
 
+    def test_record_many_groups_by_repo(self, tmp_path: Path):
+        journal = RejectionJournal(tmp_path / "rejections")
+        written = journal.record_many([
+            {"repo": "wiz", "issue_number": 1, "branch": "fix/1", "feedback": "a"},
+            {"repo": "CIN", "issue_number": 2, "branch": "fix/2", "feedback": "b",
+             "agent": "feature-dev"},
+            {"repo": "wiz", "issue_number": 3, "branch": "fix/3", "feedback": "c"},
+        ])
+        assert written == 3
+        wiz = [json.loads(line) for line in (tmp_path / "rejections" / "wiz.jsonl").open()]
+        assert [e["issue"] for e in wiz] == [1, 3]
+        assert journal.read(repo="CIN")[0]["agent"] == "feature-dev"
+
+    def test_record_many_empty(self, tmp_path: Path):
+        journal = RejectionJournal(tmp_path / "rejections")
+        assert journal.record_many([]) == 0
+        assert not (tmp_path / "rejections").exists()
+
     def test_read_empty_journal(self, tmp_path: Path):
         journal = RejectionJournal(tmp_path / "rejections")
         entries = journal.read()
@@ -121,7 +145,12 @@ class TestRejectionJournal:
         assert journal.base_dir == Path("memory/rejections")
 
     def test_read_sorted_most_recent_first(self, tmp_path: Path):
-        journal = RejectionJournal(tmp_path / "rejections")
+        store: list[dict] = []
+        journal = RejectionJournal(
+            tmp_path / "rejections",
+            writer=store.append,
+            reader=lambda repo: [e for e in store if repo in (None, e["repo"])],
+        )
         # Record entries in order - they'll have increasing timestamps
         journal.record("wiz", 1, "fix/1", "first")
         journal.record("wiz", 2, "fix/2", "second")
@@ -131,3 +160,37 @@ class TestRejectionJournal:
         # Most recent should be first
         assert entries[0]["issue"] == 3
         assert entries[-1]["issue"] == 1
+        assert not (tmp_path / "rejections").exists()  # nothing touched disk
+
+
+class TestRejectionJournalSanitize:
+    CASES = [
+        ("wiz", "wiz"),
+        ("CIN-Interface", "CIN-Interface"),
+        ("my_repo.v2", "my_repo.v2"),
+        ("owner/repo", "owner__repo"),
+        ("../escape", "__escape"),
+        ("..", "_"),
+        ("", "_"),
+        ("a b:c", "a_b_c"),
+        (".hidden", "hidden"),
+        ("org/team/repo", "org__team__repo"),
+    ]
+
+    def test_sanitize_repo(self):
+        for repo, expected in self.CASES:
+            assert RejectionJournal._sanitize_repo(repo) == expected, repo
+
+    def test_sanitize_is_cached(self):
+        RejectionJournal._sanitize_repo.cache_clear()
+        RejectionJournal._sanitize_repo("owner/repo")
+        RejectionJournal._sanitize_repo("owner/repo")
+        assert RejectionJournal._sanitize_repo.cache_info().hits >= 1
+
+    def test_owner_repo_round_trip(self, tmp_path: Path):
+        journal = RejectionJournal(tmp_path / "rejections")
+        journal.record("test/repo", 7, "fix/7", "needs tests")
+
+        assert (tmp_path / "rejections" / "test__repo.jsonl").exists()
+        entries = journal.read(repo="test/repo")
+        assert [e["repo"] for e in entries] == ["test/repo"]
@@ -3,9 +3,15 @@
 import os
 import time
 from pathlib import Path
+from types import SimpleNamespace
 
+import pytest
+
+from wiz.memory import session_logger
 from wiz.memory.session_logger import SessionLogger
 
+pytestmark = pytest.mark.xdist_group("fs_memory")
+
 
 class TestSessionLogger:
     def test_log_naming_format(self, tmp_path: Path):
@@ -26,13 +32,30 @@ class TestSessionLogger:
         # Verify timestamp format
         assert "[20" in content
 
-    def test_end_session_returns_elapsed(self, tmp_path: Path):
+    def test_end_session_returns_elapsed(self, tmp_path: Path, monkeypatch):
+        clock = iter([1000.0, 1000.5])
+        monkeypatch.setattr(session_logger, "time", SimpleNamespace(monotonic=clock.__next__))
         logger = SessionLogger(tmp_path / "sessions")
         logger.start_session("test")
-        time.sleep(0.1)
         elapsed = logger.end_session("Done")
-        assert elapsed >= 0.1
+        assert elapsed == pytest.approx(0.5)
         assert logger._current_log is None
+        assert "Session ended (0.5s)" in next((tmp_path / "sessions").iterdir()).read_text()
+
+    def test_one_open_per_session(self, tmp_path: Path, monkeypatch):
+        opened = []
+        real_open = open
+        monkeypatch.setattr(
+            "builtins.open", lambda *a, **kw: opened.append(a[0]) or real_open(*a, **kw),
+        )
+        logger = SessionLogger(tmp_path / "sessions")
+        log_path = logger.start_session("test")
+        for i in range(5):
+            logger.log(f"line {i}")
+        assert "line 4" in log_path.read_text()  # flushed mid-session
+        logger.end_session()
+        assert opened.count(log_path) == 1
+        assert logger._fh is None
 
     def test_log_without_session_is_noop(self, tmp_path: Path):
         logger = SessionLogger(tmp_path / "sessions")
@@ -59,6 +82,20 @@ class TestSessionLogger:
         assert not old_log.exists()
         assert new_log.exists()
 
+    def test_cleanup_follows_clock(self, tmp_path: Path, monkeypatch):
+        log_dir = tmp_path / "sessions"
+        log_dir.mkdir()
+        (log_dir / "session_a.log").write_text("a")
+        (log_dir / "notes.log").write_text("not a session log")
+        now = time.time()
+        logger = SessionLogger(log_dir, retention_days=30)
+
+        monkeypatch.setattr(session_logger, "time", SimpleNamespace(time=lambda: now + 10 * 86400))
+        assert logger.cleanup_old() == 0
+        monkeypatch.setattr(session_logger, "time", SimpleNamespace(time=lambda: now + 45 * 86400))
+        assert logger.cleanup_old() == 1
+        assert [p.name for p in log_dir.iterdir()] == ["notes.log"]
+
     def test_cleanup_empty_dir(self, tmp_path: Path):
         logger = SessionLogger(tmp_path / "nonexistent")
         assert logger.cleanup_old() == 0
@@ -38,6 +38,12 @@ class TestShortTermMemory:
         assert "old1" not in mem.lines
         assert "new1" in mem.lines
 
+    def test_load_keeps_most_recent_lines(self, tmp_path: Path):
+        path = tmp_path / "short-term.md"
+        path.write_text("\n".join(f"Line {i}" for i in range(8)) + "\n")
+        mem = ShortTermMemory(path, max_lines=3)
+        assert mem.load() == ["Line 5", "Line 6", "Line 7"]
+
     def test_multiline_append(self, tmp_path: Path):
         path = tmp_path / "short-term.md"
         mem = ShortTermMemory(path, max_lines=50)
@@ -1,15 +1,25 @@
 """Tests for Telegram notifier."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import requests
 
-from wiz.config.schema import TelegramConfig
 from wiz.notifications.telegram import TelegramNotifier
 
+pytestmark = pytest.mark.xdist_group("http_mocks")
+
+
+def _resp(status, json_body=None, text=""):
+    """A bare HTTP response stand-in; attribute access is all the notifier needs."""
+    return SimpleNamespace(status_code=status, json=lambda: json_body, text=text)
+
 
 class TestTelegramNotifier:
     def test_send_message(self):
         with patch("wiz.notifications.telegram.requests.post") as mock_post:
-            mock_post.return_value = MagicMock(status_code=200)
+            mock_post.return_value = _resp(200)
             notifier = TelegramNotifier("token123", "chat456")
             assert notifier.send_message("Hello") is True
 
@@ -29,25 +39,24 @@ class TestTelegramNotifier:
             notifier.send_message("test")
             mock_post.assert_not_called()
 
-    def test_from_config_enabled(self):
-        config = TelegramConfig(enabled=True, bot_token="tok", chat_id="123")
-        notifier = TelegramNotifier.from_config(config)
+    def test_from_config_enabled(self, base_telegram_config):
+        notifier = TelegramNotifier.from_config(base_telegram_config)
         assert notifier.enabled is True
         assert notifier.bot_token == "tok"
 
-    def test_from_config_missing_keys_returns_disabled(self):
-        config = TelegramConfig(enabled=True, bot_token="", chat_id="")
+    def test_from_config_missing_keys_returns_disabled(self, base_telegram_config):
+        config = base_telegram_config.model_copy(update={"bot_token": "", "chat_id": ""})
         notifier = TelegramNotifier.from_config(config)
         assert notifier.enabled is False
 
-    def test_from_config_disabled(self):
-        config = TelegramConfig(enabled=False, bot_token="tok", chat_id="123")
+    def test_from_config_disabled(self, base_telegram_config):
+        config = base_telegram_config.model_copy(update={"enabled": False})
         notifier = TelegramNotifier.from_config(config)
         assert notifier.enabled is False
 
     def test_notify_escalation_format(self):
         with patch("wiz.notifications.telegram.requests.post") as mock_post:
-            mock_post.return_value = MagicMock(status_code=200)
+            mock_post.return_value = _resp(200)
             notifier = TelegramNotifier("tok", "123")
             notifier.notify_escalation("wiz", "#42", "3 strikes")
             text = mock_post.call_args[1]["json"]["text"]
@@ -55,10 +64,14 @@ class TestTelegramNotifier:
             assert "wiz" in text
             assert "#42" in text
 
-    def test_network_error_returns_false(self):
-        import requests as req
+    def test_http_error_returns_false(self):
+        with patch("wiz.notifications.telegram.requests.post") as mock_post:
+            mock_post.return_value = _resp(429, text="Too Many Requests")
+            notifier = TelegramNotifier("tok", "123")
+            assert notifier.send_message("test") is False
 
+    def test_network_error_returns_false(self):
         with patch("wiz.notifications.telegram.requests.post") as mock_post:
-            mock_post.side_effect = req.ConnectionError("fail")
+            mock_post.side_effect = requests.ConnectionError("fail")
             notifier = TelegramNotifier("tok", "123")
             assert notifier.send_message("test") is False
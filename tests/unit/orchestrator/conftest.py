@@ -0,0 +1,118 @@
+"""Shared fixtures for orchestrator tests."""
+
+from collections.abc import Callable
+from functools import cache
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from wiz.config.schema import WizConfig
+from wiz.coordination.worktree import WorktreeManager
+from wiz.notifications.telegram import TelegramNotifier
+from wiz.orchestrator import content_pipeline, pipeline, rejection_pipeline
+
+
+@cache
+def _spec(cls: type) -> list[str]:
+    """Attribute names of cls, computed once per class.
+
+    A name-list spec gives the same attribute checking as spec=cls without
+    introspecting the class again for every mock.
+    """
+    return dir(cls)
+
+
+@pytest.fixture(scope="session")
+def default_wiz_config() -> WizConfig:
+    """Built once per run; pipelines only read their config, never mutate it."""
+    return WizConfig()
+
+
+@pytest.fixture
+def make_wiz_config(default_wiz_config: WizConfig) -> Callable[..., WizConfig]:
+    """Return default_wiz_config.model_copy(update=...) for per-test variants.
+
+    model_copy skips validation, so pass model instances (RepoConfig,
+    DevCycleConfig, ...) rather than plain dicts.
+    """
+    def make(**update: Any) -> WizConfig:
+        return default_wiz_config.model_copy(update=update)
+    return make
+
+
+# Built once per process. No test asserts on the bridge, so the stubs can be
+# shared and the autouse fixture below only rebinds module attributes.
+_BRIDGE_STUBS = {
+    name: MagicMock(name=name)
+    for name in ("BridgeClient", "BridgeEventMonitor", "SessionRunner")
+}
+
+
+@pytest.fixture(autouse=True)
+def _bridge_stubs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Never construct a real bridge client, monitor or session runner."""
+    for module in (pipeline, content_pipeline, rejection_pipeline):
+        for name, stub in _BRIDGE_STUBS.items():
+            monkeypatch.setattr(module, name, stub)
+
+
+def _mock_attrs(monkeypatch: pytest.MonkeyPatch, module, names: tuple[str, ...]):
+    mocks = {name: MagicMock(spec=_spec(getattr(module, name))) for name in names}
+    for name, mock in mocks.items():
+        monkeypatch.setattr(module, name, mock)
+    return SimpleNamespace(**mocks)
+
+
+@pytest.fixture
+def content_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the content pipeline's agents and clients with mocks."""
+    return _mock_attrs(monkeypatch, content_pipeline, (
+        "GoogleDocsClient", "TypefullyClient", "SocialManagerAgent", "BlogWriterAgent",
+    ))
+
+
+@pytest.fixture
+def dev_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the dev pipeline's agents, worktree manager, lock and trackers with mocks.
+
+    The strike/loop trackers would otherwise open a SQLite strike database
+    under the config's repo path, outside tmp_path.
+    """
+    return _mock_attrs(monkeypatch, pipeline, (
+        "BugHunterAgent", "BugFixerAgent", "ReviewerAgent", "DistributedLockManager",
+        "WorktreeManager", "StrikeTracker", "LoopTracker",
+    ))
+
+
+@pytest.fixture
+def mock_wt() -> MagicMock:
+    """A WorktreeManager stand-in (spec_set) whose cleanups remove nothing."""
+    wt = MagicMock(spec_set=_spec(WorktreeManager))
+    wt.cleanup_stale.return_value = 0
+    wt.cleanup_merged.return_value = 0
+    return wt
+
+
+def _stub_agent(result: Any = None) -> SimpleNamespace:
+    if isinstance(result, BaseException):
+        return SimpleNamespace(run=Mock(side_effect=result))
+    return SimpleNamespace(run=Mock(return_value=result))
+
+
+@pytest.fixture
+def stub_agent() -> Callable[[Any], SimpleNamespace]:
+    """Return a factory for agent instances whose run() returns the given result.
+
+    An exception instance is raised from run() instead. Only run is a mock
+    (a plain Mock: the pipelines use no magic methods on agents); the
+    instance itself is a SimpleNamespace.
+    """
+    return _stub_agent
+
+
+@pytest.fixture
+def notifier() -> MagicMock:
+    """A fresh TelegramNotifier stand-in limited to the notifier's attributes."""
+    return MagicMock(spec=_spec(TelegramNotifier))
@@ -1,17 +1,28 @@
 """Tests for escalation manager."""
 
 from pathlib import Path
-from unittest.mock import MagicMock
+
+import pytest
 
 from wiz.coordination.strikes import StrikeTracker
-from wiz.notifications.telegram import TelegramNotifier
 from wiz.orchestrator.escalation import EscalationManager
 
 
+@pytest.fixture(scope="session")
+def strike_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("strikes")
+
+
+@pytest.fixture
+def strikes(strike_dir: Path, request: pytest.FixtureRequest):
+    """A tracker with its own database file in the shared strike directory."""
+    tracker = StrikeTracker(strike_dir / f"{request.node.name}.json")
+    yield tracker
+    tracker.close()
+
+
 class TestEscalationManager:
-    def test_escalation_trigger(self, tmp_path: Path):
-        strikes = StrikeTracker(tmp_path / "strikes.json")
-        notifier = MagicMock(spec=TelegramNotifier)
+    def test_escalation_trigger(self, strikes, notifier):
         mgr = EscalationManager(strikes, notifier, max_issue_strikes=2)
 
         strikes.record_issue_strike(1, "a")
@@ -20,18 +31,14 @@ class TestEscalationManager:
         assert mgr.check_and_escalate(1, "test/repo") is True
         notifier.notify_escalation.assert_called_once()
 
-    def test_no_escalation_below_threshold(self, tmp_path: Path):
-        strikes = StrikeTracker(tmp_path / "strikes.json")
-        notifier = MagicMock(spec=TelegramNotifier)
+    def test_no_escalation_below_threshold(self, strikes, notifier):
         mgr = EscalationManager(strikes, notifier, max_issue_strikes=3)
 
         strikes.record_issue_strike(1, "a")
         assert mgr.check_and_escalate(1, "test/repo") is False
         notifier.notify_escalation.assert_not_called()
 
-    def test_file_pattern_detection(self, tmp_path: Path):
-        strikes = StrikeTracker(tmp_path / "strikes.json")
-        notifier = MagicMock(spec=TelegramNotifier)
+    def test_file_pattern_detection(self, strikes, notifier):
         mgr = EscalationManager(strikes, notifier, max_file_strikes=2)
 
         strikes.record_file_failure("src/bad.py", 1)
@@ -41,9 +48,7 @@ class TestEscalationManager:
         assert "src/bad.py" in flagged
         notifier.send_message.assert_called_once()
 
-    def test_no_flagged_files(self, tmp_path: Path):
-        strikes = StrikeTracker(tmp_path / "strikes.json")
-        notifier = MagicMock(spec=TelegramNotifier)
+    def test_no_flagged_files(self, strikes, notifier):
         mgr = EscalationManager(strikes, notifier)
 
         flagged = mgr.check_file_pattern("test/repo")
@@ -1,158 +1,163 @@
 """Tests for dev cycle pipeline."""
 
+from functools import cache
 from unittest import mock
-from unittest.mock import MagicMock, patch
-
-from wiz.config.schema import DevCycleConfig, GlobalConfig, RepoConfig, WizConfig
-from wiz.notifications.telegram import TelegramNotifier
+from unittest.mock import MagicMock
+
+import pytest
+
+from wiz.config.schema import (
+    DevCycleConfig,
+    GlobalConfig,
+    RepoConfig,
+    WizConfig,
+    WorktreeConfig,
+)
+from wiz.orchestrator import pipeline as pipeline_module
 from wiz.orchestrator.pipeline import DevCyclePipeline
 
+_DEFAULT_REPOS = (
+    (("name", "test"), ("path", "/tmp/test"), ("github", "u/t"), ("enabled", True)),
+)
+_DEFAULT_PHASES = ("bug_hunt", "bug_fix", "review")
+
+
+@cache
+def _build_config(repos_key: tuple, timeout: int, phases_key: tuple) -> WizConfig:
+    """Validate each distinct (repos, timeout, phases) config once per run.
+
+    Shared between tests, which is safe because the pipeline never mutates it.
+    """
+    return WizConfig(
+        repos=[dict(items) for items in repos_key],
+        dev_cycle=DevCycleConfig(cycle_timeout=timeout, phases=list(phases_key)),
+    )
+
 
 class TestDevCyclePipeline:
-    def _make_pipeline(self, repos=None, timeout=3600, phases=None):
-        config = WizConfig(
-            repos=repos or [
-                {"name": "test", "path": "/tmp/test", "github": "u/t", "enabled": True}
-            ],
-            dev_cycle=DevCycleConfig(
-                cycle_timeout=timeout,
-                phases=phases or ["bug_hunt", "bug_fix", "review"],
-            ),
-        )
-        notifier = MagicMock(spec=TelegramNotifier)
+    def _make_pipeline(self, notifier, repos=None, timeout=3600, phases=None):
+        repos_key = tuple(tuple(r.items()) for r in repos) if repos else _DEFAULT_REPOS
+        config = _build_config(repos_key, timeout, tuple(phases or _DEFAULT_PHASES))
         return DevCyclePipeline(config, notifier), config
 
-    @patch("wiz.orchestrator.pipeline.BugHunterAgent")
-    @patch("wiz.orchestrator.pipeline.SessionRunner")
-    @patch("wiz.orchestrator.pipeline.BridgeClient")
-    @patch("wiz.orchestrator.pipeline.BridgeEventMonitor")
-    def test_phase_ordering(self, mock_monitor, mock_client, mock_runner, mock_hunter):
-        pipeline, config = self._make_pipeline()
-        mock_hunter_inst = MagicMock()
-        mock_hunter_inst.run.return_value = {"bugs_found": 0}
-        mock_hunter.return_value = mock_hunter_inst
-
-        with patch("wiz.orchestrator.pipeline.BugFixerAgent") as mock_fixer, \
-             patch("wiz.orchestrator.pipeline.ReviewerAgent") as mock_reviewer:
-            mock_fixer.return_value = MagicMock(run=MagicMock(return_value={"issues_processed": 0}))
-            mock_reviewer.return_value = MagicMock(run=MagicMock(return_value={"reviews": 0}))
+    def test_phase_ordering(self, dev_mocks, notifier, stub_agent):
+        pipeline, config = self._make_pipeline(notifier)
+        dev_mocks.BugHunterAgent.return_value = stub_agent({"bugs_found": 0})
+        dev_mocks.BugFixerAgent.return_value = stub_agent({"issues_processed": 0})
+        dev_mocks.ReviewerAgent.return_value = stub_agent({"reviews": 0})
 
-            state = pipeline.run_repo(config.repos[0])
+        state = pipeline.run_repo(config.repos[0])
 
         assert len(state.phases) == 3
         assert state.phases[0].phase == "bug_hunt"
         assert state.phases[1].phase == "bug_fix"
         assert state.phases[2].phase == "review"
 
-    @patch("wiz.orchestrator.pipeline.BugHunterAgent")
-    @patch("wiz.orchestrator.pipeline.SessionRunner")
-    @patch("wiz.orchestrator.pipeline.BridgeClient")
-    @patch("wiz.orchestrator.pipeline.BridgeEventMonitor")
-    def test_timeout_enforcement(self, mock_monitor, mock_client, mock_runner, mock_hunter):
-        pipeline, config = self._make_pipeline(timeout=0)  # Immediate timeout
+    def test_timeout_enforcement(self, dev_mocks, notifier):
+        pipeline, config = self._make_pipeline(notifier, timeout=0)  # Immediate timeout
         state = pipeline.run_repo(config.repos[0])
         assert state.timed_out is True
         assert len(state.phases) == 0
 
-    def test_disabled_repo_skipped(self):
-        pipeline, config = self._make_pipeline(repos=[
+    def test_trackers_closed_when_cleanup_raises(self, dev_mocks, notifier, monkeypatch):
+        pipeline, config = self._make_pipeline(notifier, timeout=0)
+        trackers = MagicMock()
+        monkeypatch.setattr(pipeline_module, "StrikeTracker", trackers.StrikeTracker)
+        monkeypatch.setattr(pipeline_module, "LoopTracker", trackers.LoopTracker)
+        monkeypatch.setattr(
+            pipeline, "_cleanup_worktrees", MagicMock(side_effect=RuntimeError("boom")),
+        )
+
+        with pytest.raises(RuntimeError):
+            pipeline.run_repo(config.repos[0])
+
+        closes = [c for c in trackers.mock_calls if c[0].endswith(".close")]
+        assert closes == [mock.call.LoopTracker().close(), mock.call.StrikeTracker().close()]
+
+    def test_disabled_repo_skipped(self, notifier, monkeypatch):
+        pipeline, config = self._make_pipeline(notifier, repos=[
             {"name": "a", "path": "/tmp/a", "github": "u/a", "enabled": False},
         ])
+        mock_run = MagicMock()
+        monkeypatch.setattr(pipeline, "run_repo", mock_run)
 
-        with patch.object(pipeline, "run_repo") as mock_run:
-            results = pipeline.run_all()
+        results = pipeline.run_all()
 
         assert len(results) == 0
         mock_run.assert_not_called()
 
-    @patch("wiz.orchestrator.pipeline.BugHunterAgent")
-    @patch("wiz.orchestrator.pipeline.SessionRunner")
-    @patch("wiz.orchestrator.pipeline.BridgeClient")
-    @patch("wiz.orchestrator.pipeline.BridgeEventMonitor")
-    def test_phase_exception_handled(self, mock_monitor, mock_client, mock_runner, mock_hunter):
-        pipeline, config = self._make_pipeline(phases=["bug_hunt"])
-        mock_hunter.return_value = MagicMock()
-        mock_hunter.return_value.run.side_effect = RuntimeError("bridge exploded")
+    def test_phase_exception_handled(self, dev_mocks, notifier, stub_agent):
+        pipeline, config = self._make_pipeline(notifier, phases=["bug_hunt"])
+        dev_mocks.BugHunterAgent.return_value = stub_agent(RuntimeError("bridge exploded"))
 
         state = pipeline.run_repo(config.repos[0])
         assert len(state.phases) == 1
         assert state.phases[0].success is False
         assert "bridge exploded" in state.phases[0].data["error"]
 
-    @patch("wiz.orchestrator.pipeline.DistributedLockManager")
-    @patch("wiz.orchestrator.pipeline.BugFixerAgent")
-    @patch("wiz.orchestrator.pipeline.SessionRunner")
-    @patch("wiz.orchestrator.pipeline.BridgeClient")
-    @patch("wiz.orchestrator.pipeline.BridgeEventMonitor")
     def test_distributed_lock_created_when_machine_id_set(
-        self, mock_monitor, mock_client, mock_runner, mock_fixer, mock_dlock
+        self, dev_mocks, notifier, make_wiz_config, stub_agent,
     ):
-        config = WizConfig(
-            **{"global": GlobalConfig(machine_id="mac-1")},
-            repos=[{"name": "t", "path": "/tmp/t", "github": "u/t", "enabled": True}],
+        config = make_wiz_config(
+            global_=GlobalConfig(machine_id="mac-1"),
+            repos=[RepoConfig(name="t", path="/tmp/t", github="u/t", enabled=True)],
             dev_cycle=DevCycleConfig(phases=["bug_fix"]),
         )
-        notifier = MagicMock(spec=TelegramNotifier)
         pipeline = DevCyclePipeline(config, notifier)
 
-        mock_dlock_inst = MagicMock()
+        mock_dlock = dev_mocks.DistributedLockManager
+        mock_dlock_inst = mock_dlock.return_value
         mock_dlock_inst.cleanup_stale.return_value = 0
-        mock_dlock.return_value = mock_dlock_inst
-        mock_fixer.return_value = MagicMock(run=MagicMock(return_value={"issues_processed": 0}))
+        dev_mocks.BugFixerAgent.return_value = stub_agent({"issues_processed": 0})
 
         pipeline.run_repo(config.repos[0])
         mock_dlock.assert_called_once_with(mock.ANY, "mac-1")
         mock_dlock_inst.cleanup_stale.assert_called_once()
 
-    @patch("wiz.orchestrator.pipeline.BugFixerAgent")
-    @patch("wiz.orchestrator.pipeline.SessionRunner")
-    @patch("wiz.orchestrator.pipeline.BridgeClient")
-    @patch("wiz.orchestrator.pipeline.BridgeEventMonitor")
-    def test_distributed_lock_not_created_when_no_machine_id(
-        self, mock_monitor, mock_client, mock_runner, mock_fixer
-    ):
-        pipeline, config = self._make_pipeline(phases=["bug_fix"])
-        mock_fixer.return_value = MagicMock(run=MagicMock(return_value={"issues_processed": 0}))
+    def test_distributed_lock_not_created_when_no_machine_id(self, dev_mocks, notifier, stub_agent):
+        pipeline, config = self._make_pipeline(notifier, phases=["bug_fix"])
+        dev_mocks.BugFixerAgent.return_value = stub_agent({"issues_processed": 0})
 
-        with patch("wiz.orchestrator.pipeline.DistributedLockManager") as mock_dlock:
-            pipeline.run_repo(config.repos[0])
-            mock_dlock.assert_not_called()
+        pipeline.run_repo(config.repos[0])
+        dev_mocks.DistributedLockManager.assert_not_called()
 
-    @patch("wiz.orchestrator.pipeline.ReviewerAgent")
-    @patch("wiz.orchestrator.pipeline.SessionRunner")
-    @patch("wiz.orchestrator.pipeline.BridgeClient")
-    @patch("wiz.orchestrator.pipeline.BridgeEventMonitor")
+    @pytest.mark.parametrize("repo_kwargs, expected", [
+        ({"self_improve": True}, True),
+        ({}, False),
+    ], ids=["self_improve", "default"])
     def test_self_improve_passed_to_reviewer(
-        self, mock_monitor, mock_client, mock_runner, mock_reviewer
+        self, dev_mocks, notifier, make_wiz_config, stub_agent, repo_kwargs, expected,
     ):
         """Regression test for #35: repo.self_improve must be forwarded to ReviewerAgent."""
-        config = WizConfig(
-            repos=[RepoConfig(
-                name="demo", path="/tmp/demo", github="owner/repo", self_improve=True,
-            )],
+        config = make_wiz_config(
+            repos=[RepoConfig(name="demo", path="/tmp/demo", github="owner/repo", **repo_kwargs)],
             dev_cycle=DevCycleConfig(phases=["review"]),
         )
-        notifier = MagicMock(spec=TelegramNotifier)
         pipeline = DevCyclePipeline(config, notifier)
-        mock_reviewer.return_value = MagicMock(run=MagicMock(return_value={"reviews": 0}))
+        dev_mocks.ReviewerAgent.return_value = stub_agent({"reviews": 0})
 
         pipeline.run_repo(config.repos[0])
 
-        _, kwargs = mock_reviewer.call_args
-        assert kwargs.get("self_improve") is True
+        _, kwargs = dev_mocks.ReviewerAgent.call_args
+        assert kwargs.get("self_improve") is expected
 
-    @patch("wiz.orchestrator.pipeline.ReviewerAgent")
-    @patch("wiz.orchestrator.pipeline.SessionRunner")
-    @patch("wiz.orchestrator.pipeline.BridgeClient")
-    @patch("wiz.orchestrator.pipeline.BridgeEventMonitor")
-    def test_self_improve_false_by_default(
-        self, mock_monitor, mock_client, mock_runner, mock_reviewer
+    @pytest.mark.parametrize("auto_cleanup_merged, expect_merged_call", [
+        (True, True),
+        (False, False),
+    ])
+    def test_worktree_cleanup(
+        self, dev_mocks, notifier, mock_wt, make_wiz_config,
+        auto_cleanup_merged, expect_merged_call,
     ):
-        """Ensure self_improve=False is passed when repo doesn't set it."""
-        pipeline, config = self._make_pipeline(phases=["review"])
-        mock_reviewer.return_value = MagicMock(run=MagicMock(return_value={"reviews": 0}))
+        config = make_wiz_config(
+            repos=[RepoConfig(name="t", path="/tmp/t", github="u/t")],
+            dev_cycle=DevCycleConfig(phases=["bug_hunt"]),
+            worktrees=WorktreeConfig(auto_cleanup_merged=auto_cleanup_merged),
+        )
+        pipeline = DevCyclePipeline(config, notifier)
+        dev_mocks.WorktreeManager.return_value = mock_wt
 
         pipeline.run_repo(config.repos[0])
 
-        _, kwargs = mock_reviewer.call_args
-        assert kwargs.get("self_improve") is False
+        mock_wt.cleanup_stale.assert_called_once_with(stale_days=config.worktrees.stale_days)
+        assert mock_wt.cleanup_merged.called is expect_merged_call
@@ -1,16 +1,12 @@
 """Tests for status reporter."""
 
-from unittest.mock import MagicMock
-
 from wiz.memory.session_logger import SessionLogger
-from wiz.notifications.telegram import TelegramNotifier
 from wiz.orchestrator.reporter import StatusReporter
 from wiz.orchestrator.state import CycleState
 
 
 class TestStatusReporter:
-    def test_summary_formatting(self):
-        notifier = MagicMock(spec=TelegramNotifier)
+    def test_summary_formatting(self, notifier):
         reporter = StatusReporter(notifier)
 
         state = CycleState(repo="test/repo")
@@ -25,8 +21,7 @@ class TestStatusReporter:
         assert "2 fixed" in summary
         notifier.notify_cycle_complete.assert_called_once()
 
-    def test_multiple_repos(self):
-        notifier = MagicMock(spec=TelegramNotifier)
+    def test_multiple_repos(self, notifier):
         reporter = StatusReporter(notifier)
 
         state1 = CycleState(repo="repo1")
@@ -39,8 +34,7 @@ class TestStatusReporter:
         assert "repo2" in summary
         assert "3 bugs found" in summary
 
-    def test_with_session_logger(self, tmp_path):
-        notifier = MagicMock(spec=TelegramNotifier)
+    def test_with_session_logger(self, tmp_path, notifier):
         logger = SessionLogger(tmp_path / "sessions")
         logger.start_session("test")
         reporter = StatusReporter(notifier, logger)
@@ -1,38 +1,34 @@
 """Tests for self-improvement guard."""
 
-from wiz.orchestrator.self_improve import SelfImprovementGuard
+import fnmatch
+
+import pytest
+
+from wiz.orchestrator.self_improve import PROTECTED_PATTERNS, SelfImprovementGuard
+
+
+@pytest.fixture(scope="module")
+def guard() -> SelfImprovementGuard:
+    """Default-pattern guard; it holds no per-call state, so tests share it."""
+    return SelfImprovementGuard()
 
 
 class TestSelfImprovementGuard:
-    def test_config_yaml_protected(self):
-        guard = SelfImprovementGuard()
-        assert guard.is_protected("config/wiz.yaml") is True
-
-    def test_claude_md_protected(self):
-        guard = SelfImprovementGuard()
-        assert guard.is_protected("CLAUDE.md") is True
-
-    def test_agent_claude_md_protected(self):
-        guard = SelfImprovementGuard()
-        assert guard.is_protected("agents/bug-hunter/CLAUDE.md") is True
-        assert guard.is_protected("agents/reviewer/CLAUDE.md") is True
-
-    def test_escalation_protected(self):
-        guard = SelfImprovementGuard()
-        assert guard.is_protected("src/wiz/orchestrator/escalation.py") is True
-
-    def test_schema_protected(self):
-        guard = SelfImprovementGuard()
-        assert guard.is_protected("src/wiz/config/schema.py") is True
-
-    def test_regular_file_not_protected(self):
-        guard = SelfImprovementGuard()
-        assert guard.is_protected("src/wiz/agents/bug_hunter.py") is False
-        assert guard.is_protected("tests/test_import.py") is False
-        assert guard.is_protected("README.md") is False
-
-    def test_validate_mixed_changes(self):
-        guard = SelfImprovementGuard()
+    @pytest.mark.parametrize("path, expected", [
+        ("config/wiz.yaml", True),
+        ("CLAUDE.md", True),
+        ("agents/bug-hunter/CLAUDE.md", True),
+        ("agents/reviewer/CLAUDE.md", True),
+        ("src/wiz/orchestrator/escalation.py", True),
+        ("src/wiz/config/schema.py", True),
+        ("src/wiz/agents/bug_hunter.py", False),
+        ("tests/test_import.py", False),
+        ("README.md", False),
+    ])
+    def test_protection(self, guard: SelfImprovementGuard, path: str, expected: bool):
+        assert guard.is_protected(path) is expected
+
+    def test_validate_mixed_changes(self, guard: SelfImprovementGuard):
         result = guard.validate_changes([
             "src/wiz/agents/bug_hunter.py",
             "config/wiz.yaml",
@@ -42,8 +38,7 @@ class TestSelfImprovementGuard:
         assert "config/wiz.yaml" in result["protected_files"]
         assert len(result["non_protected_files"]) == 2
 
-    def test_validate_no_protected(self):
-        guard = SelfImprovementGuard()
+    def test_validate_no_protected(self, guard: SelfImprovementGuard):
         result = guard.validate_changes([
             "src/wiz/agents/bug_hunter.py",
             "tests/test_new.py",
@@ -56,3 +51,23 @@ class TestSelfImprovementGuard:
         assert guard.is_protected("my.secret") is True
         assert guard.is_protected("internal/config.py") is True
         assert guard.is_protected("public/readme.md") is False
+
+    @pytest.mark.parametrize("path", [
+        "config/wiz.yaml",
+        "config/wiz.yaml.bak",
+        "agents/x/CLAUDE.md",
+        "agents/a/b/CLAUDE.md",
+        "agents/CLAUDE.md",
+        "src/wiz/config/schema.py",
+        "src/wiz/config/schema_py",
+        "my.secret",
+        "internal/config.py",
+        "data/a1.csv",
+        "data/c1.csv",
+        "",
+    ])
+    def test_matches_fnmatch(self, path: str):
+        patterns = ["*.secret", "internal/*", "data/[ab]?.csv", *PROTECTED_PATTERNS]
+        guard = SelfImprovementGuard(patterns=patterns)
+        expected = any(fnmatch.fnmatch(path, p) for p in patterns)
+        assert guard.is_protected(path) is expected
@@ -3,58 +3,65 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import click
+import pytest
 from click.testing import CliRunner
 
-from wiz.cli import _resolve_wiz_dir, main
+from wiz.cli import _find_wiz_dir, _resolve_wiz_dir, main
+
+
+@pytest.fixture(scope="class")
+def runner() -> CliRunner:
+    """CliRunner keeps no state between invoke() calls, so a class can share one."""
+    return CliRunner()
+
+
+def _help(*names: str) -> str:
+    """Render --help for main or a subcommand path without invoking the CLI."""
+    cmd = main
+    with click.Context(main, info_name="wiz") as ctx:
+        for name in names:
+            cmd = cmd.commands[name]
+            ctx = click.Context(cmd, info_name=name, parent=ctx)
+        return cmd.get_help(ctx)
 
 
 class TestCLI:
     def test_help(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
-        assert result.exit_code == 0
-        assert "Wiz" in result.output
+        assert "Wiz" in _help()
 
-    def test_version(self):
-        runner = CliRunner()
+    def test_version(self, runner: CliRunner):
         result = runner.invoke(main, ["--version"])
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
-    def test_status(self):
-        runner = CliRunner()
+    def test_status(self, runner: CliRunner):
         result = runner.invoke(main, ["status"])
         assert result.exit_code == 0
         assert "Wiz v0.1.0" in result.output
 
     def test_run_group(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["run", "--help"])
-        assert result.exit_code == 0
-        assert "dev-cycle" in result.output
-        assert "content-cycle" in result.output
-        assert "feature-cycle" in result.output
+        help_text = _help("run")
+        assert "dev-cycle" in help_text
+        assert "content-cycle" in help_text
+        assert "feature-cycle" in help_text
 
     def test_schedule_group(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["schedule", "--help"])
-        assert result.exit_code == 0
-        assert "install" in result.output
-        assert "uninstall" in result.output
-        assert "status" in result.output
+        help_text = _help("schedule")
+        assert "install" in help_text
+        assert "uninstall" in help_text
+        assert "status" in help_text
 
-    def test_schedule_status(self):
-        runner = CliRunner()
+    def test_schedule_status(self, runner: CliRunner):
         result = runner.invoke(main, ["schedule", "status"])
         assert result.exit_code == 0
 
     @patch("wiz.orchestrator.content_pipeline.ContentCyclePipeline")
     @patch("wiz.config.loader.load_config")
-    def test_content_cycle_runs(self, mock_load, mock_pipeline_cls):
+    def test_content_cycle_runs(self, mock_load, mock_pipeline_cls, runner: CliRunner):
         mock_state = MagicMock()
         mock_state.summary.return_value = "content cycle complete"
         mock_pipeline_cls.return_value.run.return_value = mock_state
-        runner = CliRunner()
         result = runner.invoke(main, ["run", "content-cycle"])
         assert result.exit_code == 0
         assert "content" in result.output
@@ -67,6 +74,12 @@ class TestResolveWizDir:
     for custom config paths not at <repo>/config/wiz.yaml.
     """
 
+    @pytest.fixture(autouse=True)
+    def _clear_wiz_dir_cache(self):
+        _find_wiz_dir.cache_clear()
+        yield
+        _find_wiz_dir.cache_clear()
+
     def test_finds_repo_root_via_wake_script(self, tmp_path):
         """_resolve_wiz_dir walks up to find scripts/wake.sh."""
         repo = tmp_path / "myrepo"
@@ -113,7 +126,9 @@ class TestResolveWizDir:
         assert _resolve_wiz_dir(config_path) == repo
 
     @patch("wiz.orchestrator.scheduler.LaunchdScheduler")
-    def test_schedule_status_uses_resolve_wiz_dir(self, mock_sched_cls, tmp_path):
+    def test_schedule_status_uses_resolve_wiz_dir(
+        self, mock_sched_cls, tmp_path, runner: CliRunner,
+    ):
         """schedule status with a custom config uses _resolve_wiz_dir."""
         repo = tmp_path / "repo"
         repo.mkdir()
@@ -122,7 +137,6 @@ class TestResolveWizDir:
 
         mock_sched_cls.return_value.status.return_value = []
 
-        runner = CliRunner()
         with patch("wiz.config.loader.load_config") as mock_load:
             mock_cfg = MagicMock()
             mock_load.return_value = mock_cfg
@@ -135,3 +149,13 @@ class TestResolveWizDir:
         actual_wiz_dir = mock_sched_cls.call_args[0][0]
         assert actual_wiz_dir == repo
         assert actual_wiz_dir != tmp_path
+
+    def test_result_cached_per_config_dir(self, tmp_path):
+        repo = tmp_path / "repo"
+        (repo / "scripts").mkdir(parents=True)
+        (repo / "scripts" / "wake.sh").touch()
+
+        assert _resolve_wiz_dir(repo / "a.yaml") == repo
+        assert _resolve_wiz_dir(repo / "b.yaml") == repo
+        info = _find_wiz_dir.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
@@ -3,6 +3,8 @@
 import json
 import logging
 
+import pytest
+
 from wiz.logging_config import JsonFormatter, setup_logging
 
 
@@ -44,14 +46,40 @@ class TestJsonFormatter:
         assert "exception" in data
         assert "ValueError" in data["exception"]
 
+    def test_exception_text_formatted_once(self, monkeypatch):
+        formatter = JsonFormatter()
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            import sys
+            record = logging.LogRecord(
+                "wiz.test", logging.ERROR, "test.py", 1, "failed", (), sys.exc_info(),
+            )
+        calls = []
+        real = formatter.formatException
+        monkeypatch.setattr(formatter, "formatException", lambda ei: calls.append(ei) or real(ei))
+
+        first = formatter.format(record)
+        assert formatter.format(record) == first
+        assert len(calls) == 1
+        assert record.exc_text in json.loads(first)["exception"]
+
 
 class TestSetupLogging:
+    @pytest.fixture(autouse=True)
+    def _reset_wiz_logger(self):
+        """Start and end each test with no handlers on the wiz logger."""
+        logger = logging.getLogger("wiz")
+        level = logger.level
+        logger.handlers.clear()
+        yield
+        logger.handlers.clear()
+        logger.setLevel(level)
+
     def test_setup_default(self):
         setup_logging(level="DEBUG")
         logger = logging.getLogger("wiz")
         assert logger.level == logging.DEBUG
-        # Cleanup
-        logger.handlers.clear()
 
     def test_setup_json(self):
         setup_logging(level="INFO", json_output=True)
@@ -60,15 +88,10 @@ class TestSetupLogging:
             isinstance(h.formatter, JsonFormatter)
             for h in logger.handlers
         )
-        # Cleanup
-        logger.handlers.clear()
 
     def test_no_duplicate_handlers(self):
         logger = logging.getLogger("wiz")
-        logger.handlers.clear()
         setup_logging(level="INFO")
         setup_logging(level="INFO")
         setup_logging(level="INFO")
         assert len(logger.handlers) == 1
-        # Cleanup
-        logger.handlers.clear()